@@ -6,6 +6,7 @@ Giriş noktası (.pyw): DPI/Font/AppID ayarları, asset yolları ve uygulamayı
 import os
 import sys
 import ctypes
+import multiprocessing
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import messagebox
@@ -51,6 +52,8 @@ def resource_path(*parts):
     return os.path.join(base, *parts)
 
 if __name__ == "__main__":
+    # PyInstaller ile paketlenmiş exe'de çok süreçli yoklamanın alt süreçleri için
+    multiprocessing.freeze_support()
     setup_dpi_awareness()
     setup_app_user_model_id("com.example.urlboyuthesaplayici")
 
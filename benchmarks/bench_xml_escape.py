@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+XLSX satır üretimi mikro-ölçümü: eski karakter-karakter xml_sanitize + xml_escape yolu ile
+writer.xml_text / _row_xml hızlı yolunu gerçekçi bir URL kümesinde karşılaştırır.
+    python benchmarks/bench_xml_escape.py [satır_sayısı]
+Çıktılar bayt bayt aynı olmalıdır; değilse betik hata verir.
+"""
+
+import os
+import random
+import sys
+import time
+from xml.sax.saxutils import escape as xml_escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.writer import _row_xml, excel_quote, xml_text, url_extension, url_filename_no_ext  # noqa: E402
+
+HOSTS = ["example.com", "cdn.ornek.com.tr", "media.site.org", "files.uploads.net"]
+WORDS = ["resim", "fotoğraf", "belge", "rapor", "görsel", "şema", "ürün", "kapak", "IMG", "scan"]
+EXTS = ["jpg", "png", "pdf", "zip", "mp4", "webp", "docx", "gif"]
+STATUSES = ["OK"] * 8 + ["404", "403", "ERR", "500", "301"]
+
+
+def corpus(n: int, seed: int = 1):
+    """(url, fname, fname_len, ext, size_mb, status) satırları: %-kodlu yollar, Türkçe adlar, sorgu dizeleri."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n):
+        name = "-".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 3))) + f"_{i}"
+        ext = rnd.choice(EXTS)
+        path = f"/wp-content/uploads/{rnd.randint(2015, 2025)}/{rnd.randint(1, 12):02d}/{name}.{ext}"
+        if rnd.random() < 0.3:
+            path = path.replace("ğ", "%C4%9F").replace("ş", "%C5%9F").replace("ü", "%C3%BC")
+        url = f"https://{rnd.choice(HOSTS)}{path}"
+        if rnd.random() < 0.1:
+            url += f"?v={i}&size=large"
+        if rnd.random() < 0.001:
+            url += "\x0b"  # geçersiz denetim karakteri
+        fname = url_filename_no_ext(url)
+        rows.append((url, fname, len(fname), url_extension(url), round(rnd.random() * 50, 2), rnd.choice(STATUSES)))
+    return rows
+
+
+# --- Eski yol (başvuru) ---
+
+def old_sanitize(s):
+    if s is None:
+        return ""
+    out = []
+    for ch in s:
+        oc = ord(ch)
+        if oc in (0x09, 0x0A, 0x0D) or (0x20 <= oc <= 0xD7FF) or (0xE000 <= oc <= 0xFFFD):
+            out.append(ch)
+    return "".join(out)
+
+
+def old_row_xml(idx, url, fname, fname_len, ext, size_mb, status):
+    parts = [f'<row r="{idx}">']
+    raw_url = old_sanitize(url or "")
+    safe_display = xml_escape(raw_url)
+    if raw_url and len(raw_url) <= 255:
+        safe_formula = xml_escape(f'HYPERLINK("{excel_quote(raw_url)}")')
+        parts.append(f'<c r="A{idx}" s="2" t="str"><f>{safe_formula}</f><v>{safe_display}</v></c>')
+    else:
+        parts.append(f'<c r="A{idx}" t="inlineStr" s="2"><is><t>{safe_display}</t></is></c>')
+    parts.append(f'<c r="B{idx}" t="inlineStr"><is><t>{xml_escape(old_sanitize(fname or ""))}</t></is></c>')
+    parts.append(f'<c r="C{idx}" s="0"><v>{fname_len}</v></c>')
+    parts.append(f'<c r="D{idx}" t="inlineStr"><is><t>{xml_escape(old_sanitize(ext or ""))}</t></is></c>')
+    if size_mb is None:
+        parts.append(f'<c r="E{idx}" s="3"/>')
+    else:
+        parts.append(f'<c r="E{idx}" s="3"><v>{size_mb}</v></c>')
+    parts.append(f'<c r="F{idx}" t="inlineStr"><is><t>{xml_escape(old_sanitize(status or ""))}</t></is></c>')
+    parts.append("</row>")
+    return "".join(parts)
+
+
+def bench(label, fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t
+        best = dt if best is None else min(best, dt)
+    print(f"{label:<32} {best * 1000:9.1f} ms")
+    return best, out
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = corpus(n)
+    print(f"{n} satır, {len(set(r[0] for r in rows))} farklı URL\n")
+
+    fields = [f for r in rows for f in (r[0], r[1], r[3], r[5])]
+    t_old, a = bench("sanitize+escape (eski)", lambda: [xml_escape(old_sanitize(f)) for f in fields])
+    t_new, b = bench("xml_text (yeni)", lambda: [xml_text(f) for f in fields])
+    assert a == b, "xml_text çıktısı eski yolla aynı değil"
+    print(f"{'hızlanma':<32} {t_old / t_new:9.1f}x\n")
+
+    t_old, a = bench("satır XML (eski)", lambda: [old_row_xml(i, *r) for i, r in enumerate(rows, start=2)])
+    t_new, b = bench("satır XML (_row_xml)", lambda: [_row_xml(i, *r)[0] for i, r in enumerate(rows, start=2)])
+    assert a == b, "_row_xml çıktısı eski yolla aynı değil"
+    print(f"{'hızlanma':<32} {t_old / t_new:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
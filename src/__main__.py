@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+`python -m src` => başsız komut satırı arayüzü (src/cli.py).
+"""
+
+import multiprocessing
+import sys
+
+from src.cli import main
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio tabanlı yoklama motoru: tek olay döngüsünde binlerce eşzamanlı HEAD/Range isteği.
+- `async_status_and_size_mb`, `status_and_size_mb` ile aynı (status_text, size_mb) sonucunu döndürür.
+- `AsyncProbeExecutor`, olay döngüsünü ayrı bir iş parçacığında çalıştırır ve
+  `concurrent.futures.Future` döndürür; böylece `_run_worker` aynı bekleme döngüsünü kullanır.
+- Vekil sunucu (proxy) gereken URL'ler olay döngüsünü bloklamadan, vekili destekleyen keep-alive
+  havuzu (connection_pool) üzerinden iş parçacığında yapılır.
+Harici paket YOK (asyncio + ssl + http.client ayrıştırıcısı).
+"""
+
+import asyncio
+import concurrent.futures
+import io
+import http.client
+import ssl
+import threading
+import time
+from typing import Mapping, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from src.connection_pool import DEFAULT_POOL, USER_AGENT, REDIRECT_CODES, MAX_REDIRECTS, proxy_for
+from src.dns_cache import DEFAULT_DNS_CACHE
+from src.internet_connection import (
+    ProbeResult, THROTTLE_CODES,
+    _safe_url, _content_length, _content_range_total, _format_result, _retry_after_seconds, _validators,
+    _merge_get_code, error_kind,
+)
+from src.host_capabilities import HostCapabilities, STRATEGY_AUTO, STRATEGY_HEAD, STRATEGY_RANGE
+from src.host_timeouts import ConnectTimeout, HostTimeouts
+
+# Yanıt başlıkları için üst sınır (StreamReader varsayılanı 64 KB)
+_HEADER_LIMIT = 64 * 1024
+
+_SSL_CONTEXT = ssl.create_default_context()
+
+
+async def _open_connection(host: str, port: int, use_ssl: bool):
+    """Adresleri DNS önbelleğinden alır, sırayla bağlanmayı dener."""
+    err = None
+    for _family, _st, _pr, _cn, sockaddr in await DEFAULT_DNS_CACHE.aresolve(host, port):
+        try:
+            return await asyncio.open_connection(
+                sockaddr[0], port,
+                ssl=_SSL_CONTEXT if use_ssl else None,
+                server_hostname=host if use_ssl else None,
+                limit=_HEADER_LIMIT,
+            )
+        except OSError as e:
+            err = e
+    raise err or OSError(f"Adres bulunamadı: {host}")
+
+
+async def _request_once(method: str, url: str, headers: Mapping[str, str], timeout: float,
+                        deadlines: Optional[HostTimeouts] = None) -> Tuple[int, http.client.HTTPMessage]:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Desteklenmeyen URL: {url}")
+    host = parts.hostname.lower()
+    port = parts.port or (443 if scheme == "https" else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    if proxy_for(scheme, host) is not None:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, DEFAULT_POOL._request_once, method, url, headers, timeout, deadlines)
+    if deadlines is not None:
+        connect_timeout, read_timeout = deadlines.timeouts(host)
+    else:
+        connect_timeout = read_timeout = timeout
+
+    t0 = time.monotonic()
+    try:
+        reader, writer = await asyncio.wait_for(_open_connection(host, port, scheme == "https"), connect_timeout)
+    except asyncio.TimeoutError as e:
+        if deadlines is not None:
+            deadlines.record_connect_timeout(host)
+        raise ConnectTimeout(f"Bağlantı {connect_timeout:.1f} sn içinde kurulamadı: {host}") from e
+    t1 = time.monotonic()
+    if deadlines is not None:
+        deadlines.record_connect(host, t1 - t0)
+    try:
+        status, resp_headers = await asyncio.wait_for(
+            _exchange(reader, writer, method, path, parts.netloc, headers), read_timeout)
+    except asyncio.TimeoutError:
+        if deadlines is not None:
+            deadlines.record_read_timeout(host)
+        raise
+    if deadlines is not None:
+        deadlines.record_read(host, time.monotonic() - t1)
+    return status, resp_headers
+
+
+async def _exchange(reader, writer, method: str, path: str, netloc: str,
+                    headers: Mapping[str, str]) -> Tuple[int, http.client.HTTPMessage]:
+    try:
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {netloc.rsplit('@', 1)[-1]}",
+            f"User-Agent: {USER_AGENT}",
+            "Accept-Encoding: identity",
+            "Connection: close",
+        ]
+        lines.extend(f"{k}: {v}" for k, v in (headers or {}).items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1", "replace"))
+        await writer.drain()
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, _, header_block = head.partition(b"\r\n")
+        fields = status_line.split(None, 2)
+        if len(fields) < 2 or not fields[0].startswith(b"HTTP/") or not fields[1].isdigit():
+            raise http.client.BadStatusLine(status_line.decode("latin-1", "replace"))
+        status = int(fields[1])
+        resp_headers = http.client.parse_headers(io.BytesIO(header_block))
+        return status, resp_headers
+    finally:
+        # Gövde okunmaz; bağlantı hemen kapatılır (TLS kapanış el sıkışması beklenmez)
+        writer.transport.abort()
+
+
+async def _request(method: str, url: str, headers: Optional[Mapping[str, str]] = None,
+                   timeout: float = 15.0,
+                   deadlines: Optional[HostTimeouts] = None) -> Tuple[int, http.client.HTTPMessage]:
+    """
+    Yönlendirmeleri (urlopen gibi) takip eder. Ağ hataları istisna olarak yükselir.
+    Bağlanma ve yanıt bekleme ayrı sınırlanır (deadlines yoksa ikisi de `timeout`).
+    """
+    current = url
+    for _ in range(MAX_REDIRECTS + 1):
+        status, resp_headers = await _request_once(method, current, headers or {}, timeout, deadlines)
+        location = resp_headers.get("Location")
+        if status in REDIRECT_CODES and location:
+            nxt = urljoin(current, location.strip())
+            if urlsplit(nxt).scheme.lower() not in ("http", "https"):
+                break
+            current = nxt
+            continue
+        break
+    return status, resp_headers
+
+
+async def async_probe_url(url: str, timeout: float = 15.0,
+                          headers: Optional[Mapping[str, str]] = None,
+                          caps: Optional[HostCapabilities] = None,
+                          deadlines: Optional[HostTimeouts] = None) -> ProbeResult:
+    """`probe_url` ile aynı mantık (HEAD, gerekirse 0-0 Range GET), asyncio üzerinde."""
+    url = _safe_url(url)
+    host = (urlsplit(url).hostname or "").lower()
+    strategy = caps.strategy(host) if caps is not None else STRATEGY_AUTO
+    extra = dict(headers or {})
+    size_bytes = None
+    code = None
+    retry_after = None
+    etag = last_modified = None
+    head_code = get_code = None
+    head_has_len = get_has_range = False
+    unreachable = False
+    error = None
+    t0 = time.monotonic()
+
+    if strategy != STRATEGY_RANGE:
+        try:
+            head_code, resp_headers = await _request("HEAD", url, extra, timeout=timeout, deadlines=deadlines)
+            code = head_code
+            retry_after = _retry_after_seconds(resp_headers)
+            # Hata yanıtlarındaki Content-Length hata sayfasınındır, dosyanın değil
+            if 200 <= code < 300:
+                size_bytes = _content_length(resp_headers)
+                head_has_len = size_bytes is not None
+            if 200 <= code < 400:
+                etag, last_modified = _validators(resp_headers)
+        except Exception as e:
+            error = error_kind(e)
+            # Bağlantı kurulamadıysa GET de kurulamaz; ikinci kez beklenmez
+            unreachable = isinstance(e, ConnectTimeout)
+
+    need_get = (size_bytes is None and code not in THROTTLE_CODES and code != 304 and not unreachable
+                and (strategy != STRATEGY_HEAD or code is None))
+    if need_get:
+        try:
+            get_headers = dict(extra)
+            get_headers["Range"] = "bytes=0-0"
+            get_code, resp_headers = await _request("GET", url, get_headers, timeout=timeout, deadlines=deadlines)
+            if code is None:
+                retry_after = _retry_after_seconds(resp_headers)
+            code = _merge_get_code(code, get_code)
+            if 200 <= get_code < 300:
+                size_bytes = _content_range_total(resp_headers)
+                get_has_range = size_bytes is not None
+            if 200 <= get_code < 400 and not (etag or last_modified):
+                etag, last_modified = _validators(resp_headers)
+        except Exception as e:
+            error = error_kind(e)
+
+    if caps is not None:
+        caps.observe(host, head_code, head_has_len, get_code, get_has_range)
+
+    status_text, size_mb = _format_result(code, size_bytes)
+    return ProbeResult(status_text, size_mb, code, retry_after, time.monotonic() - t0,
+                       size_bytes, etag, last_modified, error=error if code is None else None)
+
+
+async def async_status_and_size_mb(url: str, timeout: float = 15.0) -> Tuple[str, Optional[float]]:
+    """
+    `status_and_size_mb` karşılığı.
+    Dönen: (status_text, size_mb_float_or_None)
+    """
+    r = await async_probe_url(url, timeout=timeout)
+    return r.status_text, r.size_mb
+
+
+class AsyncProbeExecutor:
+    """
+    Arka plandaki tek bir olay döngüsünde coroutine çalıştıran, Executor benzeri sarmalayıcı.
+    - submit(coro_fn, *args) -> concurrent.futures.Future
+    - max_concurrency: aynı anda çalışan coroutine sayısı (semafor)
+    """
+
+    def __init__(self, max_concurrency: int = 500):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+
+        async def _init():
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+
+        self._loop.run_until_complete(_init())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _guarded(self, coro_fn, args):
+        async with self._sem:
+            return await coro_fn(*args)
+
+    def submit(self, coro_fn, *args) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(self._guarded(coro_fn, args), self._loop)
+
+    def shutdown(self, wait: bool = True):
+        if self._loop.is_closed():
+            return
+
+        async def _cancel_all():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_all(), self._loop).result(timeout=5.0)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join(timeout=5.0)
+        if not self._loop.is_running():
+            self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown(wait=True)
+        return False
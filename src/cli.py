@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Komut satırı (başsız) giriş noktası: sunucularda ve zamanlanmış işlerde çalıştırmak için.
+    python -m src girdi.xlsx -o sonuc.xlsx --header URL -j 64
+- tkinter İÇE AKTARILMAZ; okuma/yoklama/yazma GUI ile aynı modüllerden gelir.
+- İlerleme stderr'e satır başına bir JSON nesnesi olarak yazılır (--progress json).
+- Çıkış kodları: EXIT_* sabitleri.
+Harici paket YOK.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from src.internet_connection import is_internet_ok
+from src.probe_cache import ProbeCache, default_cache_path
+from src.host_capabilities import HostCapabilities
+from src.engine import ProbeEngine
+from src.sharding import ShardError, probe_urls_sharded
+from src.journal import DEFAULT_JOURNAL_MAX_AGE, ProbeJournal, journal_path_for, input_fingerprint
+from src.incremental import PreviousOutput, summary_path_for, write_summary
+from src.reader import is_excel, is_xml, read_urls_from_xlsx, read_urls_from_wxr, split_header_names
+from src.writer import OUTPUT_WRITERS, open_output, output_format_for, url_filename_no_ext, url_extension
+
+# Çıkış kodları
+EXIT_OK = 0           # tüm URL'ler OK
+EXIT_PARTIAL = 1      # çıktı yazıldı, OK olmayan URL'ler var
+EXIT_USAGE = 2        # hatalı argüman (argparse ile aynı)
+EXIT_INPUT = 3        # girdi okunamadı / URL yok
+EXIT_OUTPUT = 4       # çıktı yazılamadı
+EXIT_NO_NETWORK = 5   # internet bağlantısı yok
+EXIT_PROBE = 6        # yoklama yarıda kaldı (alt süreç hatası); eksik çıktı yazıldı
+EXIT_INTERRUPTED = 130
+
+OUTPUT_FORMATS = tuple(OUTPUT_WRITERS)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Excel (.xlsx) / WordPress WXR (.xml) içindeki URL'lerin durumunu ve boyutunu hesaplar.",
+    )
+    p.add_argument("input", help="Girdi dosyası (.xlsx veya .xml)")
+    p.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan: girdi adı + _sonuc.<biçim>)")
+    p.add_argument("-f", "--format", choices=OUTPUT_FORMATS,
+                   help="Çıktı biçimi (varsayılan: çıktı uzantısından, yoksa xlsx)")
+    p.add_argument("--header", default="URL", help='Excel için URL sütun başlığı; virgülle birden çok sütun (varsayılan: "URL")')
+    p.add_argument("--shared-strings", action="store_true",
+                   help="xlsx: tekrar eden Uzantı/Durum değerlerini paylaşılan dize tablosuna yaz (daha küçük dosya)")
+    p.add_argument("-j", "--concurrency", type=int, default=None,
+                   help="Eşzamanlı istek sayısı (thread: CPU*4 en fazla 32; asyncio: 500)")
+    p.add_argument("--backend", choices=("thread", "asyncio"), default="thread", help="Yoklama motoru")
+    p.add_argument("-p", "--processes", type=int, default=1,
+                   help="Alt süreç sayısı (1: tek süreç, 0: çekirdek sayısı); -j süreç başınadır")
+    p.add_argument("-t", "--timeout", type=float, default=15.0, help="İstek başına üst süre, sn (varsayılan: 15)")
+    p.add_argument("--per-host-limit", type=int, default=8, help="Host başına en fazla eşzamanlı istek")
+    p.add_argument("--max-attempts", type=int, default=3, help="Geçici hatada URL başına en fazla deneme")
+    p.add_argument("--no-cache", action="store_true", help="Kalıcı yoklama önbelleğini kullanma")
+    p.add_argument("--cache-path", default=None, help="Önbellek dosyası (varsayılan: kullanıcı önbellek klasörü)")
+    p.add_argument("--cache-ttl", type=float, default=24 * 3600.0, help="Önbellek kaydı geçerlilik süresi, sn")
+    p.add_argument("--host-caps-path", default=None,
+                   help="Host yetenek belleği (JSON; varsayılan: önbellek klasöründe host_caps.json)")
+    p.add_argument("--no-dns-preresolve", action="store_true", help="Hostları önceden DNS ile çözme")
+    p.add_argument("--resume", action="store_true",
+                   help="Aynı girdinin yarım kalan çalışmasından devam et (günlükteki URL'ler atlanır)")
+    p.add_argument("--no-journal", action="store_true", help="Kontrol noktası günlüğü tutma")
+    p.add_argument("--journal-path", default=None, help="Günlük dosyası (varsayılan: önbellek klasöründe)")
+    p.add_argument("--journal-max-age", type=float, default=DEFAULT_JOURNAL_MAX_AGE,
+                   help="--resume: bundan eski günlükten devam etme, baştan başla; sn (varsayılan: 24 saat)")
+    p.add_argument("--previous", default=None,
+                   help="Önceki sonuç dosyası (.xlsx): yalnızca yeni URL'ler yoklanır, gerisi taşınır")
+    p.add_argument("--max-age", type=float, default=None,
+                   help="Önceki dosya bu kadar günden eskiyse tüm URL'leri yeniden yokla")
+    p.add_argument("--recheck-failed", action="store_true",
+                   help="Önceki dosyada durumu OK olmayan URL'leri yeniden yokla")
+    p.add_argument("--summary-path", default=None,
+                   help="Değişiklik özeti dosyası (varsayılan: çıktı adı + _degisiklikler.txt)")
+    p.add_argument("--skip-net-check", action="store_true", help="Başlangıçtaki internet kontrolünü atla")
+    p.add_argument("--progress", choices=("json", "none"), default="json",
+                   help="stderr ilerleme çıktısı (varsayılan: json)")
+    p.add_argument("--progress-interval", type=float, default=1.0, help="İlerleme satırları arası süre, sn")
+    return p
+
+
+def _emit(enabled: bool, event: str, **fields) -> None:
+    if not enabled:
+        return
+    fields = {"event": event, **fields}
+    sys.stderr.write(json.dumps(fields, ensure_ascii=False) + "\n")
+    sys.stderr.flush()
+
+
+def _resolve_output(input_path: str, output: Optional[str], fmt: Optional[str]):
+    if fmt is None:
+        fmt = output_format_for(output or "")
+    if not output:
+        output = os.path.splitext(input_path)[0] + "_sonuc." + fmt
+    return output, fmt
+
+
+def _read_urls(input_path: str, header: str) -> List[str]:
+    if is_excel(input_path):
+        return read_urls_from_xlsx(input_path, split_header_names(header))
+    if is_xml(input_path):
+        return read_urls_from_wxr(input_path)
+    raise RuntimeError("Desteklenmeyen dosya türü. Lütfen .xlsx veya .xml verin.")
+
+
+def run(args: argparse.Namespace) -> int:
+    progress = args.progress == "json"
+    start_ts = time.time()
+
+    try:
+        urls = _read_urls(args.input, args.header)
+    except Exception as e:
+        _emit(True, "error", stage="input", message=str(e))
+        return EXIT_INPUT
+    if not urls:
+        _emit(True, "error", stage="input", message="Hiç URL bulunamadı.")
+        return EXIT_INPUT
+    output, fmt = _resolve_output(args.input, args.output, args.format)
+
+    if not args.skip_net_check and not is_internet_ok(timeout=4.0):
+        _emit(True, "error", stage="network", message="İnternet bağlantısı kurulamadı.")
+        return EXIT_NO_NETWORK
+
+    total = len(urls)
+    # Yalnızca henüz yazılamayan (sıra dışı gelen) satırların (size_mb, status) sonucu tutulur
+    pending: Dict[int, tuple] = {}
+    completed = 0
+
+    journal = None
+    if not args.no_journal:
+        try:
+            journal = ProbeJournal(args.journal_path or journal_path_for(args.input),
+                                   input_fingerprint(args.input), resume=args.resume,
+                                   max_age=args.journal_max_age)
+        except Exception as e:
+            _emit(True, "warning", stage="journal", message=str(e))
+    previous = None
+    if args.previous:
+        try:
+            previous = PreviousOutput(args.previous, max_age_days=args.max_age, recheck_failed=args.recheck_failed)
+        except Exception as e:
+            _emit(True, "error", stage="previous", message=str(e))
+            return EXIT_INPUT
+    carried = bytearray(total)  # önceki dosyadan taşınan satırlar
+    carried_count = 0
+    todo = []
+    for i, u in enumerate(urls):
+        prev = journal.lookup(u) if journal is not None else None
+        if prev is None and previous is not None:
+            prev = previous.lookup(u)
+            if prev is not None:
+                carried[i] = 1
+                carried_count += 1
+        if prev is not None:
+            pending[i] = prev
+            completed += 1
+        else:
+            todo.append(i)
+    todo_urls = [urls[i] for i in todo]
+    resumed = completed
+    changes = previous.tracker() if previous is not None else None
+    _emit(progress, "start", input=args.input, output=output, format=fmt, total=total, resumed=resumed,
+          carried=carried_count)
+
+    # Çıktı sonuçlar geldikçe girdi sırasıyla .tmp'ye yazılır (sıra dışı gelenler bekletilir),
+    # bitince yerine taşınır
+    tmp_output = output + ".tmp"
+    try:
+        out = open_output(tmp_output, fmt, shared_strings=args.shared_strings)
+    except Exception as e:
+        if journal is not None:
+            journal.close()
+        _emit(True, "error", stage="output", message=str(e))
+        return EXIT_OUTPUT
+    written = 0
+    ok_count = 0
+    next_row = 0
+
+    def write_ready() -> None:
+        """Sıradaki hazır satırları yazar ve tampondan çıkarır."""
+        nonlocal written, ok_count, next_row
+        while next_row < total and next_row in pending:
+            u = urls[next_row]
+            size_mb, status = pending[next_row]
+            fname = url_filename_no_ext(u)
+            out.add_row(u, fname, len(fname), url_extension(u), size_mb, status)
+            del pending[next_row]
+            if changes is not None:
+                changes.add(u, (size_mb, status), bool(carried[next_row]))
+            written += 1
+            if status == "OK":
+                ok_count += 1
+            next_row += 1
+
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ProbeCache(args.cache_path, ttl=args.cache_ttl)
+        except Exception:
+            cache = None
+    engine_options = dict(
+        backend=args.backend,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        per_host_limit=args.per_host_limit,
+        max_attempts=args.max_attempts,
+        dns_preresolve=not args.no_dns_preresolve,
+    )
+    caps_path = args.host_caps_path or os.path.join(os.path.dirname(default_cache_path()), "host_caps.json")
+    caps = None
+    cancel = threading.Event()
+    if args.processes == 1:
+        caps = HostCapabilities(caps_path)
+        caps.load()
+        records = ProbeEngine(cache=cache, caps=caps, cancel=cancel, **engine_options).run(todo_urls)
+    else:
+        # Her alt süreç önbelleği kendisi açar
+        if cache is not None:
+            cache.close()
+            cache = None
+        records = probe_urls_sharded(todo_urls, processes=args.processes or None, cancel=cancel,
+                                     cache_enabled=not args.no_cache, cache_path=args.cache_path,
+                                     cache_ttl=args.cache_ttl, host_caps_path=caps_path, **engine_options)
+
+    interrupted = False
+    last_update = 0.0
+    output_error = None
+    probe_error = None
+    try:
+        for rec in records:
+            pending[todo[rec.index]] = (rec.result.size_mb, rec.result.status_text)
+            completed += 1
+            if output_error is None:
+                try:
+                    write_ready()
+                except (OSError, sqlite3.Error) as e:  # disk dolu vb.: yoklamayı sürdürmenin anlamı yok
+                    output_error = e
+                    cancel.set()
+            if journal is not None:
+                journal.record(rec.url, rec.result)
+            now = time.time()
+            if progress and now - last_update >= args.progress_interval:
+                elapsed = now - start_ts
+                eta = round(elapsed / (completed - resumed) * (total - completed), 1)
+                _emit(True, "progress", completed=completed, total=total, elapsed=round(elapsed, 1), eta=eta)
+                last_update = now
+    except KeyboardInterrupt:
+        interrupted = True
+        cancel.set()
+    except ShardError as e:
+        probe_error = e
+        cancel.set()
+    finally:
+        if cache is not None:
+            try:
+                cache.close()
+            except Exception:
+                pass
+        if journal is not None:
+            journal.close()
+        if caps is not None:
+            try:
+                caps.save()
+            except Exception:
+                pass
+
+    try:
+        if output_error is not None:
+            raise output_error
+        write_ready()
+        # Kesilen çalışmada eksik satırların ardından gelenler de yazılır
+        while next_row < total:
+            write_ready()
+            next_row += 1
+        out.close()
+        os.replace(tmp_output, output)
+    except Exception as e:
+        try:
+            out.close()
+        except Exception:
+            pass
+        _emit(True, "error", stage="output", message=str(e))
+        return EXIT_OUTPUT
+    if probe_error is not None:
+        # Günlük korunur: --resume ile eksik satırlar yeniden yoklanabilir
+        _emit(True, "error", stage="probe", message=str(probe_error), output=output, processed=written, total=total)
+        return EXIT_PROBE
+    # Eksiksiz biten çalışmanın günlüğüne gerek kalmaz
+    if journal is not None and completed == total and not interrupted:
+        journal.discard()
+
+    if previous is not None and not interrupted:
+        summary = changes.summary()
+        summary_path = args.summary_path or summary_path_for(output)
+        try:
+            write_summary(summary, summary_path, previous.path)
+        except Exception as e:
+            _emit(True, "warning", stage="summary", message=str(e))
+        _emit(progress, "changes", summary=summary_path, **summary.as_dict())
+
+    _emit(progress, "done", output=output, processed=written, total=total, ok=ok_count,
+          other=written - ok_count, elapsed=round(time.time() - start_ts, 1), interrupted=interrupted)
+    if interrupted:
+        return EXIT_INTERRUPTED
+    return EXIT_OK if ok_count == total else EXIT_PARTIAL
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.concurrency is not None and args.concurrency < 1:
+        build_parser().error("--concurrency en az 1 olmalı")
+    if args.processes < 0:
+        build_parser().error("--processes negatif olamaz")
+    return run(args)
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+Host başına kalıcı (keep-alive) HTTP bağlantı havuzu.
+- Aynı host'a giden istekler açık bağlantıyı yeniden kullanır (DNS + TCP + TLS bir kez).
+- Host başına boşta bekleyen bağlantı sayısı sınırlıdır; uzun süre boşta kalanlar kapatılır.
+- Adres çözümlemesi süreç içi DNS önbelleğinden yapılır (dns_cache.DEFAULT_DNS_CACHE).
+- `deadlines` verilirse bağlanma ve okuma ayrı, host'a göre uyarlanan sürelerle sınırlanır
+  (host_timeouts.HostTimeouts); bağlanma aşımı ConnectTimeout olarak yükselir.
+- Gövdesi tamamen okunamayan (ör. Range yok sayılıp tüm dosya dönen) yanıtlardan sonra
+  bağlantı havuza geri konmaz, kapatılır.
+- Vekil sunucu (proxy) urlopen ile aynı kaynaktan okunur (urllib.request.getproxies: *_proxy ortam
+  değişkenleri, Windows'ta sistem ayarı; proxy_bypass/no_proxy): http istekleri vekile mutlak URL ile,
+  https istekleri CONNECT tüneliyle gider. Bağlantılar http.client sınıflarının alt sınıflarıdır
+  (connect() DNS önbelleği ve tünel için yeniden yazılır).
+Harici paket YOK (http.client + ssl).
+"""
+
+import base64
+import functools
+import http.client
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from src.dns_cache import DEFAULT_DNS_CACHE, DnsCache
+from src.host_timeouts import ConnectTimeout, HostTimeouts
+
+USER_AGENT = "Python-urllib/3 (URL Boyut Hesaplayici)"
+
+# Yönlendirme takibi (urlopen ile aynı kodlar)
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+
+# Bu kadar veya daha küçük gövdeler okunup atılır ve bağlantı yeniden kullanılır
+MAX_DRAIN_BYTES = 64 * 1024
+
+# Yeniden kullanılan bağlantı karşı tarafça kapatılmışsa görülen hatalar
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+)
+
+PoolKey = Tuple[str, str, int]
+Proxy = Tuple[str, Optional[int], Optional[str]]  # (host, port, Proxy-Authorization)
+
+
+def _pool_key(scheme: str, host: str, port: Optional[int]) -> PoolKey:
+    scheme = (scheme or "http").lower()
+    if port is None:
+        port = 443 if scheme == "https" else 80
+    return scheme, (host or "").lower(), port
+
+
+@functools.lru_cache(maxsize=1)
+def _system_proxies() -> Dict[str, str]:
+    try:
+        return dict(getproxies())
+    except Exception:
+        return {}
+
+
+@functools.lru_cache(maxsize=4096)
+def proxy_for(scheme: str, host: str) -> Optional[Proxy]:
+    """urlopen'ın bu scheme/host için kullanacağı vekil sunucu; doğrudan bağlanılacaksa None."""
+    spec = _system_proxies().get((scheme or "").lower())
+    if not spec or not host:
+        return None
+    try:
+        if proxy_bypass(host):
+            return None
+    except Exception:
+        pass
+    if "://" not in spec:
+        spec = "http://" + spec
+    try:
+        parts = urlsplit(spec)
+        port = parts.port
+    except ValueError:
+        return None
+    if not parts.hostname:
+        return None
+    auth = None
+    if parts.username is not None:
+        cred = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        auth = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+    return parts.hostname, port, auth
+
+
+def proxy_for_url(url: str) -> Optional[Proxy]:
+    try:
+        parts = urlsplit((url or "").strip())
+        return proxy_for(parts.scheme, (parts.hostname or "").lower())
+    except ValueError:
+        return None
+
+
+_MAX_TUNNEL_LINE = 65536
+_MAX_TUNNEL_HEADERS = 100
+
+
+def _open_tunnel(sock: socket.socket, host: str, port: int, proxy_auth: Optional[str]) -> None:
+    """Vekil üzerinden host:port'a CONNECT tüneli açar; vekil 200 dışı yanıt verirse OSError."""
+    authority = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+    lines = [f"CONNECT {authority} HTTP/1.1", f"Host: {authority}"]
+    if proxy_auth:
+        lines.append(f"Proxy-Authorization: {proxy_auth}")
+    sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    fp = sock.makefile("rb")
+    try:
+        status = fp.readline(_MAX_TUNNEL_LINE + 1)
+        if len(status) > _MAX_TUNNEL_LINE:
+            raise OSError("Vekil yanıt satırı çok uzun")
+        parts = status.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise OSError(f"Vekil geçersiz yanıt verdi: {status!r}")
+        for _ in range(_MAX_TUNNEL_HEADERS):
+            line = fp.readline(_MAX_TUNNEL_LINE + 1)
+            if line in (b"\r\n", b"\n", b""):
+                break
+        else:
+            raise OSError("Vekil yanıtında çok fazla başlık var")
+    finally:
+        fp.close()
+    if parts[1] != "200":
+        raise OSError(f"Tunnel connection failed: {parts[1]} {parts[2].strip() if len(parts) > 2 else ''}".rstrip())
+
+
+class _PooledHTTPConnection(http.client.HTTPConnection):
+    """
+    Adresi süreç içi DNS önbelleğinden çözerek bağlanan HTTPConnection.
+    - tunnel: (hedef host, port, Proxy-Authorization) verilirse host/port vekildir ve bağlanınca
+      CONNECT tüneli açılır
+    """
+
+    def __init__(self, host: str, port: Optional[int], timeout: float, dns_cache: DnsCache,
+                 tunnel: Optional[Tuple[str, int, Optional[str]]] = None):
+        super().__init__(host, port, timeout=timeout)
+        self.dns_cache = dns_cache
+        self.tunnel = tunnel
+
+    def connect(self) -> None:
+        self.sock = self.dns_cache.create_connection((self.host, self.port), self.timeout, self.source_address)
+        try:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        if self.tunnel is not None:
+            try:
+                _open_tunnel(self.sock, *self.tunnel)
+            except BaseException:
+                self.close()
+                raise
+
+
+class _PooledHTTPSConnection(http.client.HTTPSConnection):
+    """_PooledHTTPConnection'ın TLS karşılığı: tünel (varsa) açıldıktan sonra soket ssl_context ile sarılır."""
+
+    def __init__(self, host: str, port: Optional[int], timeout: float, dns_cache: DnsCache,
+                 ssl_context: ssl.SSLContext, tunnel: Optional[Tuple[str, int, Optional[str]]] = None):
+        super().__init__(host, port, timeout=timeout, context=ssl_context)
+        self.dns_cache = dns_cache
+        self.ssl_context = ssl_context
+        self.tunnel = tunnel
+
+    def connect(self) -> None:
+        _PooledHTTPConnection.connect(self)
+        server_hostname = self.tunnel[0] if self.tunnel is not None else self.host
+        try:
+            self.sock = self.ssl_context.wrap_socket(self.sock, server_hostname=server_hostname)
+        except BaseException:
+            self.close()
+            raise
+
+
+class HostConnectionPool:
+    """
+    Host (scheme, host, port) başına boşta bekleyen bağlantıları tutar.
+    - max_idle_per_host: host başına havuzda bekletilecek en fazla bağlantı
+    - idle_timeout: bu süreden (sn) uzun boşta kalan bağlantı kapatılır (alınırken ya da
+      en fazla idle_timeout aralıkla bırakılırken tüm havuz taranarak)
+    İş parçacığı güvenlidir; `_run_worker` içindeki tüm işçiler tek havuzu paylaşır.
+    """
+
+    def __init__(self, max_idle_per_host: int = 8, idle_timeout: float = 30.0,
+                 dns_cache: Optional[DnsCache] = None):
+        self.dns_cache = dns_cache or DEFAULT_DNS_CACHE
+        self.max_idle_per_host = max(1, int(max_idle_per_host))
+        self.idle_timeout = float(idle_timeout)
+        self._idle: Dict[PoolKey, Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._last_evict = time.monotonic()
+        self._ssl_context = ssl.create_default_context()
+
+    # --- bağlantı al / bırak ---
+
+    def _new_connection(self, key: PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        proxy = proxy_for(scheme, host)
+        # Adres çözümlemesi (hedefin ya da vekilin) süreç içi DNS önbelleğinden
+        if proxy is None:
+            if scheme == "https":
+                return _PooledHTTPSConnection(host, port, timeout, self.dns_cache, self._ssl_context)
+            return _PooledHTTPConnection(host, port, timeout, self.dns_cache)
+        proxy_host, proxy_port, proxy_auth = proxy
+        proxy_port = proxy_port if proxy_port is not None else 80  # http:// vekil
+        if scheme == "https":
+            return _PooledHTTPSConnection(proxy_host, proxy_port, timeout, self.dns_cache, self._ssl_context,
+                                          tunnel=(host, port, proxy_auth))
+        return _PooledHTTPConnection(proxy_host, proxy_port, timeout, self.dns_cache)
+
+    def acquire(self, key: PoolKey, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Boşta bağlantı varsa onu, yoksa yenisini döndürür. Dönen: (conn, reused)"""
+        now = time.monotonic()
+        stale = []
+        conn = None
+        with self._lock:
+            q = self._idle.get(key)
+            while q:
+                c, ts = q.pop()  # en son bırakılan (en sıcak) bağlantı
+                if now - ts > self.idle_timeout:
+                    stale.append(c)
+                    continue
+                conn = c
+                break
+        for c in stale:
+            _close_quietly(c)
+        if conn is None:
+            return self._new_connection(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            try:
+                conn.sock.settimeout(timeout)
+            except OSError:
+                _close_quietly(conn)
+                return self._new_connection(key, timeout), False
+        return conn, True
+
+    def release(self, key: PoolKey, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if not reusable or conn.sock is None:
+            _close_quietly(conn)
+        else:
+            with self._lock:
+                q = self._idle.setdefault(key, deque())
+                if len(q) >= self.max_idle_per_host:
+                    old, _ts = q.popleft()
+                    _close_quietly(old)
+                q.append((conn, time.monotonic()))
+        # Bir daha istenmeyen host'ların bağlantıları da süresi dolunca kapansın
+        now = time.monotonic()
+        if now - self._last_evict >= self.idle_timeout:
+            self._last_evict = now
+            self.evict_idle()
+
+    def evict_idle(self) -> None:
+        """idle_timeout'u aşmış bağlantıları kapatır."""
+        now = time.monotonic()
+        stale = []
+        with self._lock:
+            for key, q in list(self._idle.items()):
+                keep = deque((c, ts) for c, ts in q if now - ts <= self.idle_timeout)
+                stale.extend(c for c, ts in q if now - ts > self.idle_timeout)
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+        for c in stale:
+            _close_quietly(c)
+
+    def close_all(self) -> None:
+        with self._lock:
+            conns = [c for q in self._idle.values() for c, _ts in q]
+            self._idle.clear()
+        for c in conns:
+            _close_quietly(c)
+
+    # --- istek ---
+
+    @staticmethod
+    def _connect(conn: http.client.HTTPConnection, host: str, connect_timeout: float,
+                 read_timeout: float, deadlines: Optional[HostTimeouts]) -> None:
+        """Yeni bağlantıyı bağlanma süresiyle kurar, ardından soketi okuma süresine geçirir."""
+        conn.timeout = connect_timeout
+        t0 = time.monotonic()
+        try:
+            conn.connect()
+        except socket.timeout as e:
+            if deadlines is not None:
+                deadlines.record_connect_timeout(host)
+            raise ConnectTimeout(f"Bağlantı {connect_timeout:.1f} sn içinde kurulamadı: {host}") from e
+        if deadlines is not None:
+            deadlines.record_connect(host, time.monotonic() - t0)
+        conn.timeout = read_timeout
+        conn.sock.settimeout(read_timeout)
+
+    def _request_once(self, method: str, url: str, headers: Mapping[str, str], timeout: float,
+                      deadlines: Optional[HostTimeouts] = None):
+        parts = urlsplit(url)
+        if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Desteklenmeyen URL: {url}")
+        key = _pool_key(parts.scheme, parts.hostname, parts.port)
+        if deadlines is not None:
+            connect_timeout, read_timeout = deadlines.timeouts(key[1])
+        else:
+            connect_timeout = read_timeout = timeout
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        host_header = parts.netloc.rsplit("@", 1)[-1]
+        proxy = proxy_for(key[0], key[1])
+        if proxy is not None and key[0] == "http":
+            # Düz http vekil üzerinden: istek satırında mutlak URL
+            path = f"http://{host_header}{path}"
+
+        hdrs = {
+            "Host": host_header,
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "identity",
+            "Connection": "keep-alive",
+        }
+        if proxy is not None and key[0] == "http" and proxy[2]:
+            hdrs["Proxy-Authorization"] = proxy[2]
+        hdrs.update(headers or {})
+
+        # Yeniden kullanılan bağlantı sunucu tarafından kapatılmış olabilir → bir kez taze bağlantıyla dene
+        for attempt in (0, 1):
+            conn, reused = self.acquire(key, read_timeout)
+            try:
+                if not reused:
+                    self._connect(conn, key[1], connect_timeout, read_timeout, deadlines)
+                t_sent = time.monotonic()
+                conn.request(method, path, headers=hdrs)
+                resp = conn.getresponse()
+            except _STALE_ERRORS:
+                _close_quietly(conn)
+                if reused and attempt == 0:
+                    continue
+                raise
+            except ConnectTimeout:
+                _close_quietly(conn)
+                raise
+            except socket.timeout:
+                if deadlines is not None:
+                    deadlines.record_read_timeout(key[1])
+                _close_quietly(conn)
+                raise
+            except Exception:
+                _close_quietly(conn)
+                raise
+            if deadlines is not None:
+                deadlines.record_read(key[1], time.monotonic() - t_sent)
+
+            status = resp.status
+            resp_headers = resp.msg
+            reusable = self._drain(method, resp)
+            self.release(key, conn, reusable)
+            return status, resp_headers
+        raise http.client.HTTPException("Bağlantı kurulamadı")  # pragma: no cover
+
+    @staticmethod
+    def _drain(method: str, resp: http.client.HTTPResponse) -> bool:
+        """
+        Bağlantının yeniden kullanılabilmesi için yanıt gövdesini tüketir.
+        Gövde büyük ya da uzunluğu belirsizse okumadan vazgeçer (bağlantı kapatılacak).
+        """
+        try:
+            if resp.will_close:
+                resp.close()
+                return False
+            if method == "HEAD" or resp.status in (204, 304) or 100 <= resp.status < 200:
+                resp.read()
+                return True
+            if resp.length is None or resp.length > MAX_DRAIN_BYTES:
+                resp.close()
+                return False
+            resp.read()
+            return True
+        except Exception:
+            return False
+
+    def request(self, method: str, url: str, headers: Optional[Mapping[str, str]] = None,
+                timeout: float = 15.0,
+                deadlines: Optional[HostTimeouts] = None) -> Tuple[int, http.client.HTTPMessage, str]:
+        """
+        İsteği gönderir, yönlendirmeleri (urlopen gibi) takip eder.
+        - deadlines verilirse her adımda o host'un bağlanma/okuma süreleri kullanılır, yoksa `timeout`
+        Dönen: (status_code, headers, final_url). Ağ hataları istisna olarak yükselir.
+        """
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, resp_headers = self._request_once(method, current, headers or {}, timeout, deadlines)
+            location = resp_headers.get("Location")
+            if status in REDIRECT_CODES and location:
+                nxt = urljoin(current, location.strip())
+                if urlsplit(nxt).scheme.lower() not in ("http", "https"):
+                    return status, resp_headers, current
+                current = nxt
+                continue
+            return status, resp_headers, current
+        return status, resp_headers, current
+
+
+def _close_quietly(conn: http.client.HTTPConnection) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+# Tüm işçilerin paylaştığı varsayılan havuz
+DEFAULT_POOL = HostConnectionPool()
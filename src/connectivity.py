@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Pasif bağlantı izleme: işçilerin yoklama sonuçlarından internetin durumunu çıkarır.
+- Herhangi bir HTTP yanıtı (kodu ne olursa olsun) ağın çalıştığını gösterir.
+- Art arda ağ hataları (zaman aşımı/bağlantı) eşiği aşınca ya da bir süredir trafik yoksa
+  durum "bilinmiyor" sayılır ve ancak o zaman etkin sınama (is_internet_ok) yapılır.
+Böylece tarama sürerken izleyici fazladan istek üretmez.
+Harici paket YOK.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from src.internet_connection import ProbeResult, ERROR_TIMEOUT, ERROR_CONNECTION, is_internet_ok
+
+# Bağlantı sorununa işaret eden hata türleri (DNS "böyle host yok" yanıtı ağın çalıştığını gösterir)
+NETWORK_ERRORS = (ERROR_TIMEOUT, ERROR_CONNECTION)
+
+
+class ConnectivityMonitor:
+    """
+    - failure_threshold: bu kadar art arda ağ hatasında pasif çıkarım "belirsiz" olur
+    - fresh_window: son başarılı yanıt bu süreden (sn) yeniyse ağ çalışıyor sayılır
+    İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, failure_threshold: int = 8, fresh_window: float = 5.0):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.fresh_window = float(fresh_window)
+        self._last_success = 0.0
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, r: ProbeResult) -> None:
+        """Ağa çıkan (önbellekten gelmeyen) yoklama sonucunu bildirir."""
+        if r.cached:
+            return
+        with self._lock:
+            if r.code is not None:
+                self._last_success = time.monotonic()
+                self._failures = 0
+            elif r.error in NETWORK_ERRORS:
+                self._failures += 1
+
+    def passive_state(self) -> Optional[bool]:
+        """True: ağ çalışıyor (son yanıtlara göre); None: bilinmiyor, etkin sınama gerekir."""
+        with self._lock:
+            if self._failures >= self.failure_threshold:
+                return None
+            if time.monotonic() - self._last_success <= self.fresh_window:
+                return True
+            return None
+
+    def check(self, timeout: float = 3.0) -> bool:
+        """
+        Pasif çıkarım yeterliyse istek atmadan, değilse yarışlı etkin sınamayla sonuç verir.
+        Etkin sınama önbelleği kullanmaz: pasif çıkarım zaten belirsizken eski bir başarı kopmayı gizlemesin.
+        """
+        if self.passive_state():
+            return True
+        ok = is_internet_ok(timeout=timeout, use_cache=False)
+        if ok:
+            with self._lock:
+                self._failures = 0
+        return ok
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Az bellekli tekilleştirme: on milyonlarca URL'de tam dizeleri bir `set` içinde tutmak gigabaytlar tutar.
+- DigestSet: her anahtarın sabit genişlikli (32/64 bit) blake2b özeti, açık adresli bir array tablosunda
+  saklanır; URL başına ~16 bayt (64 bit, en fazla %50 doluluk). Genişlik, beklenen öğe sayısı ve
+  yanlış-pozitif (çakışma) bütçesinden seçilir: çakışan iki farklı URL'den ikincisi "görülmüş" sayılır.
+- Bellek öğe sayısıyla doğrusal büyür (tavan yok); çakışma olasılığı fp_budget ile sınırlıdır, yani
+  pratikte tam tekilleştirmedir.
+Arayüz set benzeridir: add(key) anahtar ilk kez görülüyorsa True döndürür.
+Harici paket YOK.
+"""
+
+import hashlib
+import math
+from array import array
+
+DEFAULT_FP_BUDGET = 1e-6
+
+
+def _digest128(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class DigestSet:
+    """
+    Özet kümesi (set yerine). add(key) anahtar ilk kez görülüyorsa True döndürür.
+    - expected_items: başlangıç kapasitesi (aşılırsa tablo iki katına büyür)
+    - fp_budget: beklenen öğe sayısında en az bir çakışma olasılığı için üst sınır; 32 bit yetiyorsa
+      tablo yarı boyutta tutulur, yetmiyorsa 64 bit kullanılır
+    """
+
+    _MAX_LOAD = 0.5
+
+    def __init__(self, expected_items: int = 1 << 16, fp_budget: float = DEFAULT_FP_BUDGET):
+        n = max(1, int(expected_items))
+        # Doğum günü yaklaşımı: P(çakışma) ~ n^2 / 2^(b+1)
+        self.bits = 32 if n * n / 2.0 ** 33 <= fp_budget else 64
+        self._typecode = "I" if self.bits == 32 and array("I").itemsize == 4 else "Q"
+        self._mask = (1 << self.bits) - 1
+        capacity = 1 << max(4, math.ceil(math.log2(n / self._MAX_LOAD)))
+        self._table = self._new_table(capacity)
+        self._count = 0
+
+    def _new_table(self, capacity: int) -> array:
+        self._slot_mask = capacity - 1
+        return array(self._typecode, bytes(capacity * array(self._typecode).itemsize))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._table) * self._table.itemsize
+
+    def _fingerprint(self, key: str) -> int:
+        h = int.from_bytes(_digest128(key)[:8], "little") & self._mask
+        return h or 1  # 0 boş yuva işaretidir
+
+    def _probe(self, h: int) -> int:
+        """h'nin bulunduğu ya da yerleşeceği yuva (doğrusal arama)."""
+        table = self._table
+        mask = self._slot_mask
+        i = h & mask  # özet zaten düzgün dağılımlı
+        while True:
+            v = table[i]
+            if v == 0 or v == h:
+                return i
+            i = (i + 1) & mask
+
+    def _grow(self) -> None:
+        old = self._table
+        self._table = self._new_table(len(old) * 2)
+        for h in old:
+            if h:
+                self._table[self._probe(h)] = h
+
+    def add(self, key: str) -> bool:
+        h = self._fingerprint(key)
+        i = self._probe(h)
+        if self._table[i] == h:
+            return False
+        self._table[i] = h
+        self._count += 1
+        if self._count > len(self._table) * self._MAX_LOAD:
+            self._grow()
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        h = self._fingerprint(key)
+        return self._table[self._probe(h)] == h
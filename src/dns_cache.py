@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Süreç içi DNS önbelleği + isteğe bağlı ön çözümleme aşaması.
+- Aynı host için sistem çözümleyicisine TTL süresince tekrar gidilmez.
+- Kesin olarak çözümlenemeyen hostlar (NXDOMAIN) kısa süre olumsuz önbellekte tutulur.
+- pre_resolve(): URL listesindeki farklı hostları yoklama başlamadan paralel çözer;
+  çözümlenemeyenler işçi zamanı harcanmadan hatalı işaretlenebilir.
+Harici paket YOK (socket + concurrent.futures).
+"""
+
+import asyncio
+import concurrent.futures
+import socket
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+AddrInfo = Tuple[int, int, int, str, tuple]
+
+# "Böyle bir host yok" anlamına gelen hatalar (geçici hatalar olumsuz önbelleğe alınmaz)
+_PERMANENT_GAI_ERRORS = {
+    getattr(socket, name) for name in ("EAI_NONAME", "EAI_NODATA", "EAI_ADDRFAMILY") if hasattr(socket, name)
+}
+
+
+def is_permanent_dns_error(exc: BaseException) -> bool:
+    return isinstance(exc, socket.gaierror) and exc.errno in _PERMANENT_GAI_ERRORS
+
+
+def _with_port(infos: List[AddrInfo], port: int) -> List[AddrInfo]:
+    """Porttan bağımsız saklanan sonuçlara hedef portu yerleştirir."""
+    return [(fam, st, pr, cn, (sa[0], port) + tuple(sa[2:])) for fam, st, pr, cn, sa in infos]
+
+
+class DnsCache:
+    """
+    - ttl: başarılı çözümlemenin saklanma süresi (sn); stdlib gerçek DNS TTL'ini vermediği için sabittir
+    - negative_ttl: kesin başarısız çözümlemenin saklanma süresi (sn)
+    İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0):
+        self.ttl = float(ttl)
+        self.negative_ttl = float(negative_ttl)
+        self._entries: Dict[str, Tuple[float, List[AddrInfo]]] = {}
+        self._failures: Dict[str, Tuple[float, socket.gaierror]] = {}
+        self._lock = threading.Lock()
+
+    # --- önbellek ---
+
+    def _lookup(self, host: str) -> Optional[List[AddrInfo]]:
+        now = time.monotonic()
+        with self._lock:
+            fail = self._failures.get(host)
+            if fail is not None:
+                if fail[0] > now:
+                    raise fail[1]
+                del self._failures[host]
+            hit = self._entries.get(host)
+            if hit is not None:
+                if hit[0] > now:
+                    return hit[1]
+                del self._entries[host]
+        return None
+
+    def _store(self, host: str, infos: List[AddrInfo]) -> None:
+        with self._lock:
+            self._entries[host] = (time.monotonic() + self.ttl, infos)
+
+    def _store_failure(self, host: str, exc: BaseException) -> None:
+        if is_permanent_dns_error(exc):
+            with self._lock:
+                self._failures[host] = (time.monotonic() + self.negative_ttl, exc)
+
+    def resolve(self, host: str, port: int) -> List[AddrInfo]:
+        """getaddrinfo sonucu (önbellekten veya sistem çözümleyicisinden). Hata: socket.gaierror"""
+        host = (host or "").lower()
+        infos = self._lookup(host)
+        if infos is None:
+            try:
+                infos = socket.getaddrinfo(host, None, 0, socket.SOCK_STREAM)
+            except socket.gaierror as e:
+                self._store_failure(host, e)
+                raise
+            self._store(host, infos)
+        return _with_port(infos, port)
+
+    async def aresolve(self, host: str, port: int) -> List[AddrInfo]:
+        """resolve() karşılığı; önbellekte yoksa olay döngüsünü bloklamadan çözer."""
+        host = (host or "").lower()
+        infos = self._lookup(host)
+        if infos is None:
+            loop = asyncio.get_running_loop()
+            try:
+                infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+            except socket.gaierror as e:
+                self._store_failure(host, e)
+                raise
+            self._store(host, infos)
+        return _with_port(infos, port)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+
+    # --- bağlantı ---
+
+    def create_connection(self, address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None):
+        """
+        socket.create_connection karşılığı; adres çözümlemesi önbellekten yapılır.
+        connection_pool bağlantılarının connect() yöntemi bunu kullanır.
+        """
+        host, port = address
+        err = None
+        for family, socktype, proto, _canon, sockaddr in self.resolve(host, port):
+            sock = None
+            try:
+                sock = socket.socket(family, socktype, proto)
+                if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as e:
+                err = e
+                if sock is not None:
+                    sock.close()
+        if err is not None:
+            raise err
+        raise OSError(f"getaddrinfo boş sonuç döndürdü: {host}")
+
+    # --- ön çözümleme ---
+
+    def pre_resolve(self, hosts: Iterable[str], max_workers: int = 32) -> Set[str]:
+        """
+        Hostları paralel çözer (sonuçlar önbelleğe girer).
+        Dönen: kesin olarak çözümlenemeyen hostlar (geçici hatalar dahil edilmez).
+        """
+        uniq = sorted({(h or "").lower() for h in hosts if h})
+        failed: Set[str] = set()
+        if not uniq:
+            return failed
+
+        def _one(h):
+            try:
+                self.resolve(h, 0)
+                return h, None
+            except Exception as e:
+                return h, e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(uniq)))) as ex:
+            for h, e in ex.map(_one, uniq):
+                if e is not None and is_permanent_dns_error(e):
+                    failed.add(h)
+        return failed
+
+
+# Tüm yoklama katmanının paylaştığı varsayılan önbellek
+DEFAULT_DNS_CACHE = DnsCache()
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+Arayüzden bağımsız yoklama motoru (kütüphane API'si).
+    for rec in probe_urls(urls):          # urls: herhangi bir (tembel olabilen) yinelenebilir
+        print(rec.index, rec.url, rec.result.status_text)
+    async for rec in aprobe_urls(urls): ...
+- Sonuçlar bittikleri sırayla (girdi sırasıyla değil) üretilir; rec.index girdi sırasını verir.
+- Girdi, sınırlı bir ileri okuma penceresi kadar tüketilir; uçuştaki istek sayısı sınırlıdır
+  (geri basınç): tüketici yavaşsa yeni iş gönderilmez, sonuç kümesi bellekte biriktirilmez.
+  Tekrar eden URL'ler de (sonucu bekleyen ya da üretilmeyi bekleyen satırlar) pencereye sayılır.
+- Tekrar ayıklama için yalnızca son `dedup_memory` benzersiz URL'nin sonucu tutulur (LRU);
+  bundan eski bir tekrar yeniden yoklanır (kalıcı önbellek açıksa ağa çıkmadan döner).
+- Host-adil zamanlama, AIMD hız denetimi, yeniden deneme, önbellek, host yetenekleri,
+  uyarlanabilir zaman aşımı ve DNS ön çözümleme GUI ve CLI ile ortaktır.
+Harici paket YOK.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.internet_connection import probe_url, ProbeResult, ERROR_DNS, ERROR_CANCELLED
+from src.connection_pool import DEFAULT_POOL, proxy_for_url
+from src.dns_cache import DEFAULT_DNS_CACHE
+from src.async_probe import AsyncProbeExecutor, async_probe_url
+from src.scheduler import HostFairScheduler, host_of
+from src.rate_control import HostRateController
+from src.probe_cache import ProbeCache, cached_probe_url, async_cached_probe_url
+from src.host_capabilities import HostCapabilities
+from src.host_timeouts import HostTimeouts
+from src.retry import RetryPolicy
+from src.url_canonical import canonical_url
+
+ERR_RESULT = ProbeResult("ERR", None)
+DNS_ERR_RESULT = ProbeResult("ERR", None, error=ERROR_DNS)
+CANCELLED_RESULT = ProbeResult("ERR", None, error=ERROR_CANCELLED)
+
+
+class ProbeRecord(NamedTuple):
+    index: int          # girdideki sıra (0'dan)
+    url: str            # girdideki özgün URL
+    result: ProbeResult
+
+
+def default_concurrency(backend: str = "thread") -> int:
+    if backend == "asyncio":
+        return 500
+    return min(32, (os.cpu_count() or 4) * 4)
+
+
+class ProbeEngine:
+    """
+    Bir yoklama çalıştırmasının ayarları.
+    - backend: "thread" (ThreadPoolExecutor) veya "asyncio" (tek olay döngüsü)
+    - concurrency: uçuştaki en fazla istek (None => backend varsayılanı)
+    - lookahead: girdiden ileri okunup kuyrukta bekletilecek en fazla iş (None => concurrency * 4)
+    - dedup: kanonik olarak aynı URL'ler bir kez yoklanır, sonuç tüm satırlara verilir
+    - dedup_memory: tekrarlar için sonucu saklanan en fazla benzersiz URL (en az yakın zamanda kullanılan düşer)
+    - cache / caps: dışarıdan verilen önbellek ve host yetenek belleği (açma/kapama çağırana aittir)
+    - pause / cancel: threading.Event; pause kuruluyken yeni istek başlamaz, cancel kurulunca durulur
+    - on_probe: ağa çıkan (önbellekten gelmeyen) her sonuç için işçi iş parçacığından çağrılır
+    """
+
+    def __init__(self, backend: str = "thread", concurrency: Optional[int] = None,
+                 timeout: float = 15.0, per_host_limit: int = 8, max_attempts: int = 3,
+                 retry_budget_ratio: float = 0.1, cache: Optional[ProbeCache] = None,
+                 caps: Optional[HostCapabilities] = None, dns_preresolve: bool = True,
+                 dedup: bool = True, dedup_memory: int = 100_000, lookahead: Optional[int] = None,
+                 pause: Optional[threading.Event] = None, cancel: Optional[threading.Event] = None,
+                 on_probe: Optional[Callable[[ProbeResult], None]] = None):
+        self.backend = backend if backend in ("thread", "asyncio") else "thread"
+        self.concurrency = max(1, int(concurrency or default_concurrency(self.backend)))
+        self.timeout = float(timeout)
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_budget_ratio = float(retry_budget_ratio)
+        self.cache = cache
+        self.caps = caps
+        self.dns_preresolve = dns_preresolve
+        self.dedup = dedup
+        self.dedup_memory = max(1, int(dedup_memory))
+        self.lookahead = max(1, int(lookahead or self.concurrency * 4))
+        self.pause = pause or threading.Event()
+        self.cancel = cancel or threading.Event()
+        self.on_probe = on_probe
+
+    # --- işçiler ---
+
+    def _task_fns(self, rate: HostRateController, caps: HostCapabilities, deadlines: HostTimeouts):
+        cache, pause, cancel, on_probe = self.cache, self.pause, self.cancel, self.on_probe
+
+        def observe(u, r):
+            if not r.cached:
+                rate.record(host_of(u), r.code, r.retry_after, r.elapsed)
+                if on_probe is not None:
+                    on_probe(r)
+
+        def fetch_one(slot, u):
+            while pause.is_set() and not cancel.is_set():
+                time.sleep(0.2)
+            if cancel.is_set():
+                return slot, u, CANCELLED_RESULT
+            try:
+                r = cached_probe_url(u, cache, probe_url, caps=caps, deadlines=deadlines)
+                observe(u, r)
+                return slot, u, r
+            except Exception:
+                return slot, u, ERR_RESULT
+
+        async def fetch_one_async(slot, u):
+            while pause.is_set() and not cancel.is_set():
+                await asyncio.sleep(0.2)
+            if cancel.is_set():
+                return slot, u, CANCELLED_RESULT
+            try:
+                r = await async_cached_probe_url(u, cache, async_probe_url, caps=caps, deadlines=deadlines)
+                observe(u, r)
+                return slot, u, r
+            except Exception:
+                return slot, u, ERR_RESULT
+
+        return fetch_one, fetch_one_async
+
+    # --- çalıştırma ---
+
+    def run(self, urls: Iterable[str]) -> Iterator[ProbeRecord]:
+        """Her girdi satırı için bir ProbeRecord üretir (bitiş sırasıyla). İptalde kalanlar üretilmez."""
+        rate = HostRateController(max_limit=self.per_host_limit)
+        retry = RetryPolicy(max_attempts=self.max_attempts, budget=0)
+        deadlines = HostTimeouts.for_timeout(self.timeout)
+        caps = self.caps if self.caps is not None else HostCapabilities()
+        fetch_one, fetch_one_async = self._task_fns(rate, caps, deadlines)
+
+        if self.backend == "asyncio":
+            executor = AsyncProbeExecutor(max_concurrency=self.concurrency)
+            task_fn = fetch_one_async
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency)
+            task_fn = fetch_one
+
+        sched = HostFairScheduler(per_host_limit=self.per_host_limit, limit_fn=rate.limit)
+        source = iter(urls)
+        exhausted = False
+        read_count = 0
+        seen_hosts = set()
+        slot_of: Dict[str, int] = {}                  # kanonik URL -> yoklama yuvası
+        key_of: Dict[int, str] = {}                   # dedup: bitmemiş yuva -> kanonik URL
+        waiters: Dict[int, List[Tuple[int, str]]] = {}  # yuva -> sonucu bekleyen (index, url) satırları
+        waiting = 0                                   # sonucu bekleyen toplam satır
+        # dedup: biten yuvaların sonucu (sonraki tekrarlar için), en fazla dedup_memory kadar (LRU)
+        finished: "OrderedDict[int, Tuple[str, ProbeResult]]" = OrderedDict()
+        ready: Deque[ProbeRecord] = deque()
+        in_flight = set()
+        fut_host = {}
+
+        def finish(slot, r):
+            nonlocal waiting
+            rows = waiters.pop(slot, ())
+            waiting -= len(rows)
+            for i, u in rows:
+                ready.append(ProbeRecord(i, u, r))
+            if self.dedup:
+                finished[slot] = (key_of.pop(slot), r)
+                while len(finished) > self.dedup_memory:
+                    _old, (old_key, _r) = finished.popitem(last=False)
+                    slot_of.pop(old_key, None)
+
+        def refill():
+            nonlocal exhausted, read_count, waiting
+            chunk = []
+            # Üretilmeyi bekleyen satır varken okunmaz; bekleyen satırlar (tekrarlar dahil) pencereye sayılır
+            while not exhausted and not ready and waiting < self.lookahead:
+                try:
+                    u = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                i = read_count
+                read_count += 1
+                slot = i
+                if self.dedup:
+                    key = canonical_url(u)
+                    slot = slot_of.get(key)
+                    if slot is not None:
+                        done = finished.get(slot)
+                        if done is not None:
+                            finished.move_to_end(slot)
+                            ready.append(ProbeRecord(i, u, done[1]))
+                        else:
+                            waiters[slot].append((i, u))
+                            waiting += 1
+                        continue
+                    slot = slot_of[key] = i
+                    key_of[slot] = key
+                waiters[slot] = [(i, u)]
+                waiting += 1
+                chunk.append((slot, u))
+            if not chunk:
+                return
+            # Yeni görülen hostlar toplu ve paralel çözülür; çözümlenemeyenler işçiye gitmez
+            dead = set()
+            if self.dns_preresolve:
+                # Vekil üzerinden gidilen hostları yerelde çözmek gerekmez (çoğu kurumsal ağda çözülemez de)
+                new_hosts = {host_of(u) for _s, u in chunk if proxy_for_url(u) is None} - seen_hosts
+                seen_hosts.update(new_hosts)
+                if new_hosts:
+                    try:
+                        dead = DEFAULT_DNS_CACHE.pre_resolve(new_hosts)
+                    except Exception:
+                        dead = set()
+            for slot, u in chunk:
+                if dead and host_of(u) in dead:
+                    finish(slot, DNS_ERR_RESULT)
+                else:
+                    sched.add(slot, u)
+            # Yeniden deneme bütçesi okunan satır sayısıyla büyür
+            retry.budget = RetryPolicy.budget_for(read_count, self.retry_budget_ratio)
+
+        def fill_window(ex):
+            while len(in_flight) < self.concurrency:
+                nxt = sched.next()
+                if nxt is None:
+                    break
+                slot, u, host = nxt
+                fut = ex.submit(task_fn, slot, u)
+                fut_host[fut] = host
+                in_flight.add(fut)
+
+        with executor as ex:
+            try:
+                refill()
+                fill_window(ex)
+                while True:
+                    while ready:
+                        yield ready.popleft()
+                    if self.cancel.is_set():
+                        break
+                    if exhausted and not in_flight and not sched.pending():
+                        break
+                    if self.pause.is_set():
+                        time.sleep(0.2)
+                        continue
+
+                    done, in_flight_now = concurrent.futures.wait(
+                        in_flight, timeout=0.05, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    in_flight.clear()
+                    in_flight.update(in_flight_now)
+                    for fut in done:
+                        sched.done(fut_host.pop(fut, ""))
+                        try:
+                            slot, u, r = fut.result()
+                        except Exception:
+                            continue
+                        # Geçici hata: geri çekilme sonrası kuyruğun sonuna (bütçe izin verdikçe)
+                        delay = retry.next_delay(slot, r)
+                        if delay is not None and not self.cancel.is_set():
+                            sched.defer(slot, u, delay)
+                            continue
+                        finish(slot, r)
+
+                    refill()
+                    if not self.pause.is_set() and not self.cancel.is_set():
+                        fill_window(ex)
+                    if not in_flight and sched.pending():
+                        # Tüm bekleyen işler yavaşla / yeniden deneme beklemesinde
+                        time.sleep(min(0.2, sched.next_deferred_in() or 0.05))
+            finally:
+                # Erken kapatılan üretici: kuyruktaki işler başlamadan dönsün (executor kapanışı beklemesin)
+                if not exhausted or in_flight:
+                    self.cancel.set()
+        DEFAULT_POOL.close_all()
+
+    async def arun(self, urls: Iterable[str]) -> AsyncIterator[ProbeRecord]:
+        """run() karşılığı async üretici; motor ayrı bir iş parçacığında ilerler, olay döngüsü bloklanmaz."""
+        loop = asyncio.get_running_loop()
+        gen = self.run(urls)
+        done = object()
+        completed = False
+        try:
+            while True:
+                rec = await loop.run_in_executor(None, next, gen, done)
+                if rec is done:
+                    completed = True
+                    break
+                yield rec
+        finally:
+            if not completed:
+                self.cancel.set()
+                await loop.run_in_executor(None, gen.close)
+
+
+def probe_urls(urls: Iterable[str], **options) -> Iterator[ProbeRecord]:
+    """Kısayol: ProbeEngine(**options).run(urls)"""
+    return ProbeEngine(**options).run(urls)
+
+
+def aprobe_urls(urls: Iterable[str], **options) -> AsyncIterator[ProbeRecord]:
+    """Kısayol: ProbeEngine(**options).arun(urls)"""
+    return ProbeEngine(**options).arun(urls)
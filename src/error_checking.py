@@ -95,5 +95,8 @@ def msg_unsupported_filetype():
 def msg_output_write_error(e: Exception):
     show_error(f"Çıktı yazılırken hata: {e}")
 
+def msg_probe_error(e: Exception):
+    show_error(f"Yoklama yarıda kaldı: {e}\nTamamlanan satırlar çıktıya yazıldı; aynı dosyayla yeniden başlatınca kalanlar yoklanır.")
+
 def msg_generic_error(text: str):
     show_error(text)
@@ -9,25 +9,32 @@ import sys
 import re
 import time
 import threading
-import concurrent.futures
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
 
-from src.internet_connection import is_internet_ok, status_and_size_mb, INTERNET_MSG
+from src.internet_connection import is_internet_ok, INTERNET_MSG
+from src.probe_cache import ProbeCache, default_cache_path
+from src.host_capabilities import HostCapabilities
+from src.connectivity import ConnectivityMonitor
+from src.engine import ProbeEngine
+from src.sharding import probe_urls_sharded
+from src.journal import DEFAULT_JOURNAL_MAX_AGE, ProbeJournal, journal_path_for, input_fingerprint
+from src.incremental import PreviousOutput, summary_path_for, write_summary
 from src.error_checking import (
     is_file_locked_for_write, show_info, show_warning, show_error,
     msg_need_input_file, msg_input_not_found, msg_need_output_dir,
     msg_need_excel_header, msg_file_open_excel, msg_file_open_xml,
     msg_file_state_unknown, msg_count_result, msg_read_error,
-    msg_unsupported_filetype, msg_output_write_error, msg_generic_error,
+    msg_unsupported_filetype, msg_output_write_error, msg_probe_error, msg_generic_error,
 )
-from src.reader import is_excel, is_xml, read_urls_from_xlsx, read_urls_from_wxr
-from src.writer import XlsxBuilder, url_filename_no_ext, url_extension
+from src.reader import is_excel, is_xml, read_urls_from_xlsx, read_urls_from_wxr, split_header_names
+from src.writer import OUTPUT_WRITERS, open_output, url_filename_no_ext, url_extension
 
 
 class App(tk.Tk):
-    def __init__(self, icon_path_ico: str, logo_path: str, about_path: str, license_path: str, thanks_path: str):
+    def __init__(self, icon_path_ico: str, logo_path: str, about_path: str, license_path: str, thanks_path: str,
+                 probe_backend: str = "thread"):
         super().__init__()
         self.title("URL Boyut Hesaplayıcı")
         self.geometry("1250x350")
@@ -52,6 +59,45 @@ class App(tk.Tk):
         import os as _os
         self.max_workers = min(32, (_os.cpu_count() or 4) * 4)
 
+        # Yoklama motoru: "thread" (ThreadPoolExecutor) veya "asyncio" (tek olay döngüsü)
+        self.probe_backend = probe_backend if probe_backend in ("thread", "asyncio") else "thread"
+        self.async_concurrency = 500
+        # Host başına en fazla eşzamanlı istek (adil zamanlayıcı)
+        self.per_host_limit = 8
+        # Geçici hata (zaman aşımı, bağlantı kopması, 429/5xx) alan URL için en fazla deneme;
+        # çalışma başına toplam yeniden deneme URL sayısının retry_budget_ratio katıyla sınırlı
+        self.max_attempts = 3
+        self.retry_budget_ratio = 0.1
+        # Alt süreç sayısı: 1 => tek süreç; >1 => URL listesi süreçlere bölünür (çok büyük listeler için)
+        self.processes = 1
+        # Yarım kalan çalışmalar için kontrol noktası günlüğü (aynı girdide kaldığı yerden devam);
+        # journal_max_age saniyeden eski günlükteki sonuçlar bayat sayılır, çalışma baştan başlar
+        self.journal_enabled = True
+        self.journal_max_age = DEFAULT_JOURNAL_MAX_AGE
+        # Artımlı çalışma: önceki sonuç dosyası verilirse yalnızca yeni URL'ler (ve istenirse OK olmayanlar /
+        # dosya max_age_days günden eskiyse tümü) yoklanır, gerisi taşınır; yanına değişiklik özeti yazılır
+        self.previous_output_path = None
+        self.previous_max_age_days = None
+        self.previous_recheck_failed = False
+        # İstek başına üst süre (sn); host gecikmesi öğrenildikçe bağlanma/okuma süreleri buna göre daralır
+        self.probe_timeout = 15.0
+
+        # Çıktı biçimi: "xlsx" | "csv" | "jsonl" | "sqlite" (büyük çalışmalarda düz biçimler XML/ZIP üretmez)
+        self.output_format = "xlsx"
+        # Çıktıda tekrar eden Uzantı/Durum değerleri için paylaşılan dize tablosu (sharedStrings.xml)
+        self.xlsx_shared_strings = False
+
+        # Diskte yoklama önbelleği (SQLite); cache_path None => kullanıcı önbellek klasörü
+        self.cache_enabled = True
+        self.cache_path = None
+        self.cache_ttl = 24 * 3600.0
+
+        # Host yetenek belleği (HEAD/Content-Length/Range); None => yalnızca çalışma süresince
+        self.host_caps_path = os.path.join(os.path.dirname(default_cache_path()), "host_caps.json")
+
+        # Yoklamadan önce tüm farklı hostları paralel DNS çözümlemesi
+        self.dns_preresolve = True
+
         # === Ana yerleşim (SOL logo paneli + SAĞ içerik) ===
         container = ttk.Frame(self)
         container.grid(row=0, column=0, sticky="nsew")
@@ -151,6 +197,9 @@ class App(tk.Tk):
         self.btn_count = ttk.Button(btn_bar, text="URL Ön Sayım", command=self.on_count_click, width=15)
         self.btn_count.pack(side="left", padx=6)
 
+        self.btn_settings = ttk.Button(btn_bar, text="Gelişmiş Ayarlar…", command=self.on_settings, width=18)
+        self.btn_settings.pack(side="left", padx=6)
+
         self.btn_about = ttk.Button(root, text="Uygulama Hakkında", command=self.on_about, width=18)
         self.btn_about.grid(row=6, column=2, sticky="e", **pad)
 
@@ -460,6 +509,119 @@ class App(tk.Tk):
         finally:
             self.about_window = None
 
+    # --- Gelişmiş ayarlar (CLI seçeneklerinin GUI karşılıkları) ---
+
+    def on_settings(self):
+        if hasattr(self, "settings_window") and self.settings_window and self.settings_window.winfo_exists():
+            try:
+                self.settings_window.deiconify()
+                self.settings_window.lift()
+                self.settings_window.focus_force()
+            except Exception:
+                pass
+            return
+
+        win = tk.Toplevel(self)
+        self.settings_window = win
+        win.title("Gelişmiş Ayarlar")
+        win.resizable(False, False)
+        win.transient(self)
+        win.protocol("WM_DELETE_WINDOW", lambda: self._close_settings())
+        try:
+            if os.path.isfile(self.icon_path_ico):
+                win.iconbitmap(self.icon_path_ico)
+        except Exception:
+            pass
+
+        frm = ttk.Frame(win, padding=16)
+        frm.grid(row=0, column=0, sticky="nsew")
+        try:
+            frm.grid_columnconfigure(1, weight=1)
+        except Exception:
+            pass
+        pad = {"padx": 6, "pady": 5}
+
+        var_backend = tk.StringVar(value=self.probe_backend)
+        var_processes = tk.StringVar(value=str(self.processes))
+        var_format = tk.StringVar(value=self.output_format if self.output_format in OUTPUT_WRITERS else "xlsx")
+        var_shared = tk.BooleanVar(value=bool(self.xlsx_shared_strings))
+        var_previous = tk.StringVar(value=self.previous_output_path or "")
+        var_max_age = tk.StringVar(value="" if self.previous_max_age_days is None else f"{self.previous_max_age_days:g}")
+        var_recheck = tk.BooleanVar(value=bool(self.previous_recheck_failed))
+
+        # Yoklama
+        ttk.Label(frm, text="Yoklama motoru:").grid(row=0, column=0, sticky="w", **pad)
+        ttk.Combobox(frm, textvariable=var_backend, values=("thread", "asyncio"), state="readonly",
+                     width=10).grid(row=0, column=1, sticky="w", **pad)
+        ttk.Label(frm, text="Alt süreç sayısı:").grid(row=1, column=0, sticky="w", **pad)
+        ttk.Spinbox(frm, textvariable=var_processes, from_=1, to=max(1, os.cpu_count() or 1), width=6
+                    ).grid(row=1, column=1, sticky="w", **pad)
+
+        # Çıktı
+        ttk.Label(frm, text="Çıktı biçimi:").grid(row=2, column=0, sticky="w", **pad)
+        ttk.Combobox(frm, textvariable=var_format, values=tuple(OUTPUT_WRITERS), state="readonly",
+                     width=10).grid(row=2, column=1, sticky="w", **pad)
+        ttk.Checkbutton(frm, text="xlsx: tekrar eden değerler için paylaşılan dize tablosu",
+                        variable=var_shared).grid(row=3, column=1, columnspan=2, sticky="w", **pad)
+
+        # Artımlı çalışma
+        ttk.Label(frm, text="Önceki sonuç dosyası:").grid(row=4, column=0, sticky="w", **pad)
+        ttk.Entry(frm, textvariable=var_previous, width=50).grid(row=4, column=1, sticky="we", **pad)
+
+        def _browse_previous():
+            p = filedialog.askopenfilename(parent=win, title="Önceki sonuç dosyasını seçin",
+                                           filetypes=[("Excel Çalışma Kitabı (*.xlsx)", "*.xlsx"), ("Tüm Dosyalar", "*.*")])
+            if p:
+                var_previous.set(p)
+
+        ttk.Button(frm, text="Gözat…", command=_browse_previous, width=10).grid(row=4, column=2, sticky="e", **pad)
+        ttk.Label(frm, text="Önceki dosya en fazla (gün):").grid(row=5, column=0, sticky="w", **pad)
+        ttk.Entry(frm, textvariable=var_max_age, width=8).grid(row=5, column=1, sticky="w", **pad)
+        ttk.Checkbutton(frm, text="Önceki dosyada durumu OK olmayanları yeniden yokla",
+                        variable=var_recheck).grid(row=6, column=1, columnspan=2, sticky="w", **pad)
+
+        def _save():
+            try:
+                processes = int(var_processes.get())
+                if processes < 1:
+                    raise ValueError
+            except ValueError:
+                show_error("Alt süreç sayısı en az 1 olmalı.", title="Gelişmiş Ayarlar"); return
+            max_age_text = var_max_age.get().strip().replace(",", ".")
+            try:
+                max_age = float(max_age_text) if max_age_text else None
+                if max_age is not None and max_age < 0:
+                    raise ValueError
+            except ValueError:
+                show_error("Gün sayısı boş ya da sıfır veya pozitif bir sayı olmalı.", title="Gelişmiş Ayarlar")
+                return
+            previous = var_previous.get().strip() or None
+            if previous and not os.path.isfile(previous):
+                show_error("Önceki sonuç dosyası bulunamadı.", title="Gelişmiş Ayarlar"); return
+
+            self.probe_backend = var_backend.get() if var_backend.get() in ("thread", "asyncio") else "thread"
+            self.processes = processes
+            self.output_format = var_format.get() if var_format.get() in OUTPUT_WRITERS else "xlsx"
+            self.xlsx_shared_strings = bool(var_shared.get())
+            self.previous_output_path = previous
+            self.previous_max_age_days = max_age
+            self.previous_recheck_failed = bool(var_recheck.get())
+            self._close_settings()
+
+        btns = ttk.Frame(frm)
+        btns.grid(row=7, column=0, columnspan=3, sticky="e", pady=(12, 0))
+        ttk.Button(btns, text="Kaydet", command=_save, width=12).pack(side="left", padx=6)
+        ttk.Button(btns, text="Vazgeç", command=self._close_settings, width=12).pack(side="left", padx=6)
+
+    def _close_settings(self):
+        try:
+            if hasattr(self, "settings_window") and self.settings_window:
+                self.settings_window.destroy()
+        except Exception:
+            pass
+        finally:
+            self.settings_window = None
+
     # --- İnternet açılış kontrolü ---
 
     def _check_internet_on_launch(self):
@@ -536,7 +698,7 @@ class App(tk.Tk):
             if is_excel(path):
                 if not header:
                     msg_need_excel_header(); return
-                urls = read_urls_from_xlsx(path, header)
+                urls = read_urls_from_xlsx(path, split_header_names(header))
             elif is_xml(path):
                 urls = read_urls_from_wxr(path)
             else:
@@ -573,7 +735,8 @@ class App(tk.Tk):
             msg_need_output_dir(); return
 
         base = os.path.splitext(os.path.basename(path))[0]
-        save_path = os.path.join(save_dir, f"{base}_sonuc.xlsx")
+        fmt = self.output_format if self.output_format in OUTPUT_WRITERS else "xlsx"
+        save_path = os.path.join(save_dir, f"{base}_sonuc.{fmt}")
         save_path = self._unique_save_path(save_path)
 
         # UI state
@@ -586,6 +749,8 @@ class App(tk.Tk):
         try:
             self.btn_count.pack_forget()
             self.btn_count.pack(side="left", padx=6)
+            self.btn_settings.pack_forget()
+            self.btn_settings.pack(side="left", padx=6)
         except Exception:
             pass
 
@@ -614,8 +779,10 @@ class App(tk.Tk):
         self.btn_browse.config(state="disabled")
         try:
             self.btn_count.config(state="disabled")
+            self.btn_settings.config(state="disabled")
         except Exception:
             pass
+        self._close_settings()  # çalışma sürerken ayarlar değişmez
 
         self.worker = threading.Thread(target=self._run_worker, args=(path, header, save_path), daemon=True)
         self.worker.start()
@@ -665,7 +832,7 @@ class App(tk.Tk):
             if is_excel(input_path):
                 if not header_name:
                     raise RuntimeError('Excel için URL sütun adını girin (örn. "URL").')
-                urls = read_urls_from_xlsx(input_path, header_name)
+                urls = read_urls_from_xlsx(input_path, split_header_names(header_name))
             elif is_xml(input_path):
                 urls = read_urls_from_wxr(input_path)
             else:
@@ -680,10 +847,13 @@ class App(tk.Tk):
 
         self.after(0, lambda: (self._set_progress_widgets_visible(True), self._init_progress(total)))
 
-        builder = XlsxBuilder()
-        results = [None] * total
+        # Yalnızca henüz yazılamayan (sıra dışı gelen) satırların (size_mb, status) sonucu tutulur
+        pending = {}
         completed = 0
 
+        # Pasif bağlantı izleme: yoklama sonuçları sağlıklıysa izleyici ağa istek atmaz
+        netmon = ConnectivityMonitor()
+
         # İnternet izleyicisi
         def net_watch():
             fail_count = 0
@@ -693,7 +863,7 @@ class App(tk.Tk):
 
             while not self.cancel_event.is_set():
                 try:
-                    online = is_internet_ok(timeout=3.0)
+                    online = netmon.check(timeout=3.0)
                 except Exception:
                     online = False
 
@@ -725,7 +895,7 @@ class App(tk.Tk):
                 recovered = False
                 while countdown > 0 and not self.cancel_event.is_set():
                     try:
-                        online_now = is_internet_ok(timeout=2.5)
+                        online_now = is_internet_ok(timeout=2.5, use_cache=False)
                     except Exception:
                         online_now = False
                     if online_now:
@@ -762,7 +932,7 @@ class App(tk.Tk):
                         self.reconnect_retry_mode.set()
                         fail_count = 0
                         try:
-                            online_now = is_internet_ok(timeout=2.5)
+                            online_now = is_internet_ok(timeout=2.5, use_cache=False)
                         except Exception:
                             online_now = False
                         if online_now:
@@ -780,89 +950,173 @@ class App(tk.Tk):
         final_path = save_path
         tmp_path = save_path + ".tmp"
 
-        def fetch_one(i_u):
-            i, u = i_u
-            while self.net_waiting.is_set() and not self.cancel_event.is_set():
-                time.sleep(0.2)
-            if self.cancel_event.is_set():
-                fname = url_filename_no_ext(u)
-                return (i, u, fname, len(fname), url_extension(u), None, "ERR")
+        # Yoklama önbelleği (açılamazsa önbelleksiz devam edilir)
+        cache = None
+        if self.cache_enabled:
             try:
-                fname = url_filename_no_ext(u)
-                ext = url_extension(u)
-                length = len(fname)
-                status, size_mb = status_and_size_mb(u)
-                return (i, u, fname, length, ext, size_mb, status)
+                cache = ProbeCache(self.cache_path, ttl=self.cache_ttl)
             except Exception:
-                fname = url_filename_no_ext(u)
-                return (i, u, fname, len(fname), url_extension(u), None, "ERR")
+                cache = None
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as ex:
-            idx_iter = iter(enumerate(urls))
-            in_flight = set()
-            try:
-                for _ in range(min(self.max_workers, total)):
-                    i, u = next(idx_iter)
-                    in_flight.add(ex.submit(fetch_one, (i, u)))
-            except StopIteration:
-                pass
+        # Host yetenekleri: HEAD desteklemeyen host'ta doğrudan Range GET vb.
+        caps = HostCapabilities(self.host_caps_path)
+        caps.load()
 
-            while in_flight and not self.cancel_event.is_set():
-                while self.net_waiting.is_set() and not self.cancel_event.is_set():
-                    time.sleep(0.2)
+        # Kontrol noktası günlüğü: aynı girdinin yarım kalmış çalışmasından devam
+        journal = None
+        if self.journal_enabled:
+            try:
+                journal = ProbeJournal(journal_path_for(input_path), input_fingerprint(input_path),
+                                       max_age=self.journal_max_age)
+            except Exception:
+                journal = None
+        previous = None
+        if self.previous_output_path:
+            try:
+                previous = PreviousOutput(self.previous_output_path, max_age_days=self.previous_max_age_days,
+                                          recheck_failed=self.previous_recheck_failed)
+            except Exception:
+                previous = None
+        carried = bytearray(total)  # önceki dosyadan taşınan satırlar
+        todo = []  # yoklanacak satırların indeksleri
+        for i, u in enumerate(urls):
+            prev = journal.lookup(u) if journal is not None else None
+            if prev is None and previous is not None:
+                prev = previous.lookup(u)
+                carried[i] = prev is not None
+            if prev is not None:
+                pending[i] = prev
+                completed += 1
+            else:
+                todo.append(i)
+        todo_urls = [urls[i] for i in todo]
+        changes = previous.tracker() if previous is not None else None
+        if completed:
+            self.after(0, lambda c=completed, t=total: self._update_progress(c, t, "--:--:--"))
 
-                done, in_flight = concurrent.futures.wait(
-                    in_flight, timeout=0.05, return_when=concurrent.futures.FIRST_COMPLETED
-                )
+        # Çıktı: sonuçlar geldikçe girdi sırasıyla doğrudan .tmp'ye yazılır (sıra dışı gelenler bekletilir)
+        try:
+            fmt = self.output_format if self.output_format in OUTPUT_WRITERS else "xlsx"
+            writer = open_output(tmp_path, fmt, shared_strings=self.xlsx_shared_strings)
+        except Exception as e:
+            if journal is not None:
+                journal.close()
+            if cache is not None:
+                cache.close()
+            self.after(0, lambda e=e: msg_output_write_error(e))
+            self.after(0, self._reset_ui)
+            return
+        processed = 0
+        ok_count = 0
+        next_row = 0
+        write_error = None
+
+        def write_ready():
+            nonlocal processed, ok_count, next_row
+            while next_row < total and next_row in pending:
+                u = urls[next_row]
+                size_mb, status = pending[next_row]
+                fname = url_filename_no_ext(u)
+                writer.add_row(u, fname, len(fname), url_extension(u), size_mb, status)
+                del pending[next_row]
+                if changes is not None:
+                    changes.add(u, (size_mb, status), bool(carried[next_row]))
+                processed += 1
+                if status == "OK":
+                    ok_count += 1
+                next_row += 1
+
+        # Ortak yoklama motoru: tekilleştirme, host-adil zamanlama, AIMD, yeniden deneme,
+        # uyarlanabilir zaman aşımı ve DNS ön çözümleme motorun içinde
+        engine_options = dict(
+            backend=self.probe_backend,
+            concurrency=self.async_concurrency if self.probe_backend == "asyncio" else self.max_workers,
+            timeout=self.probe_timeout,
+            per_host_limit=self.per_host_limit,
+            max_attempts=self.max_attempts,
+            retry_budget_ratio=self.retry_budget_ratio,
+            dns_preresolve=self.dns_preresolve,
+            pause=self.net_waiting,
+            cancel=self.cancel_event,
+        )
+        if self.processes > 1:
+            # Alt süreçler önbelleği ve host yeteneklerini kendileri açar
+            if cache is not None:
+                cache.close()
+                cache = None
+            records = probe_urls_sharded(todo_urls, processes=self.processes, cache_enabled=self.cache_enabled,
+                                         cache_path=self.cache_path, cache_ttl=self.cache_ttl,
+                                         host_caps_path=self.host_caps_path, **engine_options)
+        else:
+            records = ProbeEngine(cache=cache, caps=caps, on_probe=netmon.record, **engine_options).run(todo_urls)
 
-                for fut in done:
-                    if self.cancel_event.is_set():
-                        break
+        resumed = completed
+        probe_error = None
+        try:
+            for rec in records:
+                pending[todo[rec.index]] = (rec.result.size_mb, rec.result.status_text)
+                completed += 1
+                if write_error is None:
                     try:
-                        i, u, fname, length, ext, size_mb, status = fut.result()
+                        write_ready()
+                    except Exception as e:  # disk dolu vb.: yoklamayı sürdürmenin anlamı yok
+                        write_error = e
+                        self.cancel_event.set()
+                if journal is not None:
+                    try:
+                        journal.record(rec.url, rec.result)
                     except Exception:
-                        i = None
-                    if i is not None and 0 <= i < total:
-                        results[i] = (u, fname, length, ext, size_mb, status)
-                        completed += 1
-
-                    if not self.cancel_event.is_set():
-                        if not self.net_waiting.is_set():
-                            try:
-                                i2, u2 = next(idx_iter)
-                                in_flight.add(ex.submit(fetch_one, (i2, u2)))
-                            except StopIteration:
-                                pass
+                        journal = None
 
                 now = time.time()
                 if now - last_update >= 0.05 or completed == total:
                     elapsed = now - start_ts
                     eta = "--:--:--"
-                    if completed > 0:
-                        per = elapsed / max(1, completed)
+                    if completed > resumed:
+                        per = elapsed / max(1, completed - resumed)
                         remain = max(0, int(round(per * (total - completed))))
                         h, rem = divmod(remain, 3600)
                         m, s = divmod(rem, 60)
                         eta = f"{h}:{m:02d}:{s:02d}"
                     self.after(0, lambda c=completed, t=total, e=eta: self._update_progress(c, t, e))
                     last_update = now
+        except Exception as e:  # alt süreç/motor hatası: eksik sonuçla "tamamlandı" denmez, kapanış yine yapılır
+            probe_error = e
+            self.cancel_event.set()
 
-        for rec in results:
-            if rec is None:
-                continue
-            u, fname, length, ext, size_mb, status = rec
-            builder.add_row(u, fname, length, ext, size_mb, status)
-
-        processed = sum(1 for r in results if r is not None)
-        ok_count  = sum(1 for r in results if r is not None and r[5] == "OK")
-        other_cnt = processed - ok_count
+        # Çalışma bitti: günlüğü diske aktar, önbelleği kapat, host yeteneklerini kaydet
+        if journal is not None:
+            try:
+                journal.close()
+            except Exception:
+                journal = None
+        if cache is not None:
+            try:
+                cache.close()
+            except Exception:
+                pass
+        try:
+            caps.save()
+        except Exception:
+            pass
 
+        # Kalan satırları girdi sırasıyla yaz (iptalde eksik satırların ardından gelenler de yazılır)
         try:
-            builder.save(tmp_path)
+            if write_error is not None:
+                raise write_error
+            while next_row < total:
+                write_ready()
+                next_row += 1
+            writer.close()
         except Exception as e:
+            try:
+                writer.close()
+            except Exception:
+                pass
             self.after(0, lambda e=e: msg_output_write_error(e))
             self.after(0, self._reset_ui)
             return
+        other_cnt = processed - ok_count
 
         try:
             if os.path.exists(final_path):
@@ -871,6 +1125,17 @@ class App(tk.Tk):
         except Exception:
             final_path = tmp_path  # .tmp kalsın
 
+        # Eksiksiz biten ve çıktısı yazılan çalışmanın günlüğüne gerek kalmaz
+        if journal is not None and completed == total and not self.cancel_event.is_set():
+            journal.discard()
+
+        # Artımlı çalışma: önceki dosyaya göre değişiklik özeti
+        if changes is not None and not self.cancel_event.is_set():
+            try:
+                write_summary(changes.summary(), summary_path_for(final_path), previous.path)
+            except Exception:
+                pass
+
         cancelled = self.cancel_event.is_set()
         try:
             self.was_cancelled = bool(cancelled)
@@ -879,13 +1144,16 @@ class App(tk.Tk):
 
         def after_msg():
             try:
-                if getattr(self, "net_cancelled_by_user", None) and self.net_cancelled_by_user.is_set():
-                    info = INTERNET_MSG["net_cancelled"]
-                elif cancelled:
-                    info = INTERNET_MSG["cancelled"]
+                if probe_error is not None:
+                    msg_probe_error(probe_error)
                 else:
-                    info = INTERNET_MSG["done"]
-                show_info(info, title="URL Boyut Hesaplayıcı")
+                    if getattr(self, "net_cancelled_by_user", None) and self.net_cancelled_by_user.is_set():
+                        info = INTERNET_MSG["net_cancelled"]
+                    elif cancelled:
+                        info = INTERNET_MSG["cancelled"]
+                    else:
+                        info = INTERNET_MSG["done"]
+                    show_info(info, title="URL Boyut Hesaplayıcı")
             finally:
                 try:
                     self.lbl_eta.grid()
@@ -961,6 +1229,9 @@ class App(tk.Tk):
         try:
             self.btn_count.pack_forget()
             self.btn_count.pack(side="left", padx=6)
+            self.btn_settings.pack_forget()
+            self.btn_settings.pack(side="left", padx=6)
+            self.btn_settings.config(state="normal")
         except Exception:
             pass
         self.ent_file.config(state="normal")
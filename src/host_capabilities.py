@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Host yetenek belleği: hangi host HEAD kabul ediyor, HEAD'de Content-Length veriyor,
+Range isteğine 206 + Content-Range ile uyuyor?
+- Çalışma sırasında gözlemlerden öğrenilir; yeterli ve tutarlı gözlem olunca
+  o host'taki sonraki URL'ler doğrudan işe yarayan istek biçimine gider.
+- İsteğe bağlı olarak JSON dosyasına yazılıp sonraki çalıştırmalarda kullanılır.
+Harici paket YOK.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Yoklama stratejileri
+STRATEGY_AUTO = "auto"    # HEAD, gerekirse Range GET (varsayılan)
+STRATEGY_HEAD = "head"    # yalnızca HEAD (boyut HEAD'den gelir)
+STRATEGY_RANGE = "range"  # doğrudan Range GET (HEAD atlanır)
+
+# HEAD'in desteklenmediğini gösteren kodlar (GET başarılıysa)
+HEAD_REJECT_CODES = (403, 405, 501)
+
+# Kalıcı kayıtlar bu süreden eskiyse yok sayılır
+DEFAULT_MAX_AGE = 30 * 24 * 3600.0
+
+_FIELDS = ("head_ok", "head_rejected", "head_len", "head_no_len", "range_ok", "range_ignored")
+
+
+class HostCapabilities:
+    """
+    - min_observations: bir yeteneğe karar vermek için gereken tutarlı gözlem sayısı
+    - path: verilirse load()/save() bu JSON dosyasını kullanır
+    İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, path: Optional[str] = None, min_observations: int = 2,
+                 max_age: float = DEFAULT_MAX_AGE):
+        self.path = path
+        self.min_observations = max(1, int(min_observations))
+        self.max_age = float(max_age)
+        self._hosts: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _rec(self, host: str) -> Dict[str, float]:
+        rec = self._hosts.get(host)
+        if rec is None:
+            rec = self._hosts[host] = dict.fromkeys(_FIELDS, 0)
+            rec["updated"] = 0.0
+        return rec
+
+    def strategy(self, host: str) -> str:
+        """Host için önerilen istek biçimi."""
+        n = self.min_observations
+        with self._lock:
+            rec = self._hosts.get(host)
+            if rec is None:
+                return STRATEGY_AUTO
+            if rec["head_rejected"] >= n and rec["head_ok"] == 0:
+                return STRATEGY_RANGE
+            if rec["head_ok"] >= n and rec["head_len"] >= n and rec["head_no_len"] == 0:
+                return STRATEGY_HEAD
+            if rec["head_no_len"] >= n and rec["head_len"] == 0 and rec["range_ok"] >= n and rec["range_ignored"] == 0:
+                return STRATEGY_RANGE
+            return STRATEGY_AUTO
+
+    def observe(self, host: str, head_code: Optional[int] = None, head_has_length: bool = False,
+                get_code: Optional[int] = None, get_has_range: bool = False) -> None:
+        """
+        Tek yoklamanın gözlemleri. İstek gönderilmediyse (ya da ağ hatasıyla yanıt alınamadıysa) ilgili kod None.
+        - HEAD 2xx: HEAD destekleniyor (+ Content-Length var/yok)
+        - HEAD 403/405/501 + GET 2xx: HEAD desteklenmiyor (geçici ağ hataları reddetme sayılmaz)
+        - GET 206 + Content-Range: Range destekleniyor; GET 200: Range yok sayılıyor
+        """
+        get_ok = get_code is not None and 200 <= get_code < 300
+        with self._lock:
+            rec = self._rec(host)
+            if head_code is not None and 200 <= head_code < 300:
+                rec["head_ok"] += 1
+                rec["head_len" if head_has_length else "head_no_len"] += 1
+            elif get_ok and head_code in HEAD_REJECT_CODES:
+                rec["head_rejected"] += 1
+            if get_ok:
+                if get_code == 206 and get_has_range:
+                    rec["range_ok"] += 1
+                else:
+                    rec["range_ignored"] += 1
+            rec["updated"] = time.time()
+
+    # --- kalıcılık ---
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        with self._lock:
+            for host, rec in (data or {}).items():
+                if not isinstance(rec, dict) or now - float(rec.get("updated", 0)) > self.max_age:
+                    continue
+                clean = {k: int(rec.get(k, 0)) for k in _FIELDS}
+                clean["updated"] = float(rec.get("updated", 0))
+                self._hosts[host] = clean
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = {h: dict(r) for h, r in self._hosts.items()}
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"  # alt süreçler aynı dosyayı kaydedebilir
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Host başına gecikmeye uyarlanan zaman aşımları.
+- Her host için son bağlantı kurma (TCP+TLS) ve ilk yanıt (TTFB) süreleri tutulur.
+- Bağlanma/okuma süre sınırı, yüksek yüzdelikten (varsayılan p95) türetilir ve taban/tavan ile sınırlanır:
+  hızlı host takıldığında çabuk vazgeçilir, yavaş olduğu bilinen host yine yeterli süre alır.
+- Yeterli örnek yoksa varsayılan süreler kullanılır.
+- Zaman aşımları gecikme örneği sayılmaz, ayrıca sayılır: art arda her aşımda o host'un süre sınırı
+  yarıya iner (tabana kadar), başarılı bir yanıt sayacı sıfırlar. Böylece takılan host kendi sınırını
+  büyütmez, giderek daha çabuk bırakılır.
+Harici paket YOK.
+"""
+
+import socket
+import threading
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+
+class ConnectTimeout(socket.timeout):
+    """Bağlantı kurma aşamasında (TCP/TLS) süre aşıldı; host büyük olasılıkla ulaşılamaz."""
+
+
+def _percentile(samples, q: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+class HostTimeouts:
+    """
+    - connect_timeout / read_timeout: örnek yokken kullanılan süreler (sn)
+    - min_* / max_*: türetilen sürelerin taban ve tavanı (sn)
+    - multiplier: yüzdelik değerin kaç katı beklenecek
+    - window: host başına tutulan son örnek sayısı; min_samples: uyarlamaya başlamak için gereken örnek
+    - timeout_backoff: art arda her zaman aşımında sürenin çarpılacağı katsayı (0-1)
+    İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, connect_timeout: float = 10.0, read_timeout: float = 15.0,
+                 min_connect: float = 2.0, max_connect: float = 15.0,
+                 min_read: float = 3.0, max_read: float = 30.0,
+                 multiplier: float = 4.0, percentile: float = 0.95,
+                 window: int = 64, min_samples: int = 5, timeout_backoff: float = 0.5):
+        self.connect_timeout = float(connect_timeout)
+        self.read_timeout = float(read_timeout)
+        self.min_connect = float(min_connect)
+        self.max_connect = float(max_connect)
+        self.min_read = float(min_read)
+        self.max_read = float(max_read)
+        self.multiplier = float(multiplier)
+        self.percentile = float(percentile)
+        self.window = max(1, int(window))
+        self.min_samples = max(1, int(min_samples))
+        self.timeout_backoff = min(1.0, max(0.0, float(timeout_backoff)))
+        self._connect: Dict[str, Deque[float]] = {}
+        self._read: Dict[str, Deque[float]] = {}
+        self._connect_timeouts: Dict[str, int] = {}   # host -> art arda zaman aşımı
+        self._read_timeouts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_timeout(cls, timeout: float) -> "HostTimeouts":
+        """Tek bir üst süreden (eski `timeout` parametresi) türetilmiş ayarlar; iki tavan da `timeout`."""
+        timeout = max(0.1, float(timeout))
+        return cls(connect_timeout=min(10.0, timeout), read_timeout=timeout,
+                   min_connect=min(2.0, timeout), max_connect=timeout,
+                   min_read=min(3.0, timeout), max_read=timeout)
+
+    def _derive(self, samples, default: float, lo: float, hi: float, streak: int) -> float:
+        if samples is None or len(samples) < self.min_samples:
+            value = default
+        else:
+            value = self.multiplier * _percentile(samples, self.percentile)
+        if streak:
+            value *= self.timeout_backoff ** streak
+        return max(lo, min(hi, value))
+
+    def timeouts(self, host: str) -> Tuple[float, float]:
+        """Host için (bağlanma, okuma) süre sınırları."""
+        host = (host or "").lower()
+        with self._lock:
+            c = self._derive(self._connect.get(host), self.connect_timeout, self.min_connect, self.max_connect,
+                             self._connect_timeouts.get(host, 0))
+            r = self._derive(self._read.get(host), self.read_timeout, self.min_read, self.max_read,
+                             self._read_timeouts.get(host, 0))
+        return c, r
+
+    def timeout_streak(self, host: str) -> Tuple[int, int]:
+        """Host için art arda (bağlanma, okuma) zaman aşımı sayısı."""
+        host = (host or "").lower()
+        with self._lock:
+            return self._connect_timeouts.get(host, 0), self._read_timeouts.get(host, 0)
+
+    def _add(self, table: Dict[str, Deque[float]], streaks: Dict[str, int], host: str, seconds: float) -> None:
+        host = (host or "").lower()
+        with self._lock:
+            q = table.get(host)
+            if q is None:
+                q = table[host] = deque(maxlen=self.window)
+            q.append(max(0.0, float(seconds)))
+            streaks.pop(host, None)
+
+    def _count_timeout(self, streaks: Dict[str, int], host: str) -> None:
+        host = (host or "").lower()
+        with self._lock:
+            streaks[host] = streaks.get(host, 0) + 1
+
+    def record_connect(self, host: str, seconds: float) -> None:
+        """Başarılı bağlantı kurma süresi (zaman aşımları için record_connect_timeout)."""
+        self._add(self._connect, self._connect_timeouts, host, seconds)
+
+    def record_read(self, host: str, seconds: float) -> None:
+        """Başarılı ilk yanıt süresi (zaman aşımları için record_read_timeout)."""
+        self._add(self._read, self._read_timeouts, host, seconds)
+
+    def record_connect_timeout(self, host: str) -> None:
+        self._count_timeout(self._connect_timeouts, host)
+
+    def record_read_timeout(self, host: str) -> None:
+        self._count_timeout(self._read_timeouts, host)
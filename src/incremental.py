@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Artımlı yeniden çalıştırma: önceki sonuç dosyasıyla (StreamingXlsxWriter düzeni; tüm sayfalar
+reader.read_result_rows_from_xlsx ile okunur) karşılaştırarak yalnızca gerekenleri yoklar.
+- Önceki çalışma kitabı URL'ye göre (canonical_url) dizinlenir: URL -> (size_mb, status).
+- Yeni URL'ler her zaman yoklanır; öncekiler yalnızca
+    * durumu OK değilse (recheck_failed) ya da
+    * önceki dosya `max_age_days` günden eskiyse (docProps/core.xml dcterms:modified)
+  yeniden yoklanır; kalanlar olduğu gibi taşınır.
+- Çalışma sonunda değişiklik özeti üretilir: yeni / kaldırılan / durumu ya da boyutu değişen URL'ler.
+  Özet satırlar yazıldıkça ChangeTracker ile biriktirilir; tüm sonuç kümesi bellekte tutulmaz.
+Harici paket YOK.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.reader import read_result_rows_from_xlsx, read_workbook_modified
+from src.url_canonical import canonical_url
+
+Previous = Tuple[Optional[float], str]  # (size_mb, status)
+
+
+class ChangeSummary(NamedTuple):
+    new: List[str]
+    removed: List[str]
+    changed: List[Tuple[str, Previous, Previous]]  # (url, önceki, yeni)
+    unchanged: int
+    carried: int   # yoklanmadan taşınan
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"new": len(self.new), "removed": len(self.removed), "changed": len(self.changed),
+                "unchanged": self.unchanged, "carried": self.carried}
+
+
+class PreviousOutput:
+    """
+    Önceki sonuç dosyası.
+    - max_age_days: dosya bundan eskiyse önceki tüm URL'ler yeniden yoklanır (None: yaş bakılmaz)
+    - recheck_failed: True ise durumu OK olmayan URL'ler yeniden yoklanır
+    """
+
+    def __init__(self, path: str, max_age_days: Optional[float] = None, recheck_failed: bool = False):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.recheck_failed = recheck_failed
+        self.rows: Dict[str, Previous] = {}
+        self.order: List[str] = []
+        for url, size_mb, status in read_result_rows_from_xlsx(path):
+            key = canonical_url(url)
+            if key not in self.rows:
+                self.order.append(url)
+            self.rows[key] = (size_mb, status)
+        self.modified: Optional[datetime] = read_workbook_modified(path)
+        if self.modified is None:
+            try:
+                self.modified = datetime.fromtimestamp(os.path.getmtime(path), tz=timezone.utc)
+            except OSError:
+                self.modified = None
+
+    def age_days(self) -> Optional[float]:
+        if self.modified is None:
+            return None
+        return (datetime.now(timezone.utc) - self.modified).total_seconds() / 86400.0
+
+    def expired(self) -> bool:
+        if self.max_age_days is None:
+            return False
+        age = self.age_days()
+        return age is None or age > self.max_age_days
+
+    def lookup(self, url: str) -> Optional[Previous]:
+        """Taşınabilecek önceki sonuç; yeniden yoklanması gerekiyorsa None."""
+        prev = self.rows.get(canonical_url(url))
+        if prev is None or self.expired():
+            return None
+        if self.recheck_failed and prev[1] != "OK":
+            return None
+        return prev
+
+    def tracker(self) -> "ChangeTracker":
+        return ChangeTracker(self)
+
+
+class ChangeTracker:
+    """
+    Değişiklik özetini satır satır biriktirir: add() her çıktı satırı için (girdi sırasıyla) çağrılır.
+    Yalnızca özete girecek URL'ler ve önceki dosyada görülen anahtarlar tutulur.
+    """
+
+    def __init__(self, previous: PreviousOutput):
+        self.previous = previous
+        self.new: List[str] = []
+        self.changed: List[Tuple[str, Previous, Previous]] = []
+        self.unchanged = 0
+        self.carried = 0
+        self._seen = set()  # önceki dosyada da olan kanonik URL'ler
+
+    def add(self, url: str, res: Optional[Previous], was_carried: bool = False) -> None:
+        key = canonical_url(url)
+        prev = self.previous.rows.get(key)
+        if prev is not None:
+            self._seen.add(key)
+        if was_carried:
+            self.carried += 1
+        if res is None:
+            return
+        if prev is None:
+            self.new.append(url)
+        elif not was_carried and (prev[1] != res[1] or prev[0] != res[0]):
+            self.changed.append((url, prev, tuple(res)))
+        else:
+            self.unchanged += 1
+
+    def summary(self) -> ChangeSummary:
+        removed = [u for u in self.previous.order if canonical_url(u) not in self._seen]
+        return ChangeSummary(self.new, removed, self.changed, self.unchanged, self.carried)
+
+
+def summary_path_for(output_path: str) -> str:
+    return os.path.splitext(output_path)[0] + "_degisiklikler.txt"
+
+
+def _fmt(prev: Previous) -> str:
+    size_mb, status = prev
+    return status if size_mb is None else f"{status} ({size_mb} MB)"
+
+
+def write_summary(summary: ChangeSummary, path: str, previous_path: str) -> None:
+    """Okunabilir değişiklik özeti (UTF-8 metin)."""
+    lines = [
+        f"Önceki dosya: {previous_path}",
+        f"Yeni URL: {len(summary.new)}",
+        f"Kaldırılan URL: {len(summary.removed)}",
+        f"Değişen URL: {len(summary.changed)}",
+        f"Değişmeyen URL: {summary.unchanged} (yoklanmadan taşınan: {summary.carried})",
+        "",
+    ]
+    if summary.changed:
+        lines.append("[Değişen]")
+        lines.extend(f"{url}\t{_fmt(old)} -> {_fmt(new)}" for url, old, new in summary.changed)
+        lines.append("")
+    if summary.new:
+        lines.append("[Yeni]")
+        lines.extend(summary.new)
+        lines.append("")
+    if summary.removed:
+        lines.append("[Kaldırılan]")
+        lines.extend(summary.removed)
+        lines.append("")
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    os.replace(tmp, path)
@@ -4,10 +4,25 @@
 Harici paket YOK (yalnızca standart kütüphane).
 """
 
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse, urlunparse, quote
+import asyncio
+import http.client
+import socket
+import ssl
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 from urllib.request import Request, urlopen
-from typing import Optional, Tuple
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+from src.connection_pool import DEFAULT_POOL, HostConnectionPool
+from src.dns_cache import is_permanent_dns_error
+from src.url_canonical import canonical_url
+from src.host_timeouts import ConnectTimeout, HostTimeouts
+from src.host_capabilities import (
+    HostCapabilities, HEAD_REJECT_CODES, STRATEGY_AUTO, STRATEGY_HEAD, STRATEGY_RANGE,
+)
 
 INTERNET_MSG = {
     "startup_error": (
@@ -29,93 +44,263 @@ INTERNET_MSG = {
     "net_cancelled": "İnternet bağlantısı işlem sırasında kesildi ve işlem iptal edildi.",
 }
 
-def is_internet_ok(timeout: float = 5.0) -> bool:
+# Bağlanabilirlik sınaması yapılan hafif uç noktalar (paralel yarıştırılır)
+CONNECTIVITY_URLS = (
+    "http://www.gstatic.com/generate_204",
+    "http://clients3.google.com/generate_204",
+    "http://example.com/",
+    "https://www.microsoft.com/",
+)
+
+# Son sonucun geçerlilik süresi (sn): başarı daha uzun, başarısızlık kısa tutulur
+CONNECTIVITY_OK_TTL = 10.0
+CONNECTIVITY_FAIL_TTL = 1.0
+
+_connectivity_lock = threading.Lock()
+_connectivity_last: Optional[Tuple[float, bool]] = None  # (monotonic zaman, sonuç)
+
+
+def _endpoint_ok(url: str, timeout: float) -> bool:
+    try:
+        with urlopen(Request(url), timeout=timeout) as resp:
+            code = getattr(resp, "status", 200)
+            return 200 <= code < 400
+    except Exception:
+        return False
+
+
+def is_internet_ok(timeout: float = 5.0, use_cache: bool = True) -> bool:
     """
     Ağ bağlanabilirliğini hızlıca sınar.
-    - Birkaç hafif uç noktaya GET isteği atar (204/200 beklenir).
-    - Herhangi biri 2xx/3xx dönerse bağlantı var kabul edilir.
+    - Birkaç hafif uç noktaya aynı anda GET isteği atar; ilk 2xx/3xx yanıtta True döner.
+    - En kötü durumda `timeout` kadar bekler (uç nokta sayısından bağımsız).
+    - Sonuç kısa süre önbellekte tutulur (başarı CONNECTIVITY_OK_TTL, başarısızlık CONNECTIVITY_FAIL_TTL);
+      use_cache=False her zaman yeniden sınar.
     """
-    test_urls = [
-        "http://www.gstatic.com/generate_204",
-        "http://clients3.google.com/generate_204",
-        "http://example.com/",
-        "https://www.microsoft.com/",
-    ]
-    for u in test_urls:
-        try:
-            req = Request(u)
-            with urlopen(req, timeout=timeout) as resp:
-                code = getattr(resp, "status", 200)
-                if 200 <= code < 400:
-                    return True
-        except Exception:
-            continue
-    return False
+    global _connectivity_last
+    if use_cache:
+        with _connectivity_lock:
+            last = _connectivity_last
+        if last is not None:
+            ttl = CONNECTIVITY_OK_TTL if last[1] else CONNECTIVITY_FAIL_TTL
+            if time.monotonic() - last[0] < ttl:
+                return last[1]
+
+    # Geride kalan istekler beklenmez; kendi zaman aşımlarıyla arka planda biter
+    success = threading.Event()
+    finished = threading.Event()
+    pending = [len(CONNECTIVITY_URLS)]
+    pending_lock = threading.Lock()
+
+    def _one(u):
+        if _endpoint_ok(u, timeout):
+            success.set()
+            finished.set()
+        with pending_lock:
+            pending[0] -= 1
+            if pending[0] == 0:
+                finished.set()  # hepsi yanıtladı/başarısız: beklemeyi erken bitir
+
+    for u in CONNECTIVITY_URLS:
+        threading.Thread(target=_one, args=(u,), daemon=True).start()
+    finished.wait(timeout + 0.5)
+    ok = success.is_set()
+    with _connectivity_lock:
+        _connectivity_last = (time.monotonic(), ok)
+    return ok
 
 
 def _safe_url(url: str) -> str:
-    """Türkçe/boşluk vb. karakterleri path ve query kısmında güvenli biçime çevirir."""
+    """
+    Türkçe/boşluk vb. karakterleri path ve query kısmında güvenli biçime çevirir.
+    Ağa kanonik biçim gider (url_canonical.canonical_url): tekilleştirme, önbellek ve günlük anahtarıyla
+    aynı istek atılır; "a b" ile "a%20b" aynı yola ("a%20b") gider, geçerli %XX kaçışları yeniden kodlanmaz.
+    """
+    return canonical_url(url)
+
+
+def _content_length(headers) -> Optional[int]:
+    cl = headers.get("Content-Length") if headers is not None else None
+    if cl and cl.isdigit():
+        return int(cl)
+    return None
+
+
+def _content_range_total(headers) -> Optional[int]:
+    """Örn: 'bytes 0-0/12345' => 12345"""
+    cr = headers.get("Content-Range") if headers is not None else None
+    if cr and "/" in cr:
+        total = cr.split("/")[-1]
+        if total.isdigit():
+            return int(total)
+    return None
+
+
+def _format_result(code: Optional[int], size_bytes: Optional[int]) -> Tuple[str, Optional[float]]:
+    status_text = "OK" if code == 200 else (str(code) if code is not None else "ERR")
+    size_mb = round(size_bytes / (1024 * 1024), 2) if size_bytes is not None else None
+    return status_text, size_mb
+
+
+# Sunucunun "yavaşla" dediği kodlar: HEAD sonrası ek GET denemesi yapılmaz
+THROTTLE_CODES = (429, 503)
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Retry-After başlığını saniyeye çevirir (sayı veya HTTP tarihi)."""
+    ra = headers.get("Retry-After") if headers is not None else None
+    if not ra:
+        return None
+    ra = ra.strip()
+    if ra.isdigit():
+        return float(ra)
     try:
-        p = urlparse(url)
-        safe_path = quote(p.path)
-        safe_query = quote(p.query, safe="=&?")
-        return urlunparse((p.scheme, p.netloc, safe_path, p.params, safe_query, p.fragment))
+        when = parsedate_to_datetime(ra)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
     except Exception:
-        return url
+        return None
 
 
-def status_and_size_mb(url: str, timeout: float = 15.0) -> Tuple[str, Optional[float]]:
+class ProbeResult(NamedTuple):
+    """Tek bir URL yoklamasının ayrıntılı sonucu (status_and_size_mb bunun ilk iki alanıdır)."""
+    status_text: str
+    size_mb: Optional[float]
+    code: Optional[int] = None
+    retry_after: Optional[float] = None
+    elapsed: float = 0.0
+    size_bytes: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None  # kod alınamadıysa hata türü (bkz. error_kind)
+
+
+# Ağ hatası türleri
+ERROR_TIMEOUT = "timeout"
+ERROR_CONNECTION = "connection"
+ERROR_DNS = "dns"
+ERROR_TLS = "tls"
+ERROR_INVALID = "invalid"
+ERROR_CANCELLED = "cancelled"  # istek iptal nedeniyle hiç gönderilmedi
+
+
+def error_kind(exc: BaseException) -> str:
+    """İstisnayı yeniden deneme kararı için kaba bir türe indirger."""
+    if isinstance(exc, (socket.timeout, TimeoutError, asyncio.TimeoutError)):
+        return ERROR_TIMEOUT
+    if isinstance(exc, socket.gaierror):
+        return ERROR_DNS if is_permanent_dns_error(exc) else ERROR_CONNECTION
+    if isinstance(exc, ssl.SSLCertVerificationError):
+        return ERROR_TLS
+    if isinstance(exc, (ValueError, http.client.InvalidURL)):
+        return ERROR_INVALID
+    return ERROR_CONNECTION
+
+
+def _validators(headers) -> Tuple[Optional[str], Optional[str]]:
+    """Koşullu yeniden doğrulama için (ETag, Last-Modified)."""
+    if headers is None:
+        return None, None
+    return headers.get("ETag"), headers.get("Last-Modified")
+
+
+def _merge_get_code(code: Optional[int], get_code: int) -> Optional[int]:
+    """
+    HEAD kodu ile Range GET kodunu birleştirir.
+    - Range isteğine 206 başarı demektir (200 gibi raporlanır)
+    - HEAD reddedildiyse (403/405/501) ve GET başarılıysa GET sonucu geçerlidir
+    """
+    if get_code == 206:
+        get_code = 200
+    if code is None:
+        return get_code
+    if code in HEAD_REJECT_CODES and 200 <= get_code < 300:
+        return get_code
+    return code
+
+
+def probe_url(url: str, timeout: float = 15.0,
+              pool: Optional[HostConnectionPool] = None,
+              headers: Optional[Mapping[str, str]] = None,
+              caps: Optional[HostCapabilities] = None,
+              deadlines: Optional[HostTimeouts] = None) -> ProbeResult:
     """
     URL'yi HEAD ile yoklar; olmuyorsa kısmi GET dener.
-    Dönen: (status_text, size_mb_float_or_None)
-    - 200 => 'OK' yazdırılır, diğerleri doğrudan kod
+    - İstekler host başına keep-alive havuzundan (varsayılan: DEFAULT_POOL) gider
+    - 429/503 dönen host'a ikinci (GET) istek atılmaz; Retry-After sonuçta döner
+    - headers: ek istek başlıkları (ör. If-None-Match); 304 gelirse GET denenmez
+    - caps: host yetenek belleği; HEAD desteklemeyen host'ta doğrudan Range GET,
+      HEAD'de boyut veren host'ta yalnızca HEAD kullanılır
+    - deadlines: host başına uyarlanan bağlanma/okuma süreleri (verilmezse her istek `timeout` alır);
+      HEAD'de bağlantı kurulamadıysa GET denenmez
     """
+    pool = pool or DEFAULT_POOL
     url = _safe_url(url)
+    host = (urlparse(url).hostname or "").lower()
+    strategy = caps.strategy(host) if caps is not None else STRATEGY_AUTO
+    extra = dict(headers or {})
     size_bytes = None
     code = None
+    retry_after = None
+    etag = last_modified = None
+    head_code = get_code = None
+    head_has_len = get_has_range = False
+    unreachable = False
+    error = None
+    t0 = time.monotonic()
 
-    try:
-        req = Request(url, method="HEAD")
-        with urlopen(req, timeout=timeout) as resp:
-            code = getattr(resp, "status", 200)
-            cl = resp.headers.get("Content-Length")
-            if cl and cl.isdigit():
-                size_bytes = int(cl)
-    except HTTPError as e:
-        code = e.code
-        cl = e.headers.get("Content-Length") if hasattr(e, "headers") else None
-        if cl and cl.isdigit():
-            size_bytes = int(cl)
-    except URLError:
-        code = None
-    except Exception:
-        code = None
+    if strategy != STRATEGY_RANGE:
+        try:
+            head_code, resp_headers, _final = pool.request("HEAD", url, extra, timeout=timeout, deadlines=deadlines)
+            code = head_code
+            retry_after = _retry_after_seconds(resp_headers)
+            # Hata yanıtlarındaki Content-Length hata sayfasınındır, dosyanın değil
+            if 200 <= code < 300:
+                size_bytes = _content_length(resp_headers)
+                head_has_len = size_bytes is not None
+            if 200 <= code < 400:
+                etag, last_modified = _validators(resp_headers)
+        except Exception as e:
+            error = error_kind(e)
+            # Bağlantı kurulamadıysa GET de kurulamaz; ikinci kez beklenmez
+            unreachable = isinstance(e, ConnectTimeout)
 
     # Eğer HEAD başarısız oldu ya da boyut yoksa, 0-0 Range ile GET dene
-    if size_bytes is None:
+    need_get = (size_bytes is None and code not in THROTTLE_CODES and code != 304 and not unreachable
+                and (strategy != STRATEGY_HEAD or code is None))
+    if need_get:
         try:
-            req = Request(url)
-            req.add_header("Range", "bytes=0-0")
-            with urlopen(req, timeout=timeout) as resp:
-                if code is None:
-                    code = getattr(resp, "status", 200)
-                cr = resp.headers.get("Content-Range")
-                # Örn: bytes 0-0/12345
-                if cr and "/" in cr:
-                    total = cr.split("/")[-1]
-                    if total.isdigit():
-                        size_bytes = int(total)
-                if size_bytes is None:
-                    cl = resp.headers.get("Content-Length")
-                    if cl and cl.isdigit():
-                        # Bu durumda sadece 1 byte olur; toplamı bilemeyiz
-                        pass
-        except HTTPError as e:
+            get_headers = dict(extra)
+            get_headers["Range"] = "bytes=0-0"
+            get_code, resp_headers, _final = pool.request("GET", url, get_headers, timeout=timeout, deadlines=deadlines)
             if code is None:
-                code = e.code
-        except Exception:
-            pass
+                retry_after = _retry_after_seconds(resp_headers)
+            code = _merge_get_code(code, get_code)
+            # Content-Length bu durumda sadece 1 byte olur; toplamı bilemeyiz
+            if 200 <= get_code < 300:
+                size_bytes = _content_range_total(resp_headers)
+                get_has_range = size_bytes is not None
+            if 200 <= get_code < 400 and not (etag or last_modified):
+                etag, last_modified = _validators(resp_headers)
+        except Exception as e:
+            error = error_kind(e)
 
-    status_text = "OK" if code == 200 else (str(code) if code is not None else "ERR")
-    size_mb = round(size_bytes / (1024 * 1024), 2) if size_bytes is not None else None
-    return status_text, size_mb
+    if caps is not None:
+        caps.observe(host, head_code, head_has_len, get_code, get_has_range)
+
+    status_text, size_mb = _format_result(code, size_bytes)
+    return ProbeResult(status_text, size_mb, code, retry_after, time.monotonic() - t0,
+                       size_bytes, etag, last_modified, error=error if code is None else None)
+
+
+def status_and_size_mb(url: str, timeout: float = 15.0,
+                       pool: Optional[HostConnectionPool] = None) -> Tuple[str, Optional[float]]:
+    """
+    URL'yi HEAD ile yoklar; olmuyorsa kısmi GET dener.
+    Dönen: (status_text, size_mb_float_or_None)
+    - 200 => 'OK' yazdırılır, diğerleri doğrudan kod
+    """
+    r = probe_url(url, timeout=timeout, pool=pool)
+    return r.status_text, r.size_mb
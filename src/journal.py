@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Kontrol noktası günlüğü (journal) + kaldığı yerden devam.
+- Tamamlanan her yoklama, çalışma sırasında yalnızca-eklemeli bir JSONL dosyasına yazılır;
+  satırlar toplu halde (N kayıt ya da birkaç saniyede bir) diske aktarılır.
+- Aynı girdi dosyası (yol + boyut + değişiklik zamanı) yeniden çalıştırıldığında günlük yüklenir,
+  tamamlanmış URL'ler atlanır; yalnızca kalanlar yoklanır.
+- Başlıkta günlüğün oluşturulma zamanı tutulur; `max_age` saniyeden eski günlük (sonuçları bayatlamış
+  sayılır) yüklenmez, çalışma baştan başlar.
+- Geçici sonuçlar (zaman aşımı, 429/5xx …) ve iptal edilen istekler günlüğe yazılmaz: devamda yeniden denenir.
+- Çalışma eksiksiz bitince günlük silinir.
+Harici paket YOK.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from src.internet_connection import ProbeResult, ERROR_CANCELLED
+from src.probe_cache import default_cache_path
+from src.retry import is_retryable
+from src.url_canonical import canonical_url
+
+JOURNAL_VERSION = 2  # 2: başlıkta "created" (oluşturulma zamanı)
+
+# Bu süreden (sn) eski günlükten devam edilmez (yoklama önbelleğinin varsayılan süresiyle aynı)
+DEFAULT_JOURNAL_MAX_AGE = 24 * 3600.0
+
+Completed = Tuple[Optional[float], str]  # (size_mb, status)
+
+
+def journal_path_for(input_path: str) -> str:
+    """Girdi dosyasına özgü günlük yolu (kullanıcı önbellek klasöründe)."""
+    digest = hashlib.sha1(os.path.abspath(input_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(os.path.dirname(default_cache_path()), "journals", f"{digest}.jsonl")
+
+
+def input_fingerprint(input_path: str) -> Dict[str, object]:
+    st = os.stat(input_path)
+    return {"path": os.path.abspath(input_path), "size": st.st_size, "mtime": int(st.st_mtime)}
+
+
+class ProbeJournal:
+    """
+    - path: günlük dosyası; fingerprint: girdi dosyasının kimliği (input_fingerprint)
+    - resume: True ise eşleşen günlük yüklenir ve üzerine eklenir; değilse baştan yazılır
+    - max_age: bundan (sn) eski günlük eşleşse de yüklenmez (None: yaş bakılmaz)
+    - flush_every / flush_interval: toplu yazma eşikleri (kayıt sayısı / sn)
+    Tek iş parçacığından (sonuçları toplayan döngü) kullanılır.
+    """
+
+    def __init__(self, path: str, fingerprint: Dict[str, object], resume: bool = True,
+                 flush_every: int = 500, flush_interval: float = 2.0,
+                 max_age: Optional[float] = DEFAULT_JOURNAL_MAX_AGE):
+        self.path = path
+        self.fingerprint = dict(fingerprint)
+        self.max_age = max_age
+        self.flush_every = max(1, int(flush_every))
+        self.flush_interval = float(flush_interval)
+        self.completed: Dict[str, Completed] = {}
+        self._buf = []
+        self._last_flush = time.monotonic()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if resume and self._load():
+            self._f = open(path, "a", encoding="utf-8")
+            if self._f.tell() > 0 and not self._ends_with_newline():
+                self._f.write("\n")  # yarım kalmış son satırı kapat
+        else:
+            self.completed.clear()
+            self._f = open(path, "w", encoding="utf-8")
+            header = {"v": JOURNAL_VERSION, "input": self.fingerprint, "created": time.time()}
+            self._f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            self._f.flush()
+
+    def _load(self) -> bool:
+        """Günlük bu girdiye aitse ve bayatlamamışsa kayıtları yükler."""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "null")
+                if not isinstance(header, dict) or header.get("v") != JOURNAL_VERSION \
+                        or header.get("input") != self.fingerprint:
+                    return False
+                created = header.get("created")
+                if not isinstance(created, (int, float)):
+                    return False
+                if self.max_age is not None and time.time() - created > self.max_age:
+                    return False
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                        self.completed[rec["u"]] = (rec["m"], rec["s"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # yarım kalmış son satır
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def lookup(self, url: str) -> Optional[Completed]:
+        return self.completed.get(canonical_url(url))
+
+    def record(self, url: str, r: ProbeResult) -> None:
+        if is_retryable(r) or r.error == ERROR_CANCELLED or (r.code is None and r.error is None):
+            return
+        key = canonical_url(url)
+        if key in self.completed:
+            return
+        self.completed[key] = (r.size_mb, r.status_text)
+        self._buf.append(json.dumps({"u": key, "m": r.size_mb, "s": r.status_text}, ensure_ascii=False) + "\n")
+        if len(self._buf) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            self._f.write("".join(self._buf))
+            self._buf.clear()
+        self._f.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._f.close()
+
+    def discard(self) -> None:
+        """Çalışma eksiksiz bitti ve çıktı yazıldı: günlüğü kapatıp siler."""
+        self._buf.clear()
+        self._f.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Kalıcı (diskte) yoklama sonucu önbelleği — SQLite.
+- Anahtar: normalleştirilmiş URL (url_canonical.canonical_url)
+- Saklanan: durum metni, HTTP kodu, boyut (bayt), ETag, Last-Modified, kontrol zamanı
+- TTL içindeki kayıt ağa hiç çıkmadan döner; süresi dolmuş kayıt ETag/Last-Modified varsa
+  koşullu istekle (If-None-Match / If-Modified-Since) ucuzca yeniden doğrulanır (304 => kayıt tazelenir).
+- Kayıt sayısı sınırlıdır; en eski kontrol edilenler silinir.
+Harici paket YOK (sqlite3).
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from src.internet_connection import ProbeResult, THROTTLE_CODES, _format_result
+from src.url_canonical import canonical_url
+
+DEFAULT_TTL = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# Bu kadar yazmada bir boyut sınırı denetlenir
+_EVICT_EVERY = 1000
+
+
+def default_cache_path() -> str:
+    """Kullanıcıya özel önbellek dosyası yolu (Windows: %LOCALAPPDATA%)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "URLBoyutHesaplayici", "probe_cache.sqlite3")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "url-boyut-hesaplayici", "probe_cache.sqlite3")
+
+
+class CacheEntry(NamedTuple):
+    status_text: str
+    code: Optional[int]
+    size_bytes: Optional[int]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    checked_at: float
+
+    def to_result(self, elapsed: float = 0.0) -> ProbeResult:
+        status_text, size_mb = _format_result(self.code, self.size_bytes)
+        return ProbeResult(status_text, size_mb, self.code, None, elapsed,
+                           self.size_bytes, self.etag, self.last_modified, cached=True)
+
+
+def is_cacheable(r: ProbeResult) -> bool:
+    """Geçici hatalar (ağ hatası, 408, 429, 5xx) önbelleğe yazılmaz."""
+    return r.code is not None and r.code < 500 and r.code not in THROTTLE_CODES and r.code != 408
+
+
+class ProbeCache:
+    """
+    - path: SQLite dosyası (klasörü yoksa oluşturulur)
+    - ttl: saniye; bu süreden yeni kayıtlar ağa çıkmadan kullanılır
+    - max_entries: en fazla kayıt sayısı (aşılırsa en eski kontrol edilenler silinir)
+    İş parçacığı güvenlidir (tek bağlantı + kilit).
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path or default_cache_path()
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS probes ("
+                " key TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " code INTEGER,"
+                " size_bytes INTEGER,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " checked_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS probes_checked_at ON probes(checked_at)")
+
+    # --- okuma / yazma ---
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, code, size_bytes, etag, last_modified, checked_at FROM probes WHERE key = ?",
+                (canonical_url(url),),
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def is_fresh(self, entry: CacheEntry, now: Optional[float] = None) -> bool:
+        return ((now or time.time()) - entry.checked_at) <= self.ttl
+
+    def put(self, url: str, r: ProbeResult) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO probes(key, status, code, size_bytes, etag, last_modified, checked_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (canonical_url(url), r.status_text, r.code, r.size_bytes, r.etag, r.last_modified, time.time()),
+            )
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                self._evict_locked()
+
+    def touch(self, url: str) -> None:
+        """304 sonrası: kayıt değişmedi, yalnızca kontrol zamanı tazelenir."""
+        with self._lock:
+            self._db.execute("UPDATE probes SET checked_at = ? WHERE key = ?", (time.time(), canonical_url(url)))
+
+    def _evict_locked(self) -> None:
+        (count,) = self._db.execute("SELECT COUNT(*) FROM probes").fetchone()
+        extra = count - self.max_entries
+        if extra > 0:
+            self._db.execute(
+                "DELETE FROM probes WHERE key IN (SELECT key FROM probes ORDER BY checked_at LIMIT ?)",
+                (extra,),
+            )
+
+    def evict(self) -> None:
+        with self._lock:
+            self._evict_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._evict_locked()
+            finally:
+                self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # --- yoklama ile birlikte kullanım ---
+
+    def lookup(self, url: str) -> Tuple[Optional[CacheEntry], Optional[ProbeResult], Dict[str, str]]:
+        """
+        Dönen: (entry, hazır_sonuç, koşullu_başlıklar)
+        - hazır_sonuç varsa ağa çıkmaya gerek yoktur
+        - koşullu_başlıklar süresi dolmuş kaydın yeniden doğrulanması içindir
+        """
+        entry = self.get(url)
+        if entry is None:
+            return None, None, {}
+        if self.is_fresh(entry):
+            return entry, entry.to_result(), {}
+        cond = {}
+        if entry.etag:
+            cond["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            cond["If-Modified-Since"] = entry.last_modified
+        return entry, None, cond
+
+    def resolve(self, url: str, entry: Optional[CacheEntry], r: ProbeResult) -> ProbeResult:
+        """Ağ sonucunu önbelleğe işler; 304 ise önbellekteki sonucu döndürür."""
+        if r.code == 304 and entry is not None:
+            self.touch(url)
+            return entry.to_result(elapsed=r.elapsed)._replace(cached=False)
+        if is_cacheable(r):
+            self.put(url, r)
+        return r
+
+
+def _safe_lookup(cache: ProbeCache, url: str):
+    try:
+        return cache.lookup(url)
+    except sqlite3.Error:
+        return None, None, {}
+
+
+def _safe_resolve(cache: ProbeCache, url: str, entry: Optional[CacheEntry], r: ProbeResult) -> ProbeResult:
+    try:
+        return cache.resolve(url, entry, r)
+    except sqlite3.Error:
+        return r
+
+
+def cached_probe_url(url: str, cache: Optional[ProbeCache], prober, **kwargs) -> ProbeResult:
+    """
+    `prober(url, headers=..., **kwargs)` çağrısını önbellek ile sarar (prober: probe_url).
+    Önbellek hataları yoklamayı bozmaz; o URL için önbellek yokmuş gibi davranılır.
+    """
+    if cache is None:
+        return prober(url, **kwargs)
+    entry, ready, cond = _safe_lookup(cache, url)
+    if ready is not None:
+        return ready
+    return _safe_resolve(cache, url, entry, prober(url, headers=cond, **kwargs))
+
+
+async def async_cached_probe_url(url: str, cache: Optional[ProbeCache], prober, **kwargs) -> ProbeResult:
+    """`cached_probe_url` karşılığı (prober: async_probe_url)."""
+    if cache is None:
+        return await prober(url, **kwargs)
+    entry, ready, cond = _safe_lookup(cache, url)
+    if ready is not None:
+        return ready
+    return _safe_resolve(cache, url, entry, await prober(url, headers=cond, **kwargs))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Host başına uyarlanabilir eşzamanlılık denetimi (AIMD).
+- 429/503 (veya Retry-After) gelince host'un eşzamanlılık penceresi çarpımsal olarak küçülür
+  ve host, bekleme süresi dolana kadar yeni iş almaz.
+- Host sağlıklı yanıt verdikçe pencere toplamsal olarak büyür (tur başına +1).
+- Gecikme, hostun en iyi gecikmesinin belirgin üzerine çıkarsa pencere büyütülmez (kuyruklanma işareti).
+Harici paket YOK.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from src.internet_connection import THROTTLE_CODES
+
+
+class _HostState:
+    __slots__ = ("cwnd", "blocked_until", "last_decrease", "min_latency", "srtt", "strikes")
+
+    def __init__(self, cwnd: float):
+        self.cwnd = cwnd
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.min_latency: Optional[float] = None
+        self.srtt: Optional[float] = None
+        self.strikes = 0  # art arda gelen yavaşla yanıtı
+
+
+class HostRateController:
+    """
+    - initial / min_limit / max_limit: host başına eşzamanlı istek penceresi
+    - decrease: yavaşla yanıtında pencere çarpanı (0.5 => yarıya)
+    - latency_factor: gecikme min_latency * latency_factor üstündeyse büyütme yapılmaz
+    - base_cooldown / max_cooldown: Retry-After yoksa bekleme (art arda yavaşlada katlanır)
+    İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 8,
+                 decrease: float = 0.5, latency_factor: float = 3.0,
+                 base_cooldown: float = 1.0, max_cooldown: float = 60.0):
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.initial = float(min(max(int(initial), self.min_limit), self.max_limit))
+        self.decrease = float(decrease)
+        self.latency_factor = float(latency_factor)
+        self.base_cooldown = float(base_cooldown)
+        self.max_cooldown = float(max_cooldown)
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        st = self._hosts.get(host)
+        if st is None:
+            st = self._hosts[host] = _HostState(self.initial)
+        return st
+
+    def limit(self, host: str) -> int:
+        """
+        Host'un şu anki eşzamanlılık sınırı.
+        Bekleme süresindeki host için 0 döner (zamanlayıcı o host'a iş vermez).
+        """
+        with self._lock:
+            st = self._state(host)
+            if st.blocked_until > time.monotonic():
+                return 0
+            return int(st.cwnd)
+
+    def record(self, host: str, code: Optional[int], retry_after: Optional[float] = None,
+               latency: Optional[float] = None) -> None:
+        """Bir yoklamanın sonucunu host durumuna işler."""
+        now = time.monotonic()
+        with self._lock:
+            st = self._state(host)
+
+            if code in THROTTLE_CODES or (retry_after is not None and code is not None and code >= 400):
+                st.strikes += 1
+                # Aynı patlamadan gelen çok sayıda 429 pencereyi bir kez küçültür
+                guard = max(0.5, st.srtt or 0.0)
+                if now - st.last_decrease >= guard:
+                    st.cwnd = max(float(self.min_limit), st.cwnd * self.decrease)
+                    st.last_decrease = now
+                if retry_after is not None:
+                    wait = min(self.max_cooldown, max(0.0, retry_after))
+                else:
+                    wait = min(self.max_cooldown, self.base_cooldown * (2 ** min(st.strikes - 1, 16)))
+                st.blocked_until = max(st.blocked_until, now + wait)
+                return
+
+            if code is None:
+                # Ağ hatası: pencere değişmez (yeniden deneme katmanının işi)
+                return
+
+            st.strikes = 0
+            if latency is not None and latency > 0:
+                st.srtt = latency if st.srtt is None else 0.8 * st.srtt + 0.2 * latency
+                st.min_latency = latency if st.min_latency is None else min(st.min_latency, latency)
+                if latency > st.min_latency * self.latency_factor:
+                    return
+            # Toplamsal artış: tam pencere kadar başarılı yanıtta +1
+            st.cwnd = min(float(self.max_limit), st.cwnd + 1.0 / max(1.0, st.cwnd))
+
@@ -5,12 +5,14 @@ Tüm kullanıcıya görünen hata metinleri de burada raise edilen mesajlar içi
 Harici paket KULLANILMAZ (zipfile + xml.etree kullanılır).
 """
 
-import io
 import os
 import re
 import zipfile
 import xml.etree.ElementTree as ET
-from typing import List, Dict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.dedup import DigestSet
 
 # XML Namespace'ler
 NS: Dict[str, str] = {
@@ -34,115 +36,294 @@ def letters_to_index(col_letters: str) -> int:
             v = v * 26 + (ord(ch) - ord("A") + 1)
     return v
 
-def read_urls_from_xlsx(xlsx_path: str, header_name: str) -> List[str]:
-    """
-    İlk sayfadaki header satırında `header_name` başlığını bulur; altındaki URL'leri listeler.
-    """
-    with zipfile.ZipFile(xlsx_path, "r") as z:
-        wb_xml = ET.fromstring(z.read("xl/workbook.xml"))
-        sheet = wb_xml.find("a:sheets/a:sheet", NS)
-        if sheet is None:
-            raise RuntimeError("Çalışma sayfası bulunamadı.")
-        rid = sheet.attrib.get("{%s}id" % NS["r"])
-
-        wb_rels = ET.fromstring(z.read("xl/_rels/workbook.xml.rels"))
-        target = None
-        for rel in wb_rels.findall("{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"):
-            if rel.attrib.get("Id") == rid:
-                target = rel.attrib.get("Target")
-                break
+def _sheet_paths(z: zipfile.ZipFile) -> List[str]:
+    """Çalışma kitabındaki sayfaların zip yolları (kitaptaki sırayla)."""
+    wb_xml = ET.fromstring(z.read("xl/workbook.xml"))
+    sheets = wb_xml.findall("a:sheets/a:sheet", NS)
+    if not sheets:
+        raise RuntimeError("Çalışma sayfası bulunamadı.")
+
+    wb_rels = ET.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+    targets = {}
+    for rel in wb_rels.findall("{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"):
+        targets[rel.attrib.get("Id")] = rel.attrib.get("Target")
+    paths = []
+    for sheet in sheets:
+        target = targets.get(sheet.attrib.get("{%s}id" % NS["r"]))
         if not target:
             raise RuntimeError("Sayfa ilişkisi bulunamadı.")
-        sheet_path = "xl/" + target if not target.startswith("xl/") else target
-        sheet_xml = ET.fromstring(z.read(sheet_path))
-
-        # sharedStrings (varsa)
-        shared = []
-        if "xl/sharedStrings.xml" in z.namelist():
-            sst = ET.fromstring(z.read("xl/sharedStrings.xml"))
-            for si in sst.findall("a:si", NS):
-                texts = []
-                for t in si.findall(".//a:t", NS):
-                    texts.append(t.text or "")
-                shared.append("".join(texts))
-
-        sheetData = sheet_xml.find("a:sheetData", NS)
-        if sheetData is None:
-            return []
-        rows = sheetData.findall("a:row", NS)
-        if not rows:
-            return []
-        header_row = rows[0]
-
-        def cell_text(cell):
-            t = cell.attrib.get("t")
-            if t == "s":  # shared string
-                v = cell.find("a:v", NS)
-                if v is not None and v.text and v.text.isdigit():
-                    idx = int(v.text)
-                    return shared[idx] if 0 <= idx < len(shared) else ""
-                return ""
-            elif t == "inlineStr":
-                tnode = cell.find("a:is/a:t", NS)
-                return (tnode.text if tnode is not None else "")
-            else:
-                v = cell.find("a:v", NS)
-                return v.text if v is not None else ""
-
-        # başlığı bul
-        header_idx = None
-        for c in header_row.findall("a:c", NS):
-            r = c.attrib.get("r", "A1")
-            letters = "".join(ch for ch in r if ch.isalpha())
-            idx = letters_to_index(letters)
-            txt = (cell_text(c) or "").strip()
-            if txt.lower() == (header_name or "").strip().lower():
-                header_idx = idx
-                break
-        if header_idx is None:
-            raise RuntimeError(f"'{header_name}' başlıklı sütun bulunamadı.")
-
-        # veri satırları
-        urls: List[str] = []
-        for row in rows[1:]:
-            target_cell = None
-            for c in row.findall("a:c", NS):
-                r = c.attrib.get("r", "")
-                letters = "".join(ch for ch in r if ch.isalpha())
-                if letters_to_index(letters) == header_idx:
-                    target_cell = c
-                    break
-            if target_cell is None:
-                urls.append("")
+        paths.append("xl/" + target if not target.startswith("xl/") else target)
+    return paths
+
+def _first_sheet_path(z: zipfile.ZipFile) -> str:
+    return _sheet_paths(z)[0]
+
+# iterparse etiketleri (namespace'li tam adlar)
+_A = "{%s}" % NS["a"]
+_SHEET_DATA = _A + "sheetData"
+_ROW = _A + "row"
+_C = _A + "c"
+_V = _A + "v"
+_T = _A + "t"
+_SI = _A + "si"
+_DIGITS = "0123456789"
+
+def _cell_col(cell, prev_col: int) -> int:
+    r = cell.attrib.get("r")
+    if not r:
+        return prev_col + 1  # r yoksa hücreler ardışıktır
+    return letters_to_index("".join(ch for ch in r if ch.isalpha()))
+
+def _cell_raw(cell) -> Union[str, int]:
+    """Hücrenin ham değeri: metin ya da (paylaşılan dize ise) sharedStrings sıra numarası."""
+    t = cell.attrib.get("t")
+    if t == "inlineStr":
+        return "".join(node.text or "" for node in cell.iter(_T))
+    v = cell.find(_V)
+    text = v.text if v is not None else None
+    if t == "s":  # shared string
+        return int(text) if text and text.isdigit() else ""
+    return text or ""
+
+def _iter_row_elems(z: zipfile.ZipFile, sheet_path: str) -> Iterator[ET.Element]:
+    """
+    Sayfayı iterparse ile akış halinde okur; her <row> öğesini üretir.
+    Tüketici bir sonrakini istediğinde işlenen satırlar ağaçtan silinir: bellek satır sayısından bağımsızdır.
+    """
+    with z.open(sheet_path) as f:
+        sheet_data = None
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if elem.tag == _SHEET_DATA:
+                    sheet_data = elem
                 continue
-            u = (cell_text(target_cell) or "").strip()
-            urls.append(u)
-        return [u for u in urls if u]
+            if elem.tag != _ROW:
+                continue
+            yield elem
+            if sheet_data is not None:
+                sheet_data.clear()
+
+def _row_cells(row: ET.Element) -> List[Tuple[int, Union[str, int]]]:
+    """Satırdaki tüm hücreler: [(sütun, ham değer)]."""
+    cells = []
+    col = 0
+    for c in row:
+        if c.tag == _C:
+            col = _cell_col(c, col)
+            cells.append((col, _cell_raw(c)))
+    return cells
+
+def _shared_strings_subset(z: zipfile.ZipFile, wanted) -> Dict[int, str]:
+    """sharedStrings.xml'den yalnızca istenen sıra numaralarını okur (akış halinde; son istenenden sonra durur)."""
+    if not wanted or "xl/sharedStrings.xml" not in z.namelist():
+        return {}
+    last = max(wanted)
+    out: Dict[int, str] = {}
+    idx = 0
+    with z.open("xl/sharedStrings.xml") as f:
+        root = None
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            if elem.tag != _SI:
+                continue
+            if idx in wanted:
+                out[idx] = "".join(t.text or "" for t in elem.iter(_T))
+            idx += 1
+            root.clear()
+            if idx > last:
+                break
+    return out
+
+def _resolve(values: List[Union[str, int]], z: zipfile.ZipFile) -> List[str]:
+    """Sıra numarası olan değerleri (int) paylaşılan dizelerle değiştirir."""
+    wanted = {v for v in values if isinstance(v, int)}
+    if not wanted:
+        return values
+    shared = _shared_strings_subset(z, wanted)
+    return [shared.get(v, "") if isinstance(v, int) else v for v in values]
 
-def read_urls_from_wxr(path: str) -> List[str]:
+def index_to_letters(index: int) -> str:
+    """letters_to_index'in tersi: 1 -> "A", 28 -> "AB"."""
+    letters = ""
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+def _column_key(letters: str) -> Tuple[int, str]:
+    """Sütun harflerini sıralanabilir anahtara çevirir ("Z" < "AA")."""
+    return len(letters), letters
+
+def _pick_cells(row: ET.Element, columns: List[Tuple[int, str]]) -> List[Union[str, int]]:
     """
-    WordPress WXR (XML) dosyasından medya (attachment_url) ve içerik içindeki mutlak URL'leri çıkarır.
-    Sadece https? ile başlayan URL’leri döndürür.
+    Satırdan yalnızca istenen sütunların ham değerlerini alır; columns: [(sütun, harfler)].
+    Hücreler sütun sırasında olduğundan önce konumla (sütun-1) doğrudan atlanır; yoğun satırlarda O(1).
+    Eksik hücre varsa hedef daha solda kalır: oradan geriye doğru, harf ön eki karşılaştırılarak aranır.
     """
-    urls: List[str] = []
+    out: List[Union[str, int]] = []
+    n = len(row)
+    for col, letters in columns:
+        value: Union[str, int] = ""
+        target = _column_key(letters)
+        for pos in range(min(col, n) - 1, -1, -1):
+            c = row[pos]
+            r = c.get("r")
+            if r is None:
+                # r yoksa hücreler ardışıktır: konum sütunu verir
+                if pos == col - 1 and c.tag == _C:
+                    value = _cell_raw(c)
+                break
+            key = _column_key(r.rstrip(_DIGITS))
+            if key == target:
+                value = _cell_raw(c)
+                break
+            if key < target:
+                break  # hedef sütunun hücresi yok
+        out.append(value)
+    return out
 
-    def add(u: str):
-        if not u:
+def split_header_names(text: str) -> List[str]:
+    """Kullanıcı girişindeki virgülle ayrılmış başlık adları ("URL, Görsel URL")."""
+    return [name.strip() for name in (text or "").split(",") if name.strip()]
+
+def iter_urls_from_xlsx(xlsx_path: str, header_name: Union[str, Sequence[str]]) -> Iterator[str]:
+    """
+    İlk sayfadaki header satırında `header_name` başlığını (ya da başlık listesini) bulur;
+    altındaki URL'leri satır satır, her satırda başlıkların verildiği sırayla üretir.
+    Sayfa akış halinde okunur; satır içi metinler hemen üretilir. Paylaşılan dize (t="s") hücreleri
+    görüldüğü andan itibaren yalnızca sıra numarası tutulur, sayfa bitince sharedStrings.xml'den
+    sadece bu numaralar okunur (iki geçiş).
+    """
+    names = [header_name] if isinstance(header_name, str) else list(header_name)
+    with zipfile.ZipFile(xlsx_path, "r") as z:
+        rows = _iter_row_elems(z, _first_sheet_path(z))
+        header_row = next(rows, None)
+        if header_row is None:
             return
-        u = u.strip()
-        if u.lower().startswith(("http://", "https://")):
-            urls.append(u)
 
+        # başlıkları bul
+        header_cells = _row_cells(header_row)
+        header_texts = _resolve([raw for _col, raw in header_cells], z)
+        by_name: Dict[str, int] = {}
+        for (col, _raw), txt in zip(header_cells, header_texts):
+            by_name.setdefault((txt or "").strip().lower(), col)
+        columns: List[Tuple[int, str]] = []
+        for name in names:
+            col = by_name.get((name or "").strip().lower())
+            if col is None:
+                raise RuntimeError(f"'{name}' başlıklı sütun bulunamadı.")
+            columns.append((col, index_to_letters(col)))
+
+        # veri satırları: ilk paylaşılan dizeye kadar doğrudan üret, sonrasını sırayı bozmadan beklet
+        pending: List[Union[str, int]] = []
+        for row in rows:
+            for raw in _pick_cells(row, columns):
+                if isinstance(raw, int) or pending:
+                    pending.append(raw)
+                    continue
+                u = raw.strip()
+                if u:
+                    yield u
+        for u in _resolve(pending, z):
+            u = (u or "").strip()
+            if u:
+                yield u
+
+def read_urls_from_xlsx(xlsx_path: str, header_name: Union[str, Sequence[str]]) -> List[str]:
+    """
+    İlk sayfadaki header satırında `header_name` başlığını (ya da başlıklarını) bulur; altındaki URL'leri listeler.
+    """
+    return list(iter_urls_from_xlsx(xlsx_path, header_name))
+
+def read_result_rows_from_xlsx(xlsx_path: str) -> List[Tuple[str, Optional[float], str]]:
+    """
+    Bu uygulamanın ürettiği sonuç dosyasını okur (A=URL, E=Boyut (MB), F=Durum; her sayfada ilk satır başlık).
+    Çok sayfalı çıktılarda tüm sayfalar sırayla okunur. Dönen: [(url, size_mb, status)]
+    """
+    columns = [(1, "A"), (5, "E"), (6, "F")]
+    urls: List[Union[str, int]] = []
+    sizes: List[Union[str, int]] = []
+    statuses: List[Union[str, int]] = []
+    with zipfile.ZipFile(xlsx_path, "r") as z:
+        for path in _sheet_paths(z):
+            rows = _iter_row_elems(z, path)
+            next(rows, None)  # başlık
+            for row in rows:
+                url, size, status = _pick_cells(row, columns)
+                urls.append(url)
+                sizes.append(size)
+                statuses.append(status)
+        urls = _resolve(urls, z)
+        sizes = _resolve(sizes, z)
+        statuses = _resolve(statuses, z)
+
+    out: List[Tuple[str, Optional[float], str]] = []
+    for url, raw, status in zip(urls, sizes, statuses):
+        url = (url or "").strip()
+        if not url:
+            continue
+        raw = (raw or "").strip()
+        try:
+            size_mb = float(raw) if raw else None
+        except ValueError:
+            size_mb = None
+        out.append((url, size_mb, (status or "").strip()))
+    return out
+
+def read_workbook_modified(xlsx_path: str) -> Optional[datetime]:
+    """docProps/core.xml içindeki dcterms:modified (UTC); yoksa None."""
+    try:
+        with zipfile.ZipFile(xlsx_path, "r") as z:
+            core = ET.fromstring(z.read("docProps/core.xml"))
+    except (KeyError, OSError, zipfile.BadZipFile, ET.ParseError):
+        return None
+    node = core.find("{http://purl.org/dc/terms/}modified")
+    if node is None or not (node.text or "").strip():
+        return None
+    try:
+        when = datetime.fromisoformat(node.text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+
+# İçerik (content:encoded) içindeki href/src değerleri
+_WXR_LINK_RE = re.compile(r'(?:href|src)=[\'\"]([^\'\"]+)', re.IGNORECASE)
+
+def iter_urls_from_wxr(path: str, seen=None) -> Iterator[str]:
+    """
+    WordPress WXR (XML) dosyasından medya (attachment_url) ve içerik içindeki mutlak URL'leri sırayla üretir.
+    Sadece https? ile başlayan URL'ler; tekrarlar atlanır (ilk görülen sıra korunur).
+    Dosya belleğe alınmaz: iterparse doğrudan dosyadan parça parça okur, işlenen <item>'lar ağaçtan silinir;
+    bellek kullanımı tek bir <item> ve görülen URL'lerin özet kümesi kadardır.
+    seen: add(url) -> ilk kez mi (varsayılan dedup.DigestSet)
+    """
     if not is_xml(path):
         raise RuntimeError("XML modu yalnızca .xml dosyası kabul eder.")
 
-    with open(path, "rb") as f:
-        data = f.read()
+    if seen is None:
+        seen = DigestSet()
+
+    def fresh(u: str) -> Optional[str]:
+        if not u:
+            return None
+        u = u.strip()
+        if not u.lower().startswith(("http://", "https://")) or not seen.add(u):
+            return None
+        return u
 
     try:
-        for _event, elem in ET.iterparse(io.BytesIO(data), events=("end",)):
-            tag = elem.tag
-            if tag.endswith("item"):
+        with open(path, "rb") as f:
+            parents = []  # açık öğe yığını: biten <item> ebeveyninden silinir
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    parents.append(elem)
+                    continue
+                parents.pop()
+                if not elem.tag.endswith("item"):
+                    continue
                 post_type = None
                 att_url = None
                 content_text = None
@@ -155,19 +336,24 @@ def read_urls_from_wxr(path: str) -> List[str]:
                     elif ttag.endswith("encoded"):
                         content_text = child.text or ""
                 if post_type == "attachment" and att_url:
-                    add(att_url)
+                    u = fresh(att_url)
+                    if u:
+                        yield u
                 if content_text:
-                    for m in re.finditer(r'(?:href|src)=[\'\"]([^\'\"]+)', content_text, re.IGNORECASE):
-                        add(m.group(1))
-                elem.clear()
+                    for m in _WXR_LINK_RE.finditer(content_text):
+                        u = fresh(m.group(1))
+                        if u:
+                            yield u
+                if parents:
+                    parents[-1].remove(elem)
+                else:
+                    elem.clear()
     except ET.ParseError as e:
         raise RuntimeError(f"XML parse hatası: {e}") from e
 
-    # Tekilleştir (sıra korunur)
-    seen = set()
-    uniq = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            uniq.append(u)
-    return uniq
+def read_urls_from_wxr(path: str, seen=None) -> List[str]:
+    """
+    WordPress WXR (XML) dosyasından medya (attachment_url) ve içerik içindeki mutlak URL'leri çıkarır.
+    Sadece https? ile başlayan URL’leri döndürür.
+    """
+    return list(iter_urls_from_wxr(path, seen))
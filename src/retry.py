@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Yeniden deneme motoru: üstel geri çekilme + rastgele sapma (jitter) + çalışma başına genel bütçe.
+- Sonuçlar "geçici" (zaman aşımı, bağlantı kopması, 408/425/429/5xx) ve "kalıcı" olarak ayrılır.
+- Geçici sonuç alan URL, bekleme süresi sonunda kuyruğun SONUNA ertelenir (taze işi bloklamaz).
+- Toplam yeniden deneme sayısı sınırlıdır; ölü bir host çalışma süresini patlatamaz.
+Harici paket YOK.
+"""
+
+import random
+import threading
+from typing import Dict, Hashable, Optional
+
+from src.internet_connection import ProbeResult, ERROR_TIMEOUT, ERROR_CONNECTION
+
+RETRYABLE_CODES = (408, 425, 429, 500, 502, 503, 504)
+RETRYABLE_ERRORS = (ERROR_TIMEOUT, ERROR_CONNECTION)
+
+
+def is_retryable(r: ProbeResult) -> bool:
+    if r.code is None:
+        return r.error in RETRYABLE_ERRORS
+    return r.code in RETRYABLE_CODES
+
+
+class RetryPolicy:
+    """
+    - max_attempts: URL başına toplam deneme (ilk deneme dahil)
+    - base_delay / max_delay: üstel geri çekilme sınırları (sn); gecikme [0, min(max, base*2^n)] aralığında rastgele
+    - budget: çalışma boyunca yapılabilecek en fazla yeniden deneme
+    İş parçacığı güvenlidir.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 budget: int = 100, rng: Optional[random.Random] = None):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self.budget = max(0, int(budget))
+        self.used = 0
+        self._attempts: Dict[Hashable, int] = {}
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def budget_for(total: int, ratio: float = 0.1, minimum: int = 50) -> int:
+        """Girdi boyutuna göre bütçe: en az `minimum`, en fazla URL sayısının `ratio` katı kadar."""
+        return max(int(minimum), int(total * ratio))
+
+    def backoff(self, attempt: int) -> float:
+        """Tam jitter'lı üstel gecikme (attempt: 1 = ilk yeniden deneme)."""
+        cap = min(self.max_delay, self.base_delay * (2 ** min(attempt - 1, 16)))
+        return self._rng.uniform(0.0, cap)
+
+    def next_delay(self, key: Hashable, r: ProbeResult) -> Optional[float]:
+        """
+        Sonuç yeniden denenecekse bekleme süresini (sn) döndürür ve bütçeden düşer; aksi halde None.
+        Retry-After varsa gecikme ondan kısa olmaz.
+        """
+        with self._lock:
+            if not is_retryable(r):
+                self._attempts.pop(key, None)
+                return None
+            n = self._attempts.get(key, 1)
+            if n >= self.max_attempts or self.used >= self.budget:
+                self._attempts.pop(key, None)
+                return None
+            self._attempts[key] = n + 1
+            self.used += 1
+            delay = self.backoff(n)
+        if r.retry_after is not None:
+            delay = max(delay, min(self.max_delay, r.retry_after))
+        return delay
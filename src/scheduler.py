@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Host-duyarlı adil zamanlayıcı.
+- Bekleyen URL'ler host'a göre gruplanır; hostlar arasında sırayla (round-robin) seçim yapılır.
+- Host başına eşzamanlı (uçuştaki) istek sayısı sınırlıdır; yavaş bir host tüm işçileri tutamaz.
+- Ertelenen (yeniden denenecek) işler ayrı tutulur; süreleri dolunca ve taze iş verilemediğinde sıraya girer.
+Harici paket YOK.
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+Item = Tuple[int, str]
+
+
+def host_of(url: str) -> str:
+    """URL'nin host kısmı (küçük harf); ayrıştırılamazsa boş metin."""
+    try:
+        return (urlsplit((url or "").strip()).hostname or "").lower()
+    except Exception:
+        return ""
+
+
+class HostFairScheduler:
+    """
+    (index, url) çiftlerini host adaletine göre dağıtır.
+    - per_host_limit: host başına en fazla uçuştaki istek
+    - limit_fn: verilirse host başına sınırı dinamik olarak döndürür (per_host_limit yerine);
+      0 dönerse host geçici olarak iş almaz
+    Kullanım: next() ile iş al, iş bitince done(host) çağır.
+    Tek iş parçacığından (gönderim döngüsü) kullanılmak üzere tasarlanmıştır.
+    """
+
+    def __init__(self, items: Iterable[Item] = (), per_host_limit: int = 8,
+                 limit_fn: Optional[Callable[[str], int]] = None):
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.limit_fn = limit_fn
+        self._queues: Dict[str, Deque[Item]] = {}
+        self._ring: Deque[str] = deque()  # bekleyen işi olan hostlar (sıra = adalet)
+        self._in_flight: Dict[str, int] = {}
+        self._pending = 0
+        self._deferred: List[Tuple[float, int, int, str]] = []  # (not_before, seq, index, url)
+        self._seq = itertools.count()
+        for item in items:
+            self.add(*item)
+
+    def add(self, index: int, url: str) -> None:
+        """Bekleyen işlere ekler (yeniden kuyruğa alma için de kullanılır)."""
+        host = host_of(url)
+        q = self._queues.get(host)
+        if q is None:
+            q = self._queues[host] = deque()
+            self._ring.append(host)
+        q.append((index, url))
+        self._pending += 1
+
+    def defer(self, index: int, url: str, delay: float = 0.0) -> None:
+        """İşi `delay` sn sonra, taze işlerin arkasından yeniden verilmek üzere erteler."""
+        heapq.heappush(self._deferred, (time.monotonic() + max(0.0, delay), next(self._seq), index, url))
+
+    def _limit(self, host: str) -> int:
+        if self.limit_fn is not None:
+            try:
+                return max(0, int(self.limit_fn(host)))
+            except Exception:
+                pass
+        return self.per_host_limit
+
+    def next(self) -> Optional[Tuple[int, str, str]]:
+        """
+        Sıradaki işi döndürür: (index, url, host).
+        Önce taze işler; verilemiyorsa süresi dolmuş ertelenmiş işler.
+        Bekleyen iş yoksa ya da tüm hostlar sınırındaysa None.
+        """
+        for _ in range(len(self._ring)):
+            host = self._ring[0]
+            self._ring.rotate(-1)
+            if self._in_flight.get(host, 0) >= self._limit(host):
+                continue
+            q = self._queues[host]
+            index, url = q.popleft()
+            if not q:
+                del self._queues[host]
+                self._ring.pop()  # rotate sonrası bu host en sonda
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            self._pending -= 1
+            return index, url, host
+        return self._next_deferred()
+
+    def _next_deferred(self) -> Optional[Tuple[int, str, str]]:
+        now = time.monotonic()
+        skipped = []
+        found = None
+        while self._deferred and self._deferred[0][0] <= now:
+            entry = heapq.heappop(self._deferred)
+            host = host_of(entry[3])
+            if self._in_flight.get(host, 0) >= self._limit(host):
+                skipped.append(entry)
+                continue
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            found = (entry[2], entry[3], host)
+            break
+        for entry in skipped:
+            heapq.heappush(self._deferred, entry)
+        return found
+
+    def done(self, host: str) -> None:
+        n = self._in_flight.get(host, 0) - 1
+        if n > 0:
+            self._in_flight[host] = n
+        else:
+            self._in_flight.pop(host, None)
+
+    def pending(self) -> int:
+        """Bekleyen (taze + ertelenmiş) iş sayısı."""
+        return self._pending + len(self._deferred)
+
+    def next_deferred_in(self) -> Optional[float]:
+        """En yakın ertelenmiş işin hazır olmasına kalan süre (sn); yoksa None."""
+        if not self._deferred:
+            return None
+        return max(0.0, self._deferred[0][0] - time.monotonic())
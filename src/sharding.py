@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Çok süreçli (multiprocess) yoklama: milyonlarca URL'de tek sürecin GIL darboğazını aşmak için.
+- URL listesi blok blok (varsayılan 1000) süreçlere dağıtılır: blok k => süreç k % N.
+  Böylece aynı host'un URL'leri tüm süreçlere yayılır; host başına sınır süreç sayısına bölünür.
+- Her süreç kendi yoklama motorunu (engine.ProbeEngine), bağlantı havuzunu ve DNS önbelleğini kullanır.
+- Süreçler sonuçlarını kendi girdi sıralarına dizip toplu gönderir; ana süreç akışları heapq.merge ile
+  ÖZGÜN sırada birleştirir (tüm sonuç kümesi beklenmez).
+- Alt süreç hata verir ya da beklenmedik şekilde sonlanırsa ana süreçte ShardError yükselir;
+  eksik sonuçla sessizce bitirilmez (boşluk yalnızca iptalde olağandır).
+Windows/PyInstaller: giriş noktasında multiprocessing.freeze_support() çağrılmalıdır.
+Harici paket YOK.
+"""
+
+import heapq
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.engine import ProbeEngine, ProbeRecord
+from src.probe_cache import ProbeCache, DEFAULT_TTL
+from src.host_capabilities import HostCapabilities
+
+DEFAULT_BLOCK_SIZE = 1000
+
+# Süreçten ana sürece gönderilen paket büyüklüğü / en uzun bekletme (sn)
+_BATCH_SIZE = 500
+_BATCH_INTERVAL = 0.5
+
+
+class ShardError(RuntimeError):
+    """Bir alt süreç dilimini tamamlayamadı (istisna ya da beklenmedik sonlanma)."""
+
+
+class _ShardFailure(NamedTuple):
+    """Alt süreçten gönderilen hata işareti (normal bitişteki None'dan ayrı)."""
+    message: str
+
+
+def default_processes() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def shard_items(urls: Sequence[str], processes: int,
+                block_size: int = DEFAULT_BLOCK_SIZE) -> List[List[Tuple[int, str]]]:
+    """(genel_index, url) listelerini döndürür; her liste genel index'e göre artan sıradadır."""
+    shards: List[List[Tuple[int, str]]] = [[] for _ in range(processes)]
+    for start in range(0, len(urls), block_size):
+        block = range(start, min(start + block_size, len(urls)))
+        shards[(start // block_size) % processes].extend((i, urls[i]) for i in block)
+    return shards
+
+
+def _shard_worker(items, engine_options, cache_options, caps_path, out_q, pause, cancel) -> None:
+    """Alt süreç: kendi dilimini yoklar, sonuçları girdi sırasıyla [(genel_index, ProbeResult)] paketleri olarak yollar."""
+    cache = None
+    caps = None
+    try:
+        if cache_options is not None:
+            try:
+                cache = ProbeCache(cache_options["path"], ttl=cache_options["ttl"])
+            except Exception:
+                cache = None
+        caps = HostCapabilities(caps_path)
+        caps.load()
+        engine = ProbeEngine(cache=cache, caps=caps, pause=pause, cancel=cancel, **engine_options)
+
+        pending = {}
+        next_local = 0
+        batch = []
+        last_sent = time.monotonic()
+        for rec in engine.run(u for _g, u in items):
+            pending[rec.index] = rec.result
+            # Yerel sırayla sürekli olan kısmı gönder (genel index'ler de artan sırada kalır)
+            while next_local in pending:
+                batch.append((items[next_local][0], pending.pop(next_local)))
+                next_local += 1
+            if batch and (len(batch) >= _BATCH_SIZE or time.monotonic() - last_sent >= _BATCH_INTERVAL):
+                out_q.put(batch)
+                batch = []
+                last_sent = time.monotonic()
+        if batch:
+            out_q.put(batch)
+    except BaseException as e:
+        out_q.put(_ShardFailure(f"{type(e).__name__}: {e}"))
+        return
+    finally:
+        if cache is not None:
+            try:
+                cache.close()
+            except Exception:
+                pass
+        # Öğrenilenler sonraki çalışmalara kalsın (son kaydeden kazanır; dosya yazımı atomik)
+        if caps is not None:
+            try:
+                caps.save()
+            except Exception:
+                pass
+    out_q.put(None)
+
+
+def _mirror(src: Optional[threading.Event], dst) -> None:
+    if src is None:
+        return
+    if src.is_set() and not dst.is_set():
+        dst.set()
+    elif not src.is_set() and dst.is_set():
+        dst.clear()
+
+
+def _shard_stream(out_q, proc, pause, cancel, mp_pause, mp_cancel) -> Iterator[Tuple[int, object]]:
+    while True:
+        # Ana süreçteki duraklat/iptal durumunu alt süreçlere yansıt
+        _mirror(pause, mp_pause)
+        _mirror(cancel, mp_cancel)
+        try:
+            batch = out_q.get(timeout=0.2)
+        except queue.Empty:
+            if not proc.is_alive() and out_q.empty():
+                if proc.exitcode and not mp_cancel.is_set():
+                    raise ShardError(f"Alt süreç beklenmedik şekilde sonlandı (çıkış kodu {proc.exitcode}).")
+                return
+            continue
+        if batch is None:
+            return
+        if isinstance(batch, _ShardFailure):
+            raise ShardError(f"Alt süreç hata verdi: {batch.message}")
+        yield from batch
+
+
+def probe_urls_sharded(urls: Sequence[str], processes: Optional[int] = None,
+                       block_size: int = DEFAULT_BLOCK_SIZE,
+                       pause: Optional[threading.Event] = None, cancel: Optional[threading.Event] = None,
+                       cache_enabled: bool = True, cache_path: Optional[str] = None,
+                       cache_ttl: float = DEFAULT_TTL, host_caps_path: Optional[str] = None,
+                       **engine_options) -> Iterator[ProbeRecord]:
+    """
+    URL'leri `processes` alt sürece bölerek yoklar; ProbeRecord'ları GİRDİ SIRASIYLA üretir.
+    engine_options: ProbeEngine ayarları (backend, concurrency, timeout, per_host_limit, ...);
+    concurrency ve per_host_limit süreç başınadır, per_host_limit süreç sayısına bölünür.
+    İptalde alt süreçler durdurulur, sıradaki ilk eksik sonuçtan sonrası üretilmez.
+    İptal dışında eksik kalan sonuç ShardError yükseltir.
+    """
+    processes = max(1, min(int(processes or default_processes()),
+                           (len(urls) + block_size - 1) // block_size or 1))
+    engine_options = dict(engine_options)
+    engine_options.pop("on_probe", None)  # süreçler arası taşınamaz
+    engine_options["per_host_limit"] = max(1, int(engine_options.get("per_host_limit", 8)) // processes)
+    cache_options = {"path": cache_path, "ttl": cache_ttl} if cache_enabled else None
+
+    # Tk/iş parçacıkları içeren ana süreçte fork güvenli değil; her platformda spawn
+    ctx = multiprocessing.get_context("spawn")
+    mp_pause = ctx.Event()
+    mp_cancel = ctx.Event()
+    procs = []
+    queues = []
+    streams = []
+    for items in shard_items(urls, processes, block_size):
+        out_q = ctx.Queue()
+        p = ctx.Process(target=_shard_worker,
+                        args=(items, engine_options, cache_options, host_caps_path, out_q, mp_pause, mp_cancel),
+                        daemon=True)
+        p.start()
+        procs.append(p)
+        queues.append(out_q)
+        streams.append(_shard_stream(out_q, p, pause, cancel, mp_pause, mp_cancel))
+
+    try:
+        expected = 0
+        for index, result in heapq.merge(*streams, key=lambda pair: pair[0]):
+            # İptal edilen dilim boşluk bırakır: girdi sırası bozulmasın diye orada durulur
+            if index != expected:
+                break
+            yield ProbeRecord(index, urls[index], result)
+            expected += 1
+        if expected < len(urls) and not (mp_cancel.is_set() or (cancel is not None and cancel.is_set())):
+            raise ShardError(f"Alt süreçlerden {len(urls) - expected} sonuç eksik geldi.")
+    finally:
+        mp_cancel.set()
+        # Alt süreç, kuyruğa yazdıkları okunmadan kapanamaz: kapanana kadar boşalt
+        deadline = time.monotonic() + 5.0
+        for p, out_q in zip(procs, queues):
+            while p.is_alive() and time.monotonic() < deadline:
+                try:
+                    out_q.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            if p.is_alive():
+                p.terminate()
+            p.join(timeout=1.0)
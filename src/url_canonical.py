@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+URL normalleştirme ve tekilleştirme: aynı kaynağı gösteren yazım farklarını tek bir anahtara indirger.
+- Yoklama motoru (engine.ProbeEngine) her girdi satırını kanonik anahtara eşler; yalnızca farklı
+  anahtarlar yoklanır, sonuçlar çıktıda tüm özgün satırlara dağıtılır.
+Harici paket YOK.
+"""
+
+import re
+from urllib.parse import quote, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# RFC 3986 "unreserved" karakterler: %XX biçimi çözülür
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+_PCT_RE = re.compile(r"%([0-9A-Fa-f]{2})")
+
+# Yol ve sorguda olduğu gibi bırakılan karakterler (ayraçlar + mevcut % kaçışları)
+_PATH_SAFE = "/:@!$&'()*+,;=%"
+_QUERY_SAFE = "/:@!$&'()*+,;=?%"
+
+
+def _normalize_escapes(text: str) -> str:
+    """%7e -> ~ (unreserved çözülür), %2f -> %2F (hex büyük harf)."""
+    def _fix(m):
+        ch = chr(int(m.group(1), 16))
+        return ch if ch in _UNRESERVED else "%" + m.group(1).upper()
+    return _PCT_RE.sub(_fix, text)
+
+
+def _encode_component(text: str, safe: str) -> str:
+    # Yalnız başına kalan % (geçerli kaçış değil) %25 olur
+    text = re.sub(r"%(?![0-9A-Fa-f]{2})", "%25", text)
+    return _normalize_escapes(quote(text, safe=safe))
+
+
+def _canonical_host(host: str) -> str:
+    host = host.lower().rstrip(".")
+    if host and not host.isascii():
+        try:
+            host = host.encode("idna").decode("ascii")
+        except UnicodeError:
+            pass
+    return host
+
+
+def canonical_url(url: str) -> str:
+    """
+    Karşılaştırma/anahtar amaçlı normal biçim.
+    - şema ve host küçük harf (IDN => punycode), varsayılan port atılır
+    - boş yol "/" olur, #fragment atılır
+    - boşluk/ASCII dışı karakterler %XX'e çevrilir, gereksiz kaçışlar çözülür ("a b" == "a%20b")
+    Ayrıştırılamayan değerler kırpılmış haliyle döner.
+    """
+    u = (url or "").strip()
+    try:
+        p = urlsplit(u)
+        scheme = p.scheme.lower()
+        host = _canonical_host(p.hostname or "")
+        if not scheme or not host:
+            return u
+        if ":" in host:  # IPv6
+            host = f"[{host}]"
+        port = p.port
+        netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+        if p.username or p.password:
+            userinfo = p.username or ""
+            if p.password:
+                userinfo += ":" + p.password
+            netloc = f"{userinfo}@{netloc}"
+        path = _encode_component(p.path or "/", _PATH_SAFE)
+        query = _encode_component(p.query, _QUERY_SAFE)
+        return urlunsplit((scheme, netloc, path, query, ""))
+    except ValueError:
+        return u
+
@@ -1,16 +1,22 @@
 # -*- coding: utf-8 -*-
 """
-Çıktı işlemleri: XLSX oluşturucu ve URL parça/biçim yardımcıları.
-Harici paket YOK (zip + basit XML).
+Çıktı işlemleri: XLSX oluşturucu, düz çıktı yazıcıları (CSV / JSONL / SQLite) ve URL parça/biçim yardımcıları.
+Harici paket YOK (zip + basit XML, csv, sqlite3).
 """
 
 from datetime import datetime, timezone
+import csv
+import json
+import re
 import os
 import posixpath
+import sqlite3
+import tempfile
 import zipfile
+from functools import lru_cache
 from xml.sax.saxutils import escape as xml_escape
 from urllib.parse import urlparse, unquote
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 
 # --- URL yardımcıları ---
 
@@ -41,131 +47,329 @@ def excel_quote(s: str) -> str:
         return ""
     return s.replace('"', '""')
 
+# XML 1.0'da geçersiz karakterler: izinli olanlar TAB/LF/CR, U+0020–U+D7FF, U+E000–U+FFFD
+_XML_INVALID_RE = re.compile("[^\t\n\r\u0020-\ud7ff\ue000-\ufffd]")
+_XML_SPECIAL_RE = re.compile("[&<>]")
+
 def xml_sanitize(s: str) -> str:
-    if s is None:
+    if not s:
+        return ""
+    # Çoğu değer temizdir: tek regex taraması, gerekmedikçe kopya yok
+    if _XML_INVALID_RE.search(s) is None:
+        return s
+    return _XML_INVALID_RE.sub("", s)
+
+def xml_text(s: str) -> str:
+    """xml_escape(xml_sanitize(s)) — temiz ve kaçış gerektirmeyen dizeler olduğu gibi döner."""
+    if not s:
         return ""
-    out = []
-    for ch in s:
-        oc = ord(ch)
-        if oc in (0x09, 0x0A, 0x0D) or (0x20 <= oc <= 0xD7FF) or (0xE000 <= oc <= 0xFFFD):
-            out.append(ch)
-    return "".join(out)
+    if _XML_INVALID_RE.search(s) is not None:
+        s = _XML_INVALID_RE.sub("", s)
+    if _XML_SPECIAL_RE.search(s) is None:
+        return s
+    return xml_escape(s)
+
+# Uzantı/Durum gibi az çeşitli, sık tekrar eden değerler için
+_xml_text_cached = lru_cache(maxsize=4096)(xml_text)
 
 def pixels_to_col_width(pixels: int) -> float:
     return round(max(0, (pixels - 5) / 7.0), 2)
 
-class XlsxBuilder:
-    """
-    Minimal XLSX oluşturucu.
-    - Stil: 0 normal, 1 başlık (bold), 2 hyperlink (mavi+altı çizili), 3 sayı 0.00
-    - Sütunlar: A=Dosya URL'si, B=Dosya adı, C=Uzunluk, D=Uzantı, E=Boyut (MB), F=Durum
-    """
-    def __init__(self):
-        self.rows: List[Tuple[str, str, int, str, Optional[float], str]] = []
-        self._hyperlinks = []  # [(cell_ref, url)]
-
-    def add_row(self, url: str, fname: str, fname_len: int, ext: str, size_mb: Optional[float], status: str):
-        self.rows.append((url or "", fname or "", fname_len or 0, ext or "", size_mb, status or ""))
+SHEET_TITLE = "URL Boyut Hesaplayıcı"
+
+# Excel sayfa sınırı 1.048.576 satır; ilk satır başlık
+MAX_SHEET_ROWS = 1048575
+
+SHEET_HEADERS = ("Dosya URL'si", "Dosya adı", "Uzunluk", "Uzantı", "Boyut (MB)", "Durum")
+
+
+def _sheet_head_xml(total_rows: Optional[int]) -> str:
+    cw1 = pixels_to_col_width(900)
+    cw2 = pixels_to_col_width(225)
+    cw3 = pixels_to_col_width(75)
+    cw4 = pixels_to_col_width(75)
+    cw5 = pixels_to_col_width(100)
+    cw6 = pixels_to_col_width(75)
+
+    parts = []
+    parts.append(
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    )
+    # dimension isteğe bağlıdır: satır sayısı baştan bilinmiyorsa yazılmaz
+    if total_rows is not None:
+        parts.append(f'<dimension ref="A1:F{total_rows}"/>')
+    parts.append('<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>')
+    parts.append('<sheetFormatPr defaultRowHeight="15"/>')
+    parts.append('<cols>'
+                 f'<col min="1" max="1" width="{cw1}" customWidth="1"/>'
+                 f'<col min="2" max="2" width="{cw2}" customWidth="1"/>'
+                 f'<col min="3" max="3" width="{cw3}" customWidth="1"/>'
+                 f'<col min="4" max="4" width="{cw4}" customWidth="1"/>'
+                 f'<col min="5" max="5" width="{cw5}" customWidth="1"/>'
+                 f'<col min="6" max="6" width="{cw6}" customWidth="1"/>'
+                 '</cols>')
+    parts.append("<sheetData>")
+
+    parts.append('<row r="1">')
+    for i, text in enumerate(SHEET_HEADERS, start=1):
+        col = "ABCDEF"[i - 1]
+        safe = xml_escape(text)
+        parts.append(
+            f'<c r="{col}1" t="inlineStr" s="1">'
+            f"<is><t>{safe}</t></is>"
+            f"</c>"
+        )
+    parts.append("</row>")
+    return "".join(parts)
 
-    def _sheet_xml(self):
-        total_rows = len(self.rows) + 1
-        dim_ref = f"A1:F{total_rows}"
 
-        cw1 = pixels_to_col_width(900)
-        cw2 = pixels_to_col_width(225)
-        cw3 = pixels_to_col_width(75)
-        cw4 = pixels_to_col_width(75)
-        cw5 = pixels_to_col_width(100)
-        cw6 = pixels_to_col_width(75)
+class SharedStrings:
+    """
+    Paylaşılan dize tablosu (xl/sharedStrings.xml): tekrar eden değerler tek kez saklanır,
+    hücrelere yalnızca sıra numarası yazılır.
+    - max_unique: tablo bu kadar farklı dizeye ulaşınca yeni değerler satır içi (inlineStr) yazılır;
+      böylece bellek kullanımı sınırlı kalır.
+    """
 
-        parts = []
-        parts.append(
-            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
-            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        )
-        parts.append(f'<dimension ref="{dim_ref}"/>')
-        parts.append('<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>')
-        parts.append('<sheetFormatPr defaultRowHeight="15"/>')
-        parts.append('<cols>'
-                     f'<col min="1" max="1" width="{cw1}" customWidth="1"/>'
-                     f'<col min="2" max="2" width="{cw2}" customWidth="1"/>'
-                     f'<col min="3" max="3" width="{cw3}" customWidth="1"/>'
-                     f'<col min="4" max="4" width="{cw4}" customWidth="1"/>'
-                     f'<col min="5" max="5" width="{cw5}" customWidth="1"/>'
-                     f'<col min="6" max="6" width="{cw6}" customWidth="1"/>'
-                     '</cols>')
-        parts.append("<sheetData>")
-
-        headers = ["Dosya URL'si", "Dosya adı", "Uzunluk", "Uzantı", "Boyut (MB)", "Durum"]
-        parts.append('<row r="1">')
-        for i, text in enumerate(headers, start=1):
-            col = "ABCDEF"[i - 1]
-            safe = xml_escape(text)
-            parts.append(
-                f'<c r="{col}1" t="inlineStr" s="1">'
-                f"<is><t>{safe}</t></is>"
-                f"</c>"
-            )
-        parts.append("</row>")
+    def __init__(self, max_unique: int = 65536):
+        self.max_unique = max_unique
+        self.count = 0
+        self._index = {}
+        self._strings: List[str] = []
+
+    def index(self, text: str) -> Optional[int]:
+        i = self._index.get(text)
+        if i is None:
+            if len(self._strings) >= self.max_unique:
+                return None
+            i = self._index[text] = len(self._strings)
+            self._strings.append(text)
+        self.count += 1
+        return i
+
+    def xml(self) -> str:
+        parts = [
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            f'count="{self.count}" uniqueCount="{len(self._strings)}">'
+        ]
+        for text in self._strings:
+            space = ' xml:space="preserve"' if text != text.strip() else ""
+            parts.append(f"<si><t{space}>{text}</t></si>")
+        parts.append("</sst>")
+        return "".join(parts)
 
-        for idx, (url, fname, fname_len, ext, size_mb, status) in enumerate(self.rows, start=2):
-            parts.append(f'<row r="{idx}">')
 
-            raw_url = xml_sanitize(url or "")
-            safe_display = xml_escape(raw_url)
-            if raw_url and len(raw_url) <= 255:
-                q = excel_quote(raw_url)
-                formula = f'HYPERLINK("{q}")'
-                safe_formula = xml_escape(formula)
-                parts.append(f'<c r="A{idx}" s="2" t="str"><f>{safe_formula}</f><v>{safe_display}</v></c>')
-            else:
-                parts.append(f'<c r="A{idx}" t="inlineStr" s="2"><is><t>{safe_display}</t></is></c>')
-                if raw_url:
-                    self._hyperlinks.append((f"A{idx}", raw_url))
+def _str_cell(ref: str, text: str, sst: Optional[SharedStrings]) -> str:
+    """Metin hücresi; text XML'e hazır (temizlenmiş + kaçışlı) olmalıdır."""
+    if sst is not None:
+        i = sst.index(text)
+        if i is not None:
+            return f'<c r="{ref}" t="s"><v>{i}</v></c>'
+    return f'<c r="{ref}" t="inlineStr"><is><t>{text}</t></is></c>'
 
-            safe_name = xml_escape(xml_sanitize(fname or ""))
-            parts.append(f'<c r="B{idx}" t="inlineStr"><is><t>{safe_name}</t></is></c>')
 
-            parts.append(f'<c r="C{idx}" s="0"><v>{fname_len}</v></c>')
+def _row_xml(idx: int, url: str, fname: str, fname_len: int, ext: str,
+             size_mb: Optional[float], status: str,
+             sst: Optional[SharedStrings] = None) -> Tuple[str, Optional[str]]:
+    """
+    (satır XML'i, ilişki olarak eklenecek hyperlink URL'si ya da None)
+    sst verilirse tekrar eden Uzantı/Durum değerleri paylaşılan dize olarak yazılır
+    (dosya adları çoğunlukla tekil olduğundan satır içi kalır).
+    """
+    link = None
+    raw_url = xml_sanitize(url)
+    safe_display = xml_escape(raw_url) if _XML_SPECIAL_RE.search(raw_url) else raw_url
+    if raw_url and len(raw_url) <= 255:
+        # xml_escape tırnağa, excel_quote &<>'ya dokunmaz: sıra fark etmez, ikinci kaçış gerekmez
+        cell_a = (f'<c r="A{idx}" s="2" t="str"><f>HYPERLINK("{excel_quote(safe_display)}")</f>'
+                  f'<v>{safe_display}</v></c>')
+    else:
+        cell_a = f'<c r="A{idx}" t="inlineStr" s="2"><is><t>{safe_display}</t></is></c>'
+        if raw_url:
+            link = raw_url
+
+    if size_mb is None:
+        cell_e = f'<c r="E{idx}" s="3"/>'
+    else:
+        cell_e = f'<c r="E{idx}" s="3"><v>{size_mb}</v></c>'
+
+    # Tek biçimlendirme: satır başına ara liste/birleştirme yok
+    return (
+        f'<row r="{idx}">{cell_a}'
+        f'<c r="B{idx}" t="inlineStr"><is><t>{xml_text(fname)}</t></is></c>'
+        f'<c r="C{idx}" s="0"><v>{fname_len or 0}</v></c>'
+        f'{_str_cell(f"D{idx}", _xml_text_cached(ext or ""), sst)}'
+        f'{cell_e}'
+        f'{_str_cell(f"F{idx}", _xml_text_cached(status or ""), sst)}'
+        "</row>"
+    ), link
+
+
+def _sheet_tail_parts(total_rows: int, link_refs) -> Iterator[str]:
+    """</sheetData> sonrası: autoFilter + (varsa) hyperlink listesi; link_refs: hücre başvuruları."""
+    yield "</sheetData>"
+    yield f'<autoFilter ref="A1:F{total_rows}"/>'
+    first = True
+    for i, cell_ref in enumerate(link_refs, start=1):
+        if first:
+            yield "<hyperlinks>"
+            first = False
+        yield f'<hyperlink ref="{cell_ref}" r:id="rIdHL{i}"/>'
+    if not first:
+        yield "</hyperlinks>"
+    yield "</worksheet>"
+
+
+def _sheet_rels_parts(link_urls) -> Iterator[str]:
+    yield '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    for i, url in enumerate(link_urls, start=1):
+        tgt = xml_escape(url)
+        yield (
+            f'<Relationship Id="rIdHL{i}" '
+            f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" '
+            f'Target="{tgt}" TargetMode="External"/>'
+        )
+    yield "</Relationships>"
 
-            safe_ext = xml_escape(xml_sanitize(ext or ""))
-            parts.append(f'<c r="D{idx}" t="inlineStr"><is><t>{safe_ext}</t></is></c>')
 
-            if size_mb is None:
-                parts.append(f'<c r="E{idx}" s="3"/>')
-            else:
-                parts.append(f'<c r="E{idx}" s="3"><v>{size_mb}</v></c>')
+def _write_parts(f, parts, chunk: int = 1000) -> None:
+    """Dize parçalarını toplu halde UTF-8 olarak yazar."""
+    buf = []
+    for part in parts:
+        buf.append(part)
+        if len(buf) >= chunk:
+            f.write("".join(buf).encode("utf-8"))
+            buf.clear()
+    if buf:
+        f.write("".join(buf).encode("utf-8"))
 
-            safe_stat = xml_escape(xml_sanitize(status or ""))
-            parts.append(f'<c r="F{idx}" t="inlineStr"><is><t>{safe_stat}</t></is></c>')
 
-            parts.append("</row>")
+class StreamingXlsxWriter:
+    """
+    Akışlı XLSX yazıcı: satırlar geldikçe doğrudan zip içindeki sayfa XML'ine yazılır;
+    tüm sayfa bellekte tutulmaz (bellek kullanımı satır sayısından bağımsızdır).
+    - Sayfa başına en fazla max_sheet_rows veri satırı (Excel sınırı 1.048.576, başlık dahil);
+      aşılınca yeni sayfa açılır. Çalışma kitabı, ilişki ve içerik türü parçaları kapanışta yazılır.
+    - 255 karakterden uzun URL'lerin hyperlink ilişkileri geçici dosyada biriktirilir, sayfa kapanırken yazılır.
+    - total_rows (başlık dahil) biliniyorsa <dimension> yazılır.
+    - Stil: 0 normal, 1 başlık (bold), 2 hyperlink (mavi+altı çizili), 3 sayı 0.00
+    - Sütunlar: A=Dosya URL'si, B=Dosya adı, C=Uzunluk, D=Uzantı, E=Boyut (MB), F=Durum
+    - shared_strings: True ise Uzantı/Durum sütunları xl/sharedStrings.xml tablosuna işaret eder
+      (büyük çıktılarda daha küçük dosya, daha hızlı kayıt ve açılış).
+    Kullanım: with StreamingXlsxWriter(path) as w: w.add_row(...)
+    """
 
-        parts.append("</sheetData>")
-        parts.append(f'<autoFilter ref="A1:F{total_rows}"/>')
+    _FLUSH_ROWS = 1000
 
-        if self._hyperlinks:
-            parts.append("<hyperlinks>")
-            for i, (cell_ref, _url) in enumerate(self._hyperlinks, start=1):
-                rid = f"rIdHL{i}"
-                parts.append(f'<hyperlink ref="{cell_ref}" r:id="{rid}"/>')
-            parts.append("</hyperlinks>")
+    def __init__(self, path: str, total_rows: Optional[int] = None, shared_strings: bool = False,
+                 max_sheet_rows: int = MAX_SHEET_ROWS):
+        os.makedirs(os.path.dirname(path), exist_ok=True) if os.path.dirname(path) else None
+        self.path = path
+        self.total_rows = total_rows
+        self.max_sheet_rows = max(1, min(int(max_sheet_rows), MAX_SHEET_ROWS))
+        self.row_count = 0
+        self.sheet_count = 0
+        self._sheet = None
+        self._sheet_rows = 0
+        self._links = 0
+        self._spool = None
+        self._closed = False
+        self._buf: List[str] = []
+        self._sst = SharedStrings() if shared_strings else None
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _open_sheet(self):
+        self.sheet_count += 1
+        self._sheet_rows = 0
+        self._links = 0
+        rows_in_sheet = None
+        if self.total_rows is not None:
+            remaining = self.total_rows - 1 - self.row_count
+            rows_in_sheet = max(0, min(remaining, self.max_sheet_rows)) + 1
+        self._spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+        # Boyut baştan bilinmez: >4 GB sayfa için ZIP64 önceden açılır
+        self._sheet = self._zip.open(f"xl/worksheets/sheet{self.sheet_count}.xml", "w", force_zip64=True)
+        self._sheet.write(_sheet_head_xml(rows_in_sheet).encode("utf-8"))
 
-        parts.append("</worksheet>")
-        return "".join(parts)
+    def add_row(self, url: str, fname: str, fname_len: int, ext: str, size_mb: Optional[float], status: str):
+        if self._sheet is None or self._sheet_rows >= self.max_sheet_rows:
+            self._close_sheet()
+            self._open_sheet()
+        self.row_count += 1
+        self._sheet_rows += 1
+        idx = self._sheet_rows + 1
+        xml, link = _row_xml(idx, url, fname, fname_len, ext, size_mb, status, self._sst)
+        self._buf.append(xml)
+        if link is not None:
+            self._links += 1
+            self._spool.write(json.dumps([f"A{idx}", link], ensure_ascii=False) + "\n")
+        if len(self._buf) >= self._FLUSH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._buf:
+            self._sheet.write("".join(self._buf).encode("utf-8"))
+            self._buf.clear()
+
+    def _spooled_links(self):
+        self._spool.seek(0)
+        for line in self._spool:
+            yield json.loads(line)
+
+    def _close_sheet(self):
+        """Açık sayfayı (sonu + hyperlink'ler) kapatır, ilişkilerini yazar."""
+        if self._sheet is None:
+            return
+        try:
+            self._flush()
+            refs = (ref for ref, _u in self._spooled_links()) if self._links else ()
+            _write_parts(self._sheet, _sheet_tail_parts(self._sheet_rows + 1, refs))
+            self._sheet.close()
+            self._sheet = None
+            if self._links:
+                name = f"xl/worksheets/_rels/sheet{self.sheet_count}.xml.rels"
+                with self._zip.open(name, "w", force_zip64=True) as rels:
+                    _write_parts(rels, _sheet_rels_parts(u for _r, u in self._spooled_links()))
+        finally:
+            if self._sheet is not None:
+                self._sheet.close()
+                self._sheet = None
+            self._spool.close()
+            self._spool = None
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self.sheet_count == 0:
+                self._open_sheet()  # boş çıktıda da başlıklı bir sayfa olsun
+            self._close_sheet()
+            z = self._zip
+            if self._sst is not None:
+                z.writestr("xl/sharedStrings.xml", self._sst.xml())
+            z.writestr("[Content_Types].xml", self._content_types_xml())
+            z.writestr("_rels/.rels", self._rels_root_xml())
+            z.writestr("docProps/app.xml", self._docprops_app_xml())
+            z.writestr("docProps/core.xml", self._docprops_core_xml())
+            z.writestr("xl/workbook.xml", self._workbook_xml())
+            z.writestr("xl/_rels/workbook.xml.rels", self._wb_rels_xml())
+            z.writestr("xl/styles.xml", self._styles_xml())
+        finally:
+            if self._spool is not None:
+                self._spool.close()
+            self._zip.close()
 
-    def _sheet_rels_xml(self):
-        rels = ['<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">']
-        for i, (_ref, url) in enumerate(self._hyperlinks, start=1):
-            rid = f"rIdHL{i}"
-            tgt = xml_escape(xml_sanitize(url or ""))
-            rels.append(
-                f'<Relationship Id="{rid}" '
-                f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" '
-                f'Target="{tgt}" TargetMode="External"/>'
-            )
-        rels.append("</Relationships>")
-        return "".join(rels)
+    def _sheet_names(self) -> List[str]:
+        return [SHEET_TITLE if i == 1 else f"{SHEET_TITLE} ({i})" for i in range(1, self.sheet_count + 1)]
 
     def _styles_xml(self):
         return (
@@ -191,30 +395,54 @@ class XlsxBuilder:
         )
 
     def _workbook_xml(self):
+        sheets = "".join(
+            f'<sheet name="{xml_escape(name)}" sheetId="{i}" r:id="rIdS{i}"/>'
+            for i, name in enumerate(self._sheet_names(), start=1)
+        )
         return (
             '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
             'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-            '<sheets><sheet name="URL Boyut Hesaplayıcı" sheetId="1" r:id="rId1"/></sheets>'
+            f'<sheets>{sheets}</sheets>'
             '<calcPr fullCalcOnLoad="1"/>'
             '</workbook>'
         )
 
     def _wb_rels_xml(self):
+        sheets = "".join(
+            f'<Relationship Id="rIdS{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, self.sheet_count + 1)
+        )
+        sst = ""
+        if self._sst is not None:
+            sst = ('<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+                   'Target="sharedStrings.xml"/>')
         return (
             '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'{sheets}'
             '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+            f'{sst}'
             '</Relationships>'
         )
 
     def _content_types_xml(self):
+        sheets = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, self.sheet_count + 1)
+        )
+        sst = ""
+        if self._sst is not None:
+            sst = ('<Override PartName="/xl/sharedStrings.xml" '
+                   'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>')
         return (
             '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
             '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
             '<Default Extension="xml" ContentType="application/xml"/>'
             '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
-            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            f'{sheets}'
             '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{sst}'
             '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
             '<Override PartName="/docProps/app.xml" ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
             '</Types>'
@@ -228,14 +456,16 @@ class XlsxBuilder:
         )
 
     def _docprops_app_xml(self):
+        names = self._sheet_names()
+        titles = "".join(f"<vt:lpstr>{xml_escape(name)}</vt:lpstr>" for name in names)
         return (
             '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties" '
             'xmlns:vt="http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes">'
             '<Application>Python</Application><DocSecurity>0</DocSecurity><ScaleCrop>false</ScaleCrop>'
             '<HeadingPairs><vt:vector size="2" baseType="variant">'
-            '<vt:variant><vt:lpstr>Worksheets</vt:lpstr></vt:variant><vt:variant><vt:i4>1</vt:i4></vt:variant>'
+            f'<vt:variant><vt:lpstr>Worksheets</vt:lpstr></vt:variant><vt:variant><vt:i4>{len(names)}</vt:i4></vt:variant>'
             '</vt:vector></HeadingPairs>'
-            '<TitlesOfParts><vt:vector size="1" baseType="lpstr"><vt:lpstr>URL Boyut Hesaplayıcı</vt:lpstr></vt:vector></TitlesOfParts>'
+            f'<TitlesOfParts><vt:vector size="{len(names)}" baseType="lpstr">{titles}</vt:vector></TitlesOfParts>'
             '<Company/><LinksUpToDate>false</LinksUpToDate><SharedDoc>false</SharedDoc><HyperlinksChanged>false</HyperlinksChanged>'
             '<AppVersion>16.0000</AppVersion>'
             '</Properties>'
@@ -255,16 +485,144 @@ class XlsxBuilder:
             "</cp:coreProperties>"
         )
 
-    def save(self, path: str):
-        os.makedirs(os.path.dirname(path), exist_ok=True) if os.path.dirname(path) else None
-        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-            z.writestr("[Content_Types].xml", self._content_types_xml())
-            z.writestr("_rels/.rels", self._rels_root_xml())
-            z.writestr("docProps/app.xml", self._docprops_app_xml())
-            z.writestr("docProps/core.xml", self._docprops_core_xml())
-            z.writestr("xl/workbook.xml", self._workbook_xml())
-            z.writestr("xl/_rels/workbook.xml.rels", self._wb_rels_xml())
-            z.writestr("xl/styles.xml", self._styles_xml())
-            z.writestr("xl/worksheets/sheet1.xml", self._sheet_xml())
-            if self._hyperlinks:
-                z.writestr("xl/worksheets/_rels/sheet1.xml.rels", self._sheet_rels_xml())
+
+# --- Düz çıktı yazıcıları (XML/ZIP üretmeden, disk hızında) ---
+# Hepsi StreamingXlsxWriter ile aynı arayüzdedir: add_row(url, fname, fname_len, ext, size_mb, status), close()
+
+class CsvWriter:
+    """Satır satır CSV; utf-8-sig: Excel'de Türkçe karakterler doğru açılır."""
+
+    def __init__(self, path: str, **_options):
+        self._f = open(path, "w", encoding="utf-8-sig", newline="")
+        self._w = csv.writer(self._f)
+        self._w.writerow(SHEET_HEADERS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def add_row(self, url: str, fname: str, fname_len: int, ext: str, size_mb: Optional[float], status: str):
+        self._w.writerow((url, fname, fname_len, ext, "" if size_mb is None else size_mb, status))
+
+    def close(self):
+        self._f.close()
+
+
+class JsonlWriter:
+    """Satır başına bir JSON nesnesi (url, filename, length, ext, size_mb, status)."""
+
+    def __init__(self, path: str, **_options):
+        self._f = open(path, "w", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def add_row(self, url: str, fname: str, fname_len: int, ext: str, size_mb: Optional[float], status: str):
+        self._f.write(json.dumps({"url": url, "filename": fname, "length": fname_len, "ext": ext,
+                                  "size_mb": size_mb, "status": status}, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._f.close()
+
+
+class SqliteWriter:
+    """
+    SQLite tablosu: results(row, url, filename, length, ext, size_mb, status).
+    - Satırlar toplu (executemany) eklenir; url ve status indeksleri kapanışta oluşturulur
+      (boş tabloya ekleme, indeksli tabloya eklemeden hızlıdır).
+    - Dosya .tmp olarak yazılıp yerine taşındığından günlük (journal) kapalıdır.
+    """
+
+    _BATCH = 5000
+
+    def __init__(self, path: str, **_options):
+        if os.path.exists(path):
+            os.remove(path)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE results ("
+            "row INTEGER PRIMARY KEY, url TEXT NOT NULL, filename TEXT, length INTEGER, "
+            "ext TEXT, size_mb REAL, status TEXT)"
+        )
+        self._batch = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def add_row(self, url: str, fname: str, fname_len: int, ext: str, size_mb: Optional[float], status: str):
+        self._batch.append((url, fname, fname_len, ext, size_mb, status))
+        if len(self._batch) >= self._BATCH:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self._db.executemany(
+                "INSERT INTO results (url, filename, length, ext, size_mb, status) VALUES (?, ?, ?, ?, ?, ?)",
+                self._batch,
+            )
+            self._batch.clear()
+
+    def close(self):
+        if self._db is None:
+            return
+        try:
+            self._flush()
+            self._db.execute("CREATE INDEX idx_results_url ON results (url)")
+            self._db.execute("CREATE INDEX idx_results_status ON results (status)")
+            self._db.commit()
+        finally:
+            self._db.close()
+            self._db = None
+
+
+def _open_xlsx(path: str, shared_strings: bool = False, **_options):
+    return StreamingXlsxWriter(path, shared_strings=shared_strings)
+
+
+# Biçim adı (aynı zamanda dosya uzantısı) -> yazıcı fabrikası: factory(path, **options)
+OUTPUT_WRITERS = {
+    "xlsx": _open_xlsx,
+    "csv": CsvWriter,
+    "jsonl": JsonlWriter,
+    "sqlite": SqliteWriter,
+}
+
+
+def register_output(fmt: str, factory) -> None:
+    """Yeni çıktı biçimi ekler; factory(path, **options) add_row/close sunan bir nesne döndürmelidir."""
+    OUTPUT_WRITERS[fmt] = factory
+
+
+def output_format_for(path: str, default: str = "xlsx") -> str:
+    """Dosya uzantısından çıktı biçimi (tanınmıyorsa default)."""
+    ext = os.path.splitext(path or "")[1].lower().lstrip(".")
+    if ext == "db":
+        ext = "sqlite"
+    return ext if ext in OUTPUT_WRITERS else default
+
+
+def open_output(path: str, fmt: str = "xlsx", **options):
+    """
+    Akışlı çıktı yazıcısı açar. options: biçime özgü ayarlar (ör. xlsx için shared_strings);
+    biçimin tanımadığı ayarlar yok sayılır.
+    """
+    try:
+        factory = OUTPUT_WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Desteklenmeyen çıktı biçimi: {fmt}") from None
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return factory(path, **options)
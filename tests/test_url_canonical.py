@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Tekilleştirme anahtarı ile ağa giden istek aynı olmalı: "a b" ve "a%20b" aynı kaynaktır.
+Çalıştırma: python -m unittest discover -s tests
+"""
+
+import http.server
+import threading
+import unittest
+
+from src.engine import probe_urls
+from src.internet_connection import _safe_url
+from src.url_canonical import canonical_url
+
+
+class _OnlyEscapedSpace(http.server.BaseHTTPRequestHandler):
+    """Yalnızca /a%20b.jpg için 200 döner; başka her yol 404."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        ok = self.path == "/a%20b.jpg"
+        self.send_response(200 if ok else 404)
+        self.send_header("Content-Length", "1048576" if ok else "0")
+        self.end_headers()
+
+    do_GET = do_HEAD
+
+
+class CanonicalRequestTests(unittest.TestCase):
+    def test_safe_url_matches_canonical_key(self):
+        for a, b in (("http://h/a%20b.jpg", "http://h/a b.jpg"),
+                     ("http://H/%7euser/ğ.png", "http://h/~user/%C4%9F.png")):
+            self.assertEqual(canonical_url(a), canonical_url(b))
+            self.assertEqual(_safe_url(a), _safe_url(b))
+
+    def test_escaped_and_literal_space_probe_same_resource(self):
+        srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _OnlyEscapedSpace)
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        try:
+            base = f"http://127.0.0.1:{srv.server_address[1]}"
+            urls = [f"{base}/a%20b.jpg", f"{base}/a b.jpg"]
+            for dedup in (True, False):
+                recs = sorted(probe_urls(urls, dedup=dedup, dns_preresolve=False, max_attempts=1))
+                self.assertEqual([(r.index, r.result.status_text) for r in recs], [(0, "OK"), (1, "OK")])
+        finally:
+            srv.shutdown()
+            srv.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()